@@ -0,0 +1,288 @@
+"""
+Performance benchmarks for fifth.
+
+Times the hot paths of the library (plane indexing, flattening, neighborhood totals, ruleset
+application for each method and full ticks of every rule in examples/) across a range of sizes
+and dimensions. Timings can be saved as a JSON baseline and later runs compared against it,
+failing if any benchmark has slowed down by more than a given fraction.
+
+Usage (from the repository root):
+
+    python benchmarks/suite.py                                   # Print timings
+    python benchmarks/suite.py --save baseline.json              # Record a baseline
+    python benchmarks/suite.py --compare baseline.json -t 0.25   # Fail on >25% regressions
+
+@date: October 18, 2026
+"""
+import os, sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import re
+import ast
+import glob
+import json
+import random
+import timeit
+import argparse
+import platform
+
+import cam
+import plane
+import engine
+import numpy as np
+import ruleset as r
+import cam_parser
+import configuration as c
+
+
+# Shapes each group of benchmarks is run against. The per-cell ruleset methods are
+# far slower than the others, so they are given smaller planes.
+PLANE_SHAPES = [(64, 64), (256, 256), (16, 16, 16), (32, 32, 32)]
+TOTAL_SHAPES = [(64, 64), (256, 256), (16, 16, 16)]
+RULE_SHAPES  = [(32, 32), (64, 64), (8, 8, 8)]
+TICK_SIZES   = [64, 128]
+ENGINE_SIZES = [64, 256, 1024, (1080, 1920)]
+LINE_SIZE    = 1000000
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples')
+
+
+def _label(shape):
+    """
+    Shape as used in benchmark names, e.g. 64x64.
+    """
+    return 'x'.join(map(str, shape))
+
+
+def _plane(shape):
+    """
+    Construct a plane with reproducible random contents.
+    """
+    random.seed(0)
+    p = plane.Plane(shape)
+    p.randomize()
+    return p
+
+
+def _coordinates(shape, count=1000):
+    """
+    Reproducible list of random coordinates within a given shape.
+    """
+    rng = random.Random(0)
+    return [tuple(rng.randrange(d) for d in shape) for _ in range(count)]
+
+
+def plane_cases():
+    """
+    Indexing and (un)flattening of 1000 random coordinates.
+    """
+    for shape in PLANE_SHAPES:
+        p = _plane(shape)
+        coords = _coordinates(shape)
+        flat = [p.flatten(coor) for coor in coords]
+
+        def getitem(p=p, coords=coords):
+            for coor in coords:
+                p[coor]
+
+        def setitem(p=p, coords=coords):
+            for coor in coords:
+                p[coor] = 1
+
+        def flatten(p=p, coords=coords):
+            for coor in coords:
+                p.flatten(coor)
+
+        def unflatten(p=p, flat=flat):
+            for index in flat:
+                p.unflatten(index)
+
+        yield 'plane.getitem[{}]'.format(_label(shape)), getitem
+        yield 'plane.setitem[{}]'.format(_label(shape)), setitem
+        yield 'plane.flatten[{}]'.format(_label(shape)), flatten
+        yield 'plane.unflatten[{}]'.format(_label(shape)), unflatten
+
+        array = np.array(coords)
+        yield 'plane.gather[{}]'.format(_label(shape)), lambda p=p, a=array: p.gather(a)
+        yield 'plane.scatter[{}]'.format(_label(shape)), lambda p=p, a=array: p.scatter(a, 1)
+        yield 'plane.flatten_all[{}]'.format(_label(shape)), lambda p=p, a=array: p.flatten_all(a)
+        yield 'plane.unflatten_all[{}]'.format(_label(shape)), \
+            lambda p=p, f=np.array(flat): p.unflatten_all(f)
+
+
+def totals_cases():
+    """
+    Moore neighborhood totals of a random plane.
+    """
+    for shape in TOTAL_SHAPES:
+        p = _plane(shape)
+        offsets = list(c.Configuration.moore(p).keys())
+        yield 'neighborhood.get_totals[{}]'.format(_label(shape)), \
+            lambda p=p, offsets=offsets: c.Neighborhood.get_totals(p, offsets)
+
+
+def ruleset_cases():
+    """
+    Application of a single Moore configuration under every ruleset method, and of a block rule.
+    """
+    args = {
+        r.Ruleset.Method.MATCH: (),
+        r.Ruleset.Method.TOLERATE: (0.5,),
+        r.Ruleset.Method.SATISFY: (lambda plane, neighborhood, *args: neighborhood.total > 3,),
+        r.Ruleset.Method.ALWAYS_PASS: (),
+    }
+    for shape in RULE_SHAPES:
+        for method in r.Ruleset.Method:
+            if method not in args:
+                continue
+            p = _plane(shape)
+            rules = r.Ruleset(method)
+            offsets = c.Configuration.moore(p)
+            for coor in list(offsets)[::2]:
+                offsets[coor] = 0
+            rules.configurations.append(c.Configuration(1, plane=p, offsets=offsets))
+
+            name = 'ruleset.apply_to[{}][{}]'.format(method.name, _label(shape))
+            yield name, lambda p=p, rules=rules, a=args[method]: rules.apply_to(p, *a)
+
+    # Block rules are vectorized, so are measured on planes as large as the engines'
+    for size in ENGINE_SIZES:
+        p = _plane(size if isinstance(size, tuple) else (size, size))
+        rules = r.Ruleset(r.Ruleset.Method.MARGOLUS, engine.CRITTERS)
+        name = 'ruleset.apply_to[MARGOLUS][{}]'.format(_label(p.shape))
+        yield name, lambda p=p, rules=rules: rules.apply_to(p)
+
+
+def example_rules():
+    """
+    Pairs of (module name, notation) of every example, read from their docstrings.
+    """
+    for path in sorted(glob.glob(os.path.join(EXAMPLES, '*.py'))):
+        with open(path) as f:
+            doc = ast.get_docstring(ast.parse(f.read()))
+        if doc:
+            match = re.match(r'(\S+):', doc)
+            if match:
+                yield os.path.splitext(os.path.basename(path))[0], match.group(1)
+
+
+def _depth(notation):
+    """
+    Bits per cell needed by a rule (only Generations rules have more than 2 states).
+    """
+    parts = notation.split('/')
+    if len(parts) == 3:
+        return (int(parts[2].lstrip('C')) - 1).bit_length()
+    return 1
+
+
+def _ticks(sizes, engine):
+    """
+    CAM ticks of every example rule on random 2D CAMs, via their ruleset or engine.
+    """
+    for name, notation in example_rules():
+        for size in sizes:
+            random.seed(0)
+            cm = cam.CAM(1, size, 2, depth=_depth(notation))
+            shape = cm.master.shape
+            parser = cam_parser.CAMParser(notation, cm)
+            cm.randomize()
+            rules = parser.engine if engine else parser.ruleset
+            kind = 'engine' if engine else 'ruleset'
+            yield 'cam.tick[{}][{}][{}x{}]'.format(kind, name, *shape), \
+                lambda cm=cm, rules=rules: cm.tick(rules)
+
+
+def tick_cases():
+    """
+    Full CAM ticks of every example rule on a random 2D CAM.
+
+    Generations rules have no per-cell ruleset, so only their engine is timed. Elementary rules are
+    timed on a single long line.
+    """
+    for name, fn in _ticks(TICK_SIZES, False):
+        if '[ruleset][brians_brain]' not in name:
+            yield name, fn
+    for name, fn in _ticks(ENGINE_SIZES, True):
+        yield name, fn
+
+    for rule in (30, 110):
+        p = _plane((LINE_SIZE,))
+        rules = engine.Elementary(rule)
+        yield 'engine.elementary[{}][{}]'.format(rule, LINE_SIZE), lambda p=p, rules=rules: rules.apply_to(p)
+
+
+GROUPS = [plane_cases, totals_cases, ruleset_cases, tick_cases]
+
+
+def run(pattern=None, repeat=5, number=1):
+    """
+    Time every benchmark whose name matches the given regular expression.
+
+    The best of @repeat runs (each calling the benchmark @number times) is reported, in seconds
+    per call, since the minimum is the least affected by other processes on the machine.
+    """
+    results = {}
+    for group in GROUPS:
+        for name, fn in group():
+            if pattern and not re.search(pattern, name):
+                continue
+            best = min(timeit.Timer(fn).repeat(repeat, number)) / number
+            results[name] = best
+            print('{:<50} {:>12.6f} s'.format(name, best))
+            sys.stdout.flush()
+
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Returns the benchmarks slower than the baseline by more than @threshold (a fraction).
+    """
+    regressions = []
+    for name, seconds in sorted(results.items()):
+        before = baseline.get(name)
+        if before is not None and seconds > before * (1 + threshold):
+            regressions.append((name, before, seconds))
+
+    return regressions
+
+
+def main(argv=None):
+    """
+    Command line entry point. Returns the process exit status.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('-k', '--filter', help='Only run benchmarks matching this regular expression')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='Number of timing repetitions')
+    parser.add_argument('-s', '--save', help='Write the timings out as a JSON baseline')
+    parser.add_argument('-c', '--compare', help='JSON baseline to check for regressions against')
+    parser.add_argument('-t', '--threshold', type=float, default=0.2,
+                        help='Allowed slowdown relative to the baseline (0.2 means 20%%)')
+    options = parser.parse_args(argv)
+
+    results = run(options.filter, options.repeat)
+
+    if options.save:
+        with open(options.save, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'numpy': np.__version__,
+                'machine': platform.machine(),
+                'results': results,
+            }, f, indent=2, sort_keys=True)
+
+    if options.compare:
+        with open(options.compare) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, options.threshold)
+        for name, before, after in regressions:
+            print('REGRESSION {:<50} {:.6f} s -> {:.6f} s ({:+.0%})'.format(name, before, after, after / before - 1))
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
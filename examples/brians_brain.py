@@ -0,0 +1,19 @@
+"""
+B2/S/C3: Brian's Brain
+
+@author: jrpotter
+@date: October 18, 2026
+"""
+if __name__ == '__main__':
+
+    import os, sys
+    sys.path.append(os.path.abspath('src'))
+
+    import cam
+    import cam_parser
+
+    c = cam.CAM(1, 100, 2, depth=2)
+    p = cam_parser.CAMParser('B2/S/C3', c)
+
+    c.randomize()
+    c.start(cam.CAM.Show.WINDOW, clock=50, rules=p.ruleset)
@@ -0,0 +1,145 @@
+"""
+Asynchronous stepping of CAMs.
+
+Ticking a CAM is CPU bound, and would block an event loop for the entirety of the tick. Instead, the
+generators below hand each tick to a worker pool and yield generations to consumers as they become
+available. All CAMs stepped this way share the same pool by default, so several CAMs in one event loop
+progress concurrently without starving one another (or the loop).
+
+A generator only runs ahead of its consumer by a bounded number of generations, after which ticking
+pauses until the consumer catches up. Cancelling the consuming task (or closing the generator) stops
+ticking; any tick already handed to the pool is allowed to finish first, so the CAM is never left
+half updated.
+
+    async with contextlib.aclosing(asynchronous.generations(cam, rules)) as stream:
+        async for tick, bits in stream:
+            ...
+
+@date: October 18, 2026
+"""
+import os
+import asyncio
+import functools
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def executor():
+    """
+    The worker pool shared by all generators not given their own.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix='fifth')
+        return _executor
+
+
+def set_executor(pool):
+    """
+    Replace the shared worker pool (e.g. to bound the number of workers).
+    """
+    global _executor
+    with _executor_lock:
+        _executor = pool
+
+
+def _step(cam, rules, args, diffs):
+    """
+    Tick the CAM once, returning the tick and either a snapshot of the master plane or the
+    mask of cells changed by the tick.
+    """
+    cam.master.changed = None
+    cam.tick(rules, *args)
+    if diffs:
+        if cam.master.changed is None:
+            return cam.total, cam.master.bits & ~cam.master.bits
+        return cam.total, cam.master.changed
+    else:
+        return cam.total, cam.master.bits.copy()
+
+
+async def _run(pool, cam, rules, args, diffs):
+    """
+    Run a single tick in the pool.
+
+    The tick is shielded from cancellation; if the awaiting task is cancelled, we still wait for
+    the tick to complete before propagating the cancellation.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(pool, functools.partial(_step, cam, rules, args, diffs))
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        await asyncio.wait([future])
+        raise
+
+
+async def generations(cam, rules, *args, count=None, diffs=False, prefetch=0, pool=None):
+    """
+    Asynchronously iterate over the generations of a CAM.
+
+    Yields pairs of the CAM's tick count and a copy of the master plane's bits, beginning with the
+    current generation. If @diffs is set, each generation after the first is instead given as a
+    bitarray mask of the cells that changed since the previous one.
+
+    @count:    Number of generations to yield, or None to continue indefinitely.
+    @prefetch: Number of generations that may be computed ahead of the consumer. With 0, a tick
+               only begins once the consumer asks for the next generation.
+    @pool:     Executor to tick in, defaulting to the shared pool.
+
+    Note only one generator should be stepping a given CAM at a time.
+    """
+    pool = pool or executor()
+    remaining = count
+
+    if remaining is not None and remaining <= 0:
+        return
+    yield cam.total, cam.master.bits.copy()
+    if remaining is not None:
+        remaining -= 1
+
+    if prefetch <= 0:
+        while remaining is None or remaining > 0:
+            yield await _run(pool, cam, rules, args, diffs)
+            if remaining is not None:
+                remaining -= 1
+        return
+
+    # Compute ahead in a separate task, pausing whenever the queue is full
+    queue = asyncio.Queue(maxsize=prefetch)
+
+    async def produce():
+        n = remaining
+        while n is None or n > 0:
+            await queue.put(await _run(pool, cam, rules, args, diffs))
+            if n is not None:
+                n -= 1
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while remaining is None or remaining > 0:
+            if producer.done():
+                # Nothing more is coming; drain what was computed, then raise any error
+                if queue.empty():
+                    producer.result()
+                    return
+                item = queue.get_nowait()
+            else:
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait([getter, producer], return_when=asyncio.FIRST_COMPLETED)
+                if not getter.done():
+                    getter.cancel()
+                    continue
+                item = getter.result()
+            yield item
+            if remaining is not None:
+                remaining -= 1
+    finally:
+        producer.cancel()
+        await asyncio.wait([producer])
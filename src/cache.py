@@ -0,0 +1,122 @@
+"""
+Process wide caching of compiled rules.
+
+Sweeps construct thousands of CAMs that share a handful of rules between them. Anything derived
+from a rule alone (its canonical notation, neighborhood offsets, per-cell state function and the
+lookup tables of its engine) is compiled once and kept in a size bounded, least recently used
+cache shared by every parser in the process. Entries are treated as immutable once cached, so they
+may be shared freely between CAMs (and threads); anything holding per-plane state, such as an
+engine's working buffers, is still built per parser.
+
+    >>> cache.rules().stats()
+    {'hits': 998, 'misses': 2, 'evictions': 0, 'size': 2, 'maxsize': 128, 'ratio': 0.998}
+
+@date: October 18, 2026
+"""
+import threading
+
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    A thread safe mapping holding at most @maxsize entries, evicting the least recently used.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = max(maxsize, 1)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, factory):
+        """
+        Returns the entry of the given key, calling @factory to build it if absent.
+
+        The factory runs outside of the lock, so slow compilations do not block lookups of other
+        keys. Should two threads miss on the same key at once, both build it but only the first
+        entry stored is kept (and returned to both).
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = factory()
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self._entries[key] = value
+            self._evict()
+            return value
+
+    def _evict(self):
+        """
+        Drop least recently used entries beyond the maximum size (the lock must be held).
+        """
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def resize(self, maxsize):
+        """
+        Change the maximum number of entries, evicting any beyond it.
+        """
+        with self._lock:
+            self.maxsize = max(maxsize, 1)
+            self._evict()
+
+    def clear(self):
+        """
+        Remove every entry and reset statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        """
+        Hit and miss statistics since the cache was last cleared.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'ratio': self.hits / lookups if lookups else 0.0,
+            }
+
+
+_rules = LRUCache()
+
+
+def rules():
+    """
+    The cache of compiled rules shared by every parser.
+    """
+    return _rules
+
+
+def set_rules(cache):
+    """
+    Replace the shared cache of compiled rules (e.g. by one of a different size).
+    """
+    global _rules
+    _rules = cache
@@ -6,14 +6,18 @@ This is the top-level module that should be used by anyone wanting to work with
 all methods needed (i.e. supported) to interact/configure with the cellular automata directly.
 
 Displays can happen via matplotlib's animation library or the ncurses lib. Note both will support
-tracing/echoing/multi-dimensional displays
+tracing/echoing/multi-dimensional displays. Neither is imported until the CAM is first started with
+the corresponding display, so headless use only loads the simulation core.
 
 @date: June 01, 2015
 """
 import enum
 
+import delta
 import plane
+import lightcone
 import display
+import scheduler
 
 class CAM:
     """
@@ -36,22 +40,35 @@ class CAM:
         CONSOLE = 1
         WINDOW  = 2
 
-    def __init__(self, cps=1, states=100, dimen=2):
+    def __init__(self, cps=1, states=100, dimen=2, depth=1, boundary=plane.Plane.Boundary.TOROIDAL):
         """
         @cps:    Cell planes. By default this is 1, but can be any positive number. Any non-positive number
                  is assumed to be 1.
         @states: The number of cells that should be included in any dimension. The number of total states
-                 will be cps * states^dimen
+                 will be cps * states^dimen. Alternatively, a tuple giving the number of cells along each
+                 dimension (e.g. (1080, 1920)), in which case @dimen is ignored.
         @dimen:  The dimensions of the cellular automata. For example, for an N-tuple array, the dimension is N.
+        @depth:  The number of bits per cell. With more than 1, each plane is a MultiPlane whose cells
+                 can be in any of 2^depth states.
+        @boundary: A plane.Plane.Boundary (or one per dimension) given to every plane.
         """
         pl_cnt = max(cps, 1)
-        grid_dimen = (states,) * dimen
+        if isinstance(states, tuple):
+            grid_dimen = states
+        else:
+            grid_dimen = (states,) * dimen
 
-        self.planes = [plane.Plane(grid_dimen) for _ in range(pl_cnt)]
+        if depth > 1:
+            self.planes = [plane.MultiPlane(grid_dimen, depth, boundary=boundary) for _ in range(pl_cnt)]
+        else:
+            self.planes = [plane.Plane(grid_dimen, boundary=boundary) for _ in range(pl_cnt)]
         self.master = self.planes[0]
         self.ticks = [(0, 1)]
         self.total = 0
 
+        # Optional instrument.Instrument recording each tick (see Instrument.attach)
+        self.instrument = None
+
     def tick(self, rules, *args):
         """
         Modify all states in a given CAM "simultaneously".
@@ -62,11 +79,44 @@ class CAM:
         may also change secondary cell planes (the master, by default, is always updated on each tick).
         """
         self.total += 1
+        if self.instrument is not None:
+            self.instrument.begin(self.total)
+
         for i, j in self.ticks:
             if self.total % j == 0:
                 self.planes[i].dirty = True
                 rules.apply_to(self.planes[i], *args)
 
+        if self.instrument is not None:
+            self.instrument.end(self.master)
+
+    def deltas(self, rules, *args, count=None):
+        """
+        Tick the CAM, yielding pairs of the tick count and a delta.Delta of the master plane per tick.
+
+        Deltas are taken from the mask computed by whichever engine updated the master, so nothing
+        is copied beyond the cells that changed. If the master was not updated on a tick (see
+        ticks), its delta is empty.
+
+        @count: Number of ticks, or None to continue indefinitely.
+        """
+        n = 0
+        while count is None or n < count:
+            self.master.changed = None
+            self.tick(rules, *args)
+            if self.master.changed is None:
+                yield self.total, delta.Delta.between(self.master.bits, self.master.bits, self.total)
+            else:
+                yield self.total, delta.Delta.of(self.master.changed, self.total)
+            n += 1
+
+    def future(self, rules, region, k, *args):
+        """
+        Returns the cells of a region of the master plane @k ticks from now, without ticking the
+        CAM. Only the region's backward light cone is advanced (see lightcone.future).
+        """
+        return lightcone.future(self.master, rules, region, k, *args)
+
     def randomize(self):
         """
         Convenience function to randomize individual planes.
@@ -78,12 +128,28 @@ class CAM:
     def start(self, show, **kwargs):
         """
         Delegate how to initiate running the CAM.
+
+        Any other display registered via display.register may be passed as @show as well.
+
+        Note when not displayed, the CAM runs indefinitely, one tick every @clock milliseconds if
+        given (and as fast as possible otherwise). If @extinction is given and true, the run instead
+        stops once the master plane no longer has any live cells, and the scheduler's report of
+        achieved against target tick rates is returned.
         """
         if show == CAM.Show.NONE:
-            while True:
-                self.tick(**kwargs)
-        elif show == CAM.Show.CONSOLE:
-            display.ConsoleDisplay(self, **kwargs).run()
-        elif show == CAM.Show.WINDOW:
-            display.WindowDisplay(self, **kwargs).run()
+            schedule = scheduler.Scheduler.from_clock(kwargs.get('clock', 0))
+            extinction = kwargs.get('extinction', False)
+            while not (extinction and self.master.population == 0):
+                for _ in range(schedule.wait()):
+                    self.tick(kwargs['rules'], *kwargs.get('args', ()))
+                    if extinction and self.master.population == 0:
+                        break
+            return schedule.report()
+        else:
+            display.backend(show)(self, **kwargs).run()
+
+
+# Backends are imported lazily, the first time they are started
+display.register(CAM.Show.CONSOLE, 'console:ConsoleDisplay')
+display.register(CAM.Show.WINDOW, 'window:WindowDisplay')
 
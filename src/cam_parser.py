@@ -1,4 +1,8 @@
 import re
+import enum
+import types
+import cache
+import engine as e
 import ruleset as r
 import configuration as c
 
@@ -16,47 +20,118 @@ class CAMParser:
     Following notation is supported:
     * MCell Notation (x/y)
     * RLE Format (By/Sx)
+    * Generations, in either MCell (x/y/n) or RLE (By/Sx/Cn) Format
+    * Wolfram's elementary 1D rules (Wn, e.g. W30 or W110)
 
     For reference: http://en.wikipedia.org/wiki/Life-like_cellular_automaton
+
+    Every rule is compiled into a vectorized engine (see the engine module) as well. Generations
+    rules have more than two states, and so can only be run by their engine on a CAM whose depth
+    (bits per cell) can hold every state; their ruleset is the engine itself. The same goes for
+    elementary rules, which only apply to 1D CAMs.
     """
 
-    RLE_FORMAT = r'B\d*/S\d*$'
-    MCELL_FORMAT = r'\d*/\d*$'
+    RLE_FORMAT = re.compile(r'B\d*/S\d*$')
+    MCELL_FORMAT = re.compile(r'\d*/\d*$')
+    RLE_GENERATIONS_FORMAT = re.compile(r'B\d*/S\d*/C\d+$')
+    MCELL_GENERATIONS_FORMAT = re.compile(r'\d*/\d*/\d+$')
+    WOLFRAM_FORMAT = re.compile(r'W\d+$')
 
     def __init__(self, notation, cam):
         """
         Parses the passed notation and saves values into members.
 
+        Everything derived from the rule alone is compiled once per process, and shared by every
+        parser of the same rule on CAMs of the same dimension (see cache.rules).
+
         @sfunc: Represents the function that returns the next given state.
         @ruleset: A created ruleset that matches always
-        @offsets: Represents the Moore neighborhood corresponding to the given CAM
+        @engine: The equivalent vectorized engine
+        @offsets: Represents the Moore neighborhood corresponding to the given CAM (a copy of the
+                  shared one, so it may be changed freely)
+        @compiled: The shared Compiled rule
         """
-        self.sfunc = None
-        self.offsets = c.Configuration.moore(cam.master)
+        canonical = self._canonical(notation)
+        key = (canonical, cam.master.N, 'moore')
+        self.compiled = cache.rules().get(key, lambda: Compiled(canonical, cam.master.N))
+
+        self.sfunc = self.compiled.sfunc
+        self.offsets = dict(self.compiled.offsets)
         self.ruleset = r.Ruleset(r.Ruleset.Method.ALWAYS_PASS)
 
-        if re.match(CAMParser.MCELL_FORMAT, notation):
+        if self.compiled.kind == Compiled.Kind.ELEMENTARY:
+            if cam.master.N != 1:
+                raise ValueError("Elementary rules require a 1D CAM")
+            self.engine = e.Elementary(self.compiled.table)
+            self.ruleset = self.engine
+            return
+
+        self.engine = e.Totalistic(self.compiled.birth, self.compiled.survive, self.compiled.states,
+                                   offsets=self.offsets, tables=self.compiled.tables)
+
+        if self.compiled.kind == Compiled.Kind.GENERATIONS:
+            if (self.compiled.states - 1).bit_length() > getattr(cam.master, 'depth', 1):
+                raise ValueError("CAM depth cannot hold {} states".format(self.compiled.states))
+            self.ruleset = self.engine
+            return
+
+        # Add configuration to given CAM
+        config = c.Configuration(self.sfunc, plane=cam.master, offsets=self.offsets)
+        self.ruleset.configurations.append(config)
+
+    @classmethod
+    def _canonical(cls, notation):
+        """
+        Validate a notation, returning the canonical (RLE) notation of the rule.
+
+        For example, both 23/3 and B3/S23 are canonically B3/S23.
+        """
+        if cls.WOLFRAM_FORMAT.match(notation):
+            return notation
+
+        elif cls.MCELL_GENERATIONS_FORMAT.match(notation):
+            x, y, n = notation.split('/')
+            return cls._generations(x, y, n)
+
+        elif cls.RLE_GENERATIONS_FORMAT.match(notation):
+            B, S, C = map(lambda x: x[1:], notation.split('/'))
+            return cls._generations(S, B, C)
+
+        elif cls.MCELL_FORMAT.match(notation):
             x, y = notation.split('/')
-            if all(map(self._numasc, [x, y])):
-                self.sfunc = self._mcell(x, y)
+            if all(map(cls._numasc, [x, y])):
+                return 'B{}/S{}'.format(y, x)
             else:
                 raise ValueError("Non-ascending values in MCELL format")
 
-        elif re.match(CAMParser.RLE_FORMAT, notation):
+        elif cls.RLE_FORMAT.match(notation):
             B, S = map(lambda x: x[1:], notation.split('/'))
-            if all(map(self._numasc, [B, S])):
-                self.sfunc = self._mcell(S, B)
+            if all(map(cls._numasc, [B, S])):
+                return 'B{}/S{}'.format(B, S)
             else:
                 raise ValueError("Non-ascending values in RLE format")
 
         else:
             raise ValueError("No supported format passed to parser.")
 
-        # Add configuration to given CAM
-        config = c.Configuration(self.sfunc, plane=cam.master, offsets=self.offsets)
-        self.ruleset.configurations.append(config)
+    @classmethod
+    def _generations(cls, x, y, n):
+        """
+        Generations Notation
 
-    def _numasc(self, value):
+        As MCell Notation, with survival digits x and birth digits y, and n the total number of states.
+        Cells which do not survive decay through the states beyond the first two before dying.
+        For instance, Brian's Brain is denoted /2/3
+        """
+        if not all(map(cls._numasc, [x, y])):
+            raise ValueError("Non-ascending values in Generations format")
+        if int(n) < 2:
+            raise ValueError("Generations require at least 2 states")
+
+        return 'B{}/S{}/C{}'.format(y, x, int(n))
+
+    @staticmethod
+    def _numasc(value):
         """
         Check the given value is a string of ascending numbers.
         """
@@ -65,22 +140,65 @@ class CAMParser:
         else:
             return False
 
-    def _mcell(self, x, y):
+    @staticmethod
+    def _lookup(birth, survive):
         """
-        MCell Notation
-
-        A rule is written as a string x/y where each of x and y is a sequence of distinct digits from 0 to 8, in
-        numerical order. The presence of a digit d in the x string means that a live cell with d live neighbors
-        survives into the next generation of the pattern, and the presence of d in the y string means that a dead
-        cell with d live neighbors becomes alive in the next generation. For instance, in this notation,
-        Conway's Game of Life is denoted 23/3
+        State function of a life-like rule, given the birth and survival totals as bitmasks (the
+        dth bit of each set if a total of d gives birth, or allows survival, respectively).
         """
-        x, y = list(map(int, x)), list(map(int, y))
         def next_state(plane, neighborhood, *args):
-            if plane.bits[neighborhood.flat_index]:
-                return int(neighborhood.total in x)
-            else:
-                return int(neighborhood.total in y)
+            mask = survive if plane.bits[neighborhood.flat_index] else birth
+            return (mask >> neighborhood.total) & 1
 
         return next_state
 
+
+class Compiled:
+    """
+    A rule compiled for CAMs of a given dimension.
+
+    Holds everything derived from the rule alone: the birth and survival totals (also as the
+    bitmasks the per-cell state function looks totals up in), the Moore offsets of the dimension,
+    the state function itself and the lookup tables of its engine. Instances are shared between
+    parsers (and threads), so must not be modified; the offsets are held read only.
+    """
+    class Kind(enum.Enum):
+        """
+        Family of the rule.
+        """
+        LIFE        = 0
+        GENERATIONS = 1
+        ELEMENTARY  = 2
+
+    def __init__(self, notation, dimen):
+        """
+        @notation: Canonical notation of the rule (see CAMParser._canonical).
+        @dimen:    Dimension of the CAMs the rule is compiled for.
+        """
+        self.notation = notation
+        self.dimen = dimen
+        self.offsets = types.MappingProxyType({offset: 1 for offset in e.moore(dimen)})
+        self.sfunc = None
+        self.table = None
+        self.tables = {}
+
+        if notation.startswith('W'):
+            self.kind = Compiled.Kind.ELEMENTARY
+            self.table = e.Elementary(int(notation[1:])).table
+            return
+
+        parts = [part[1:] for part in notation.split('/')]
+        self.kind = Compiled.Kind.GENERATIONS if len(parts) == 3 else Compiled.Kind.LIFE
+        self.birth = tuple(map(int, parts[0]))
+        self.survive = tuple(map(int, parts[1]))
+        self.states = int(parts[2]) if len(parts) == 3 else 2
+        self.masks = (sum(1 << b for b in self.birth), sum(1 << s for s in self.survive))
+
+        if self.kind == Compiled.Kind.LIFE:
+            self.sfunc = CAMParser._lookup(*self.masks)
+
+        count = len(self.offsets)
+        tables = e.Totalistic(self.birth, self.survive, self.states)._tables(count)
+        for table in tables:
+            table.setflags(write=False)
+        self.tables[count] = tables
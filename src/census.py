@@ -0,0 +1,240 @@
+"""
+Census of the objects of a plane.
+
+Objects are the connected components of live cells, where cells are connected if one lies at an
+offset of the other's neighborhood (e.g. Configuration.moore or Configuration.neumann). Components
+are found without visiting cells from Python:
+
+* The plane is broken into runs of consecutive live cells along each row, each run given a label.
+* For every offset of the neighborhood, the labels are shifted by that offset and compared against
+  the originals, giving the pairs of runs touching one another.
+* Runs are then joined by a vectorized union-find: every pair hooks the larger of its two roots
+  onto the smaller, and paths are compressed by pointer jumping, until no pair spans two roots.
+
+Every component is described by its cells and bounding box, along with a canonical hash of its
+shape. The hash is the same for every rotation, reflection and translation of an object, so tallying
+hashes across many soups counts how often each kind of object (still life, oscillator phase,
+spaceship phase) occurs.
+
+@date: October 18, 2026
+"""
+import hashlib
+import itertools
+import numpy as np
+
+from collections import Counter
+
+import plane as pl
+import engine as e
+import configuration as c
+
+
+class Component:
+    """
+    A connected object of a plane.
+
+    @cells: Array of shape (k, N) of the coordinates of its cells, in row major order. Along
+            toroidal axes, objects straddling the edge of the plane are unwrapped, so coordinates
+            may extend beyond the plane (e.g. rows 98 through 101 of a plane of 100 rows).
+    """
+
+    def __init__(self, cells):
+        self.cells = cells
+        self._hash = None
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __repr__(self):
+        return 'Component(size={}, bounding_box={}, hash={})'.format(len(self), self.bounding_box, self.hash)
+
+    @property
+    def bounding_box(self):
+        """
+        Smallest box containing every cell, as a tuple of (first, last) coordinates per axis.
+        """
+        return tuple((int(lo), int(hi)) for lo, hi in zip(self.cells.min(axis=0), self.cells.max(axis=0)))
+
+    @property
+    def hash(self):
+        """
+        Hash of the shape of the component, invariant under rotations, reflections and translations.
+        """
+        if self._hash is None:
+            self._hash = canonical(self.cells)
+        return self._hash
+
+
+def symmetries(n):
+    """
+    Yields every rotation and reflection of N dimensional space, as pairs of an axis permutation
+    and the axes to mirror.
+    """
+    for permutation in itertools.permutations(range(n)):
+        for mirror in itertools.product((False, True), repeat=n):
+            yield permutation, mirror
+
+
+def canonical(cells):
+    """
+    Canonical hash of the shape of a set of cells.
+
+    Every symmetry of the cells is translated to the origin and sorted, and the smallest encoding
+    among them is hashed.
+    """
+    cells = np.asarray(cells, dtype=np.int64)
+    cells = cells - cells.min(axis=0)
+    extents = cells.max(axis=0)
+    best = None
+    for permutation, mirror in symmetries(cells.shape[1]):
+        # Each variant is encoded as its extents and the sorted row major indices of its cells
+        variant = np.where(mirror, extents - cells, cells)[:, permutation]
+        dimensions = extents[list(permutation)]
+        indices = np.sort(np.ravel_multi_index(variant.T, dimensions + 1))
+        encoding = dimensions.tobytes() + indices.tobytes()
+        if best is None or encoding < best:
+            best = encoding
+
+    return hashlib.blake2b(best, digest_size=8).hexdigest()
+
+
+def _offsets(plane, offsets):
+    """
+    The offsets to connect cells by, keeping only one of each pair of opposite offsets.
+    """
+    if offsets is None:
+        offsets = c.Configuration.moore(plane)
+    offsets = set(tuple(o) for o in offsets)
+    return sorted(o for o in offsets if any(o) and (tuple(-x for x in o) not in offsets or o > tuple(-x for x in o)))
+
+
+def _shift(labels, offset, boundaries):
+    """
+    Labels of the cells at the given offset of every cell (-1 beyond non-toroidal edges).
+    """
+    shifted = np.roll(labels, tuple(-o for o in offset), axis=tuple(range(labels.ndim)))
+    for axis, (o, mode) in enumerate(zip(offset, boundaries)):
+        if o != 0 and mode != pl.Plane.Boundary.TOROIDAL:
+            edge = [slice(None)] * labels.ndim
+            edge[axis] = slice(-o, None) if o > 0 else slice(None, -o)
+            shifted[tuple(edge)] = -1
+    return shifted
+
+
+def _union(count, a, b):
+    """
+    Roots of @count elements once every pair (a[i], b[i]) is joined. Each root is the smallest
+    element of its set.
+    """
+    parent = np.arange(count, dtype=np.int64)
+    while True:
+        pa, pb = parent[a], parent[b]
+        spanning = pa != pb
+        if not spanning.any():
+            return parent
+        lo = np.minimum(pa[spanning], pb[spanning])
+        hi = np.maximum(pa[spanning], pb[spanning])
+        np.minimum.at(parent, hi, lo)
+
+        # Pointer jumping, until every element points directly at its root
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+
+
+def _unwrap(cells, shape, boundaries):
+    """
+    Shift coordinates of a component along toroidal axes so it does not straddle the edge.
+
+    The largest gap between occupied coordinates along such an axis is taken to lie outside of the
+    object, and coordinates before it are moved past the end of the axis.
+    """
+    for axis, (n, mode) in enumerate(zip(shape, boundaries)):
+        if mode != pl.Plane.Boundary.TOROIDAL:
+            continue
+        occupied = np.unique(cells[:, axis])
+        if len(occupied) == n or occupied[0] != 0 or occupied[-1] != n - 1:
+            continue
+        gaps = np.diff(occupied)
+        start = occupied[np.argmax(gaps) + 1]
+        cells[:, axis] = np.where(cells[:, axis] < start, cells[:, axis] + n, cells[:, axis])
+    return cells
+
+
+def components(plane, offsets=None):
+    """
+    Returns the connected components of live cells of a plane, ordered by their first cell.
+
+    @offsets: Neighborhood connecting cells, as a dict (e.g. Configuration.neumann(plane)) or list
+              of offsets. Defaults to the Moore neighborhood.
+
+    Cells of a MultiPlane are live if they are in any nonzero state. Components connect across the
+    edges of toroidal axes only.
+    """
+    if plane.N == 0:
+        return []
+    cells = e.unpack(plane._occupied(plane.bits), plane.shape)
+
+    # Label runs of live cells along each row
+    starts = cells.copy()
+    starts[..., 1:] &= 1 - cells[..., :-1]
+    labels = np.cumsum(starts, dtype=np.int64).reshape(cells.shape) - 1
+    labels[cells == 0] = -1
+    runs = int(starts.sum())
+    if runs == 0:
+        return []
+
+    # Pairs of touching runs
+    firsts, seconds = [], []
+    for offset in _offsets(plane, offsets):
+        shifted = _shift(labels, offset, plane.boundaries)
+        touching = (labels >= 0) & (shifted >= 0) & (labels != shifted)
+        firsts.append(labels[touching])
+        seconds.append(shifted[touching])
+
+    if firsts:
+        roots = _union(runs, np.concatenate(firsts), np.concatenate(seconds))
+    else:
+        roots = np.arange(runs, dtype=np.int64)
+
+    # Group the coordinates of live cells by component
+    coordinates = np.argwhere(cells)
+    members = roots[labels[cells != 0]]
+    order = np.argsort(members, kind='stable')
+    members, coordinates = members[order], coordinates[order]
+    bounds = np.flatnonzero(np.diff(members)) + 1
+
+    groups = np.split(coordinates, bounds)
+
+    # Only components touching both edges of a toroidal axis can straddle it
+    firsts = np.concatenate([[0], bounds])
+    lows = np.minimum.reduceat(coordinates, firsts, axis=0)
+    highs = np.maximum.reduceat(coordinates, firsts, axis=0)
+    toroidal = np.array([mode == pl.Plane.Boundary.TOROIDAL for mode in plane.boundaries])
+    straddling = ((lows == 0) & (highs == np.array(plane.shape) - 1) & toroidal).any(axis=1)
+    for i in np.flatnonzero(straddling):
+        groups[i] = _unwrap(groups[i], plane.shape, plane.boundaries)
+
+    return [Component(group) for group in groups]
+
+
+def census(plane, offsets=None):
+    """
+    Tally of the canonical hashes of every component of a plane.
+
+    Counters of several planes can be summed, e.g. sum(map(census, planes), Counter()).
+    Components of identical shape and orientation (as most are, in settled soups) are only
+    hashed once.
+    """
+    tally = Counter()
+    hashes = {}
+    for component in components(plane, offsets):
+        cells = component.cells - component.cells.min(axis=0)
+        key = cells.max(axis=0).tobytes() + cells.tobytes()
+        if key not in hashes:
+            hashes[key] = component.hash
+        tally[hashes[key]] += 1
+
+    return tally
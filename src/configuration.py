@@ -1,10 +1,85 @@
 import numpy as np
+import cache
+import plane as pl
+import engine as e
 
 from bitarray import bitarray
 from itertools import product
 from collections import namedtuple
 
 
+class Stencil:
+    """
+    Flat index tables of a neighborhood, on planes of a given shape and boundaries.
+
+    Offsets are flattened once, so the neighbors of any cell whose neighborhood lies entirely within
+    the plane (the interior) are simply its flattened index plus each flat offset. Only cells near
+    the edges need their neighbors resolved against the boundary of each axis, which is done with
+    a small lookup table per axis rather than by wrapping coordinates one at a time.
+    """
+
+    def __init__(self, plane, offsets):
+        self.offsets = [tuple(o) for o in offsets]
+        self.shape = plane.shape
+        self.boundaries = plane.boundaries
+        self.strides = tuple(plane.offsets)
+        self.flat = [sum(o * s for o, s in zip(offset, self.strides)) for offset in self.offsets]
+
+        # How far neighborhoods reach below and above a cell along each axis
+        below = [max([-o[i] for o in self.offsets if len(o) > i] + [0]) for i in range(plane.N)]
+        above = [max([o[i] for o in self.offsets if len(o) > i] + [0]) for i in range(plane.N)]
+
+        inside = np.zeros(plane.padded, dtype=np.uint8)
+        inside[tuple(slice(lo, max(n - hi, lo)) for n, lo, hi in zip(plane.shape, below, above))] = 1
+        self.interior = e.pack(inside)
+
+        # Per axis, the coordinate seen at each position from -below to n + above; constant
+        # boundaries are given as -1 (zero) and -2 (one)
+        self.below = below
+        self.axes = []
+        for n, lo, hi, mode in zip(plane.shape, below, above, plane.boundaries):
+            positions = np.arange(-lo, n + hi)
+            if mode == pl.Plane.Boundary.TOROIDAL:
+                seen = positions % n
+            elif mode == pl.Plane.Boundary.REFLECT:
+                seen = positions % (2 * n)
+                seen = np.where(seen >= n, 2 * n - 1 - seen, seen)
+            else:
+                outside = -1 if mode == pl.Plane.Boundary.ZERO else -2
+                seen = np.where((positions >= 0) & (positions < n), positions, outside)
+            self.axes.append(seen.tolist())
+
+    def matches(self, plane, offsets):
+        """
+        Whether the stencil applies to the given plane and offsets.
+        """
+        return (plane.shape == self.shape and plane.boundaries == self.boundaries
+                and len(offsets) == len(self.offsets) and [tuple(o) for o in offsets] == self.offsets)
+
+    def read(self, bits, flat_index, coordinates):
+        """
+        The neighbors of the cell at the given flattened index, as a bitarray.
+
+        @coordinates: Function returning the coordinates of the cell, only called for cells near an edge.
+        """
+        if self.interior[flat_index]:
+            return bits[[flat_index + f for f in self.flat]]
+
+        center = coordinates(flat_index)
+        neighbors = bitarray(endian=pl._endian(bits))
+        for offset in self.offsets:
+            index, fixed = 0, None
+            for c, o, lo, axis, stride in zip(center, offset, self.below, self.axes, self.strides):
+                seen = axis[c + o + lo]
+                if seen < 0:
+                    # The last constant boundary crossed wins (see Plane.Boundary)
+                    fixed = ~seen
+                else:
+                    index += seen * stride
+            neighbors.append(bits[index] if fixed is None else fixed)
+        return neighbors
+
+
 class Neighborhood:
     """
     A neighborhood is a collection of cells around a given cell.
@@ -19,7 +94,16 @@ class Neighborhood:
     Offsets must be added separate from instantiation, since it isn't always necessary to
     perform this computation in the first place (for example, if an ALWAYS_PASS flag is passed
     as opposed to a MATCH flag).
+
+    Rulesets visit every cell with a single neighborhood, moved from cell to cell (see move),
+    so no object is allocated per cell. Neighbors are only read once first asked for, from the
+    Stencil of the plane and offsets populated with.
     """
+    __slots__ = ('flat_index', 'total', '_neighbors', '_bits', '_plane', '_stencil', '_source')
+
+    # Stencils shared by all neighborhoods, keyed by plane geometry and offsets
+    _stencils = cache.LRUCache(32)
+
     def __init__(self, flat_index):
         """
         Initializes the center cell.
@@ -27,32 +111,70 @@ class Neighborhood:
         Offsetted cells belonging in the given neighborhood must be added separately.
         """
         self.total = 0
-        self.neighbors = bitarray()
         self.flat_index = flat_index
+        self._neighbors = None
+        self._bits = None
+        self._plane = None
+        self._stencil = None
+        self._source = None
+
+    def move(self, flat_index, total=0):
+        """
+        Recenter the neighborhood on another cell, as if newly constructed there.
+        """
+        self.flat_index = flat_index
+        self.total = total
+        self._neighbors = None
+        self._bits = None
+
+    @property
+    def neighbors(self):
+        """
+        The states of the cells of the neighborhood, in order of the offsets populated with.
+        """
+        if self._neighbors is None:
+            if self._bits is None:
+                self._neighbors = bitarray()
+            else:
+                self._neighbors = self._stencil.read(self._bits, self.flat_index, self._plane.unflatten)
+        return self._neighbors
+
+    @neighbors.setter
+    def neighbors(self, value):
+        self._neighbors = value
+
+    @classmethod
+    def stencil(cls, plane, offsets):
+        """
+        The Stencil of the given plane and offsets.
+        """
+        key = (plane.shape, plane.padded, plane.boundaries, tuple(tuple(o) for o in offsets))
+        return cls._stencils.get(key, lambda: Stencil(plane, offsets))
 
     def populate(self, plane, offsets):
         """
         Given the plane and offsets, determines the cells in the given neighborhood.
 
-        Note this is a relatively expensive operation, especially if called on every cell
-        in a CAM every tick. Instead, consider using the provided class methods which
-        shift through the bitarray instead of recomputing offsets
+        Consecutive calls with the same offsets (as when a ruleset moves a neighborhood across a
+        plane) reuse the same stencil, so populating a cell costs only a few comparisons. Note the
+        neighbors are not copied: they are read from the bits of the plane when first asked for,
+        so writes to the plane made after populating (which change its bits in place) are seen.
         """
-        self.neighbors = bitarray()
-        for offset in offsets:
-            index = plane.flatten(offset) + self.flat_index
-            self.neighbors.append(plane.bits[index % len(plane.bits)])
-
-        self.total = len(self.neighbors)
+        if offsets is not self._source or not self._stencil.matches(plane, offsets):
+            self._stencil = Neighborhood.stencil(plane, offsets)
+            self._source = offsets
+        self._plane = plane
+        self._bits = plane.bits
+        self._neighbors = None
+        self.total = len(offsets)
 
     @classmethod
     def get_neighborhoods(cls, plane, offsets):
         """
         Given the list of offsets, return a list of neighborhoods corresponding to every cell.
 
-        Since offsets should generally stay fixed for each cell in a plane, we first flatten
-        the coordinates (@offsets should be a list of tuples) relative to the first component
-        and cycle through all cells.
+        Since offsets should generally stay fixed for each cell in a plane, the offsets (@offsets
+        should be a list of tuples) are flattened once into a Stencil shared by every neighborhood.
 
         NOTE: If all you need are the total number of cells in each neighborhood, call the
         get_totals method instead, which is significantly faster.
@@ -60,13 +182,9 @@ class Neighborhood:
         neighborhoods = []
 
         if plane.N > 0:
-            f_offsets = list(map(plane.flatten, offsets))
-            for i in range(len(plane.bits)):
-                neighborhood = Neighborhood(plane.unflatten(i))
-                for j in range(len(f_offsets)):
-                    neighborhood.neighbors.append(plane.bits[j])
-                    plane.bits[j] += 1
-                neighborhood.total = len(neighborhood.neighbors)
+            for i in plane.indices().tolist():
+                neighborhood = Neighborhood(i)
+                neighborhood.populate(plane, offsets)
                 neighborhoods.append(neighborhood)
 
         return neighborhoods
@@ -77,61 +195,37 @@ class Neighborhood:
         Returns the total number of neighbors for each cell in a plane.
 
         After profiling with a previous version, I found that going through each index and totaling the number
-        of active states was taking much longer than I liked. Instead, we compute as many neighborhoods as possible
-        simultaneously, avoiding explicit summation via the "sum" function, at least for each state separately.
-
-        Because the states are now represented as binary values, we instead add the binary representations together.
-        And since offsets are generally consistent between each invocation of the "tick" function, we can add a row
-        at a time. For example, given a plane P of shape (3, 3) and the following setup:
-
-        [[0, 1, 1, 0, 1]
-        ,[1, 0, 0, 1, 1]    ALIGN    11010    SUM
-        ,[0, 1, 1, 0, 0]  =========> 11000 =========> 32111
-        ,[1, 0, 0, 1, 0]             10101
-        ,[0, 0, 0, 0, 1]
-        ]
-
-        with focus cell (1, 1) in the middle and offsets (-1, 0), (1, 0), (-1, 1), we can align the cells according to the above.
-        The resulting sum states there are 3 neighbors at (1, 1), 2 neighbors at (1, 2), and 1 neighbor at (1, 3), (1, 4), and (1, 0).
-
-        We do this in chunks of 9, depending on the number of offsets, so no overflowing of a single column can occur.
-        We can then find the total of the ith neighborhood by checking the sum of the ith index of the summation of every
-        9 chunks of numbers (this is done at the Nth-1 dimension).
-        """
-        n_counts = []
-
-        # In the first dimension, we have to simply loop through and count for each bit
-        if 0 < plane.N <= 1:
-            for i in range(len(plane.bits)):
-                n_counts.append(sum([plane.bits[i+j] for j in offsets]))
-        else:
-            for level in range(plane.shape[0]):
-
-                # Since working in N dimensional space, we calculate the totals at a
-                # rate of N-1. We do this by generalizing the above doc description, and
-                # limit our focus to the offsetted subplane adjacent to the current level,
-                # then slicing the returned set of bits accordingly
-                neighboring = []
-                for offset in offsets:
-                    adj_level = level + offset[0]
-                    sub_plane = plane[adj_level]
-                    sub_index = sub_plane.flatten(offset[1:])
-                    sequence = sub_plane.bits[sub_index:] + sub_plane.bits[:sub_index]
-                    neighboring.append(int(sequence.to01()))
-
-                # Collect our totals, breaking up each set of neighborhood totals into 9
-                # and then adding the resulting collection back up (note once chunks have
-                # been added, we add each digit separately (the total reduced by factor of 9))
-                totals = [0] * (plane.offsets[0])
-                chunks = map(sum, [neighboring[i:i+9] for i in range(0, len(neighboring), 9)])
-                for chunk in chunks:
-                    padded_chunk = map(int, str(chunk).zfill(len(totals)))
-                    totals = map(sum, zip(totals, padded_chunk))
-
-                # Neighboring totals now align with original grid
-                n_counts += list(totals)
-
-        return n_counts
+        of active states was taking much longer than I liked. Instead, we compute all neighborhoods simultaneously,
+        avoiding explicit summation for each state separately.
+
+        The plane is copied into a working array surrounded by a halo, a border as wide as the furthest offset,
+        filled in according to the boundary of each axis (see engine.Halo). For example, given a toroidal plane P
+        of shape (3, 3) and offsets (-1, 0), (1, 0), (0, 1):
+
+                       [[0, 1, 1, 0, 0]
+        [[1, 0, 1]     ,[1, 1, 0, 1, 1]            [1, 0, 1]   [1, 1, 0]   [0, 1, 1]
+        ,[0, 1, 1] ==> ,[0, 0, 1, 1, 0] ==> SLICE  [1, 0, 1] + [0, 1, 1] + [1, 1, 1] ==> ...
+        ,[1, 1, 0]     ,[1, 1, 1, 0, 1]            [0, 1, 1]   [1, 0, 1]   [1, 0, 1]
+        ]              ,[0, 1, 0, 1, 0]
+                       ]
+
+        the neighbors of every cell at a given offset are then a slice of the working array, shifted from
+        the interior by that offset, and the totals are the sum of these slices. No index ever needs to
+        be wrapped, and offsets along one axis never spill over into another.
+
+        The returned list is indexed by flattened index, so it holds plane.length totals (those of the
+        padding at the end of each row are always 0).
+        """
+        if plane.N == 0:
+            return []
+
+        cells = e.unpack(plane.bits, plane.shape)
+        counts = e.totals(cells, [tuple(o) for o in offsets], plane.boundaries)
+
+        # Totals are indexed by flattened index, so the padding of each row is kept (as zeros)
+        padded = np.zeros(plane.padded, dtype=counts.dtype)
+        padded[..., :plane.shape[-1]] = counts
+        return padded.ravel().tolist()
 
 
 class Configuration:
@@ -0,0 +1,172 @@
+import sys
+import time
+import curses
+import itertools
+
+from display import _Display
+
+
+# Seconds between frames while paused (so keys remain responsive)
+PAUSED_FRAME = 1 / 30
+
+
+class ConsoleDisplay(_Display):
+    """
+    Displays CAM onto console via the curses library.
+
+    Note a couple concepts go hand in hand with displaying all the bits:
+
+    First, it is unlikely the entirety of a CAM can be displayed on the screen
+    at a time, so instead we emulate the use of a pad, allowing navigation
+    via the arrow keys.
+
+    Second, to provide support for color mapping and multiple planes, we use panels
+    which allow for exactly this overlaying we are trying to simulate.
+
+    Space pauses and resumes, the comma and period keys step back and forth a generation, and
+    Home and End seek to the oldest and newest generations held.
+    """
+
+    def __init__(self, cam, clock, rules, *args, history=None):
+        """
+        Here we initialize the curses library, and begin construction of the necessary overlays.
+        """
+        super().__init__(cam, clock, rules, *args, history=history)
+
+        # Basic Curses Setup
+        self.stdscr = curses.initscr()
+        self.stdscr.keypad(True)
+        self.stdscr.nodelay(True)
+
+        # Other setup
+        curses.noecho()
+        curses.cbreak()
+        curses.start_color()
+        curses.use_default_colors()
+
+        # Specifies the offsets the grid are taken at
+        self.x, self.y = 0, 0
+        self.width, self.height = self.cam.master.shape
+
+        # Construct the necessary planes
+        self.overlays = []
+        for i, plane in enumerate(self.cam.planes):
+            pad = curses.newpad(self.width+1, self.height+1)
+            self.overlays.append(pad)
+            if i > 0:
+                self.overlays[i-1].overlay(pad)
+
+    def _valid(self):
+        """
+        Ensures only 2D CAMs are accepted.
+        """
+        return len(self.cam.master.shape) == 2
+
+    def _shift(self, ch):
+        """
+        Move all panels over by specified amount.
+
+        Note we want functionality to wrap around, so we make
+        sure to mod based on which direction we've gone. Directionality
+        is determined by the passed character value.
+        """
+        if ch == curses.KEY_UP:
+            self.y = (self.y + 1) % self.height
+        elif ch == curses.KEY_DOWN:
+            self.y = (self.y - 1) % self.height
+        elif ch == curses.KEY_LEFT:
+            self.x = (self.x + 1) % self.width
+        elif ch == curses.KEY_RIGHT:
+            self.x = (self.x - 1) % self.width
+
+    def _control(self, ch):
+        """
+        Pause, step through or seek the history of the CAM.
+        """
+        if ch == ord(' '):
+            self.paused = not self.paused
+        elif ch == ord(','):
+            self.step_back()
+        elif ch == ord('.'):
+            self.paused = True
+            self.advance()
+        elif ch == curses.KEY_HOME:
+            self.seek(self.history.first)
+        elif ch == curses.KEY_END:
+            self.seek(self.history.last)
+
+    def _draw_overlay(self, overlay, plane):
+        """
+        Draw the grid onto the overlay.
+
+        Wherever a one occurs, we make sure to draw it. Otherwise, we create a transparent
+        spot so any overlays below can be seen.
+        """
+        overlay.clear()
+
+        line = 0
+        for i in range(plane.shape[0]):
+            overlay.move(line, 0)
+            line += 1
+
+            # Make sure to account for movement
+            y_offset = ((i + self.y) % plane.shape[0]) * plane.offsets[0]
+            bits = plane.bits[y_offset:y_offset+plane.shape[1]]
+            cycle = bits[self.x:] + bits[:self.x]
+
+            # Draw only active states
+            for k, g in itertools.groupby(cycle):
+                values = list(g)
+                if any(values):
+                    overlay.addstr('+' * len(values))
+                else:
+                    pass
+                    y, x = overlay.getyx()
+                    overlay.move(y, x + len(values))
+
+    def run(self):
+        """
+        Commence actual loop.
+
+        The following draws out all panels, and, in the case of an exception
+        (which could be user thrown by Ctrl-C), restores the terminal back
+        to a usable state.
+        """
+        try:
+            while True:
+
+                # Note the user can change the size of the terminal,
+                # so we query for these values every time
+                max_y, max_x = self.stdscr.getmaxyx()
+
+                # Navigate the plane
+                # Note in the __init__ method, this was set to not block
+                ch = self.stdscr.getch()
+                self._shift(ch)
+                self._control(ch)
+
+                # Run whatever ticks are due, or idle for a frame while paused
+                if self.paused:
+                    time.sleep(PAUSED_FRAME)
+                self.frame()
+
+                # Cycle around grid
+                start = time.perf_counter()
+                for i, plane in enumerate(self.cam.planes):
+                    if plane.dirty:
+                        plane.dirty = False
+                        self._draw_overlay(self.overlays[i], plane)
+                        self.overlays[i].noutrefresh(0, 0, 0, 0, max_y-1, max_x-1)
+
+                # Prepare for next loop
+                curses.doupdate()
+                if self.cam.instrument is not None:
+                    self.cam.instrument.phase('display', time.perf_counter() - start)
+
+        except:
+            self.stdscr.keypad(False)
+            curses.nocbreak()
+            curses.echo()
+            curses.endwin()
+            print("Exception: ", sys.exc_info()[0])
+            raise
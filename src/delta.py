@@ -0,0 +1,198 @@
+"""
+Compact per-tick changes of a plane.
+
+Every tick engine transitions a plane through Plane.update, which already computes the XOR mask of
+the cells that changed. Rather than consumers (recorders, remote viewers) copying the bits of a plane
+every tick and diffing them themselves, that mask is condensed into a Delta, whose size depends only
+on how many cells changed.
+
+Since rows of a plane are padded to whole words (see Plane), a delta is kept as a sparse set of tiles:
+the index of every 64 bit word of the mask with any bit set, along with the word itself. Masks are
+condensed and applied word by word with numpy, and cells only ever need to be visited individually
+when asked for by index.
+
+    for tick, change in cam.deltas(rules, count=100):
+        viewer.apply(change)
+
+@date: October 18, 2026
+"""
+import struct
+import numpy as np
+
+from bitarray import bitarray
+
+import plane as pl
+
+
+# Header of serialized deltas: tick, length in bits, number of tiles, bytes per tile, bytes per
+# tile index and bit order
+_HEADER = struct.Struct('<qqqBB1s')
+
+
+def _tiles(bits):
+    """
+    The buffer of a bitarray viewed as words (or bytes, for bitarrays not a whole number of words).
+    """
+    dtype = np.uint64 if len(bits) % pl.WORD == 0 else np.uint8
+    return np.frombuffer(bits, dtype=dtype)
+
+
+class Delta:
+    """
+    The cells of a plane that changed on a given tick.
+
+    @tick:   The tick the change was made on.
+    @length: Number of bits of the plane changed (i.e. len(plane.bits)).
+    @tiles:  Indices of the words of the mask with any bit set, in increasing order.
+    @words:  The nonzero words of the mask themselves.
+    @endian: Bit order of the mask.
+    """
+
+    def __init__(self, tick, length, tiles, words, endian='big'):
+        self.tick = tick
+        self.length = length
+        self.tiles = tiles
+        self.words = words
+        self.endian = endian
+
+    @classmethod
+    def of(cls, mask, tick=0):
+        """
+        Condense an XOR mask (e.g. as returned by Plane.update) into a delta.
+        """
+        words = _tiles(mask)
+        tiles = np.flatnonzero(words)
+        return cls(tick, len(mask), tiles, words[tiles].copy(), pl._endian(mask))
+
+    @classmethod
+    def between(cls, before, after, tick=0):
+        """
+        The delta taking the bits @before to the bits @after.
+        """
+        return cls.of(before ^ after, tick)
+
+    def __len__(self):
+        return self.count()
+
+    def __repr__(self):
+        return 'Delta(tick={}, changed={}, tiles={})'.format(self.tick, self.count(), len(self.tiles))
+
+    def __eq__(self, other):
+        return (isinstance(other, Delta) and self.length == other.length
+                and np.array_equal(self.tiles, other.tiles) and self.mask() == other.mask())
+
+    def count(self):
+        """
+        Number of cells that changed.
+        """
+        return int(np.unpackbits(self.words.view(np.uint8)).sum())
+
+    @property
+    def nbytes(self):
+        """
+        Size of the delta, as serialized by tobytes.
+        """
+        return _HEADER.size + self.tiles.astype(self._index_dtype()).nbytes + self.words.nbytes
+
+    def mask(self):
+        """
+        Expand the delta back into a full XOR mask.
+        """
+        bits = bitarray(self.length, endian=self.endian)
+        bits.setall(0)
+        _tiles(bits)[self.tiles] = self.words
+        return bits
+
+    def indices(self):
+        """
+        Flattened indices (see Plane.flatten) of every cell that changed, in increasing order.
+
+        For a MultiPlane, these index the bits of all of its bit planes laid end to end.
+        """
+        width = self.words.dtype.itemsize * 8
+        bits = np.unpackbits(self.words.view(np.uint8), bitorder=self.endian).reshape(len(self.tiles), width)
+        tile, bit = np.nonzero(bits)
+        return self.tiles[tile].astype(np.int64) * width + bit
+
+    def runs(self):
+        """
+        The changed cells as runs of consecutive flattened indices, given by an array of rows
+        (start, length).
+        """
+        indices = self.indices()
+        if len(indices) == 0:
+            return np.zeros((0, 2), dtype=np.int64)
+        breaks = np.flatnonzero(np.diff(indices) != 1) + 1
+        starts = np.concatenate([[0], breaks])
+        ends = np.concatenate([breaks, [len(indices)]])
+        return np.stack([indices[starts], ends - starts], axis=1)
+
+    def apply_to(self, plane):
+        """
+        Apply the change to a plane holding the generation before it, returning the delta mask
+        (as Plane.update). Applying the same delta again undoes it.
+        """
+        if len(plane.bits) != self.length:
+            raise ValueError("Expected a plane of {} bits".format(self.length))
+
+        return plane.update(self.xor(plane.bits.copy()))
+
+    def xor(self, bits):
+        """
+        Apply the change to the given bits in place, returning them.
+        """
+        _tiles(bits)[self.tiles] ^= self.words
+        return bits
+
+    def _index_dtype(self):
+        """
+        Narrowest type holding every tile index.
+        """
+        return np.dtype('<u4') if self.length // (self.words.dtype.itemsize * 8) < 2 ** 32 else np.dtype('<u8')
+
+    def tobytes(self):
+        """
+        Serialize the delta (see frombytes).
+        """
+        index = self._index_dtype()
+        header = _HEADER.pack(self.tick, self.length, len(self.tiles), self.words.dtype.itemsize,
+                              index.itemsize, self.endian[0].encode('ascii'))
+        return header + self.tiles.astype(index).tobytes() + self.words.tobytes()
+
+    @classmethod
+    def frombytes(cls, data):
+        """
+        Deserialize a delta written by tobytes.
+        """
+        tick, length, count, width, index, endian = _HEADER.unpack_from(data)
+        offset = _HEADER.size
+        tiles = np.frombuffer(data, dtype='<u{}'.format(index), count=count, offset=offset)
+        offset += count * index
+        words = np.frombuffer(data, dtype=np.uint64 if width == 8 else np.uint8, count=count, offset=offset)
+        return cls(tick, length, tiles.astype(np.int64), words.copy(), 'big' if endian == b'b' else 'little')
+
+
+def dump(deltas, stream):
+    """
+    Write deltas to a binary stream, each prefixed by its length. Returns the number of bytes
+    written.
+    """
+    written = 0
+    for change in deltas:
+        data = change.tobytes()
+        stream.write(struct.pack('<I', len(data)))
+        stream.write(data)
+        written += 4 + len(data)
+    return written
+
+
+def load(stream):
+    """
+    Yields the deltas of a binary stream written by dump.
+    """
+    while True:
+        prefix = stream.read(4)
+        if len(prefix) < 4:
+            return
+        (length,) = struct.unpack('<I', prefix)
+        yield Delta.frombytes(stream.read(length))
@@ -1,10 +1,57 @@
-import sys
-import time
-import curses
-import itertools
-import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.animation as ani
+"""
+Display backends of a CAM.
+
+Backends are registered by key (the values of CAM.Show) along with the module and class implementing
+them, and the module is only imported once the backend is first requested. This keeps GUI and terminal
+libraries (matplotlib, curses) out of headless processes that never display anything.
+
+@date: October 18, 2026
+"""
+import importlib
+
+import rewind
+import scheduler as sch
+
+
+_backends = {}
+
+
+def register(key, target):
+    """
+    Register a display backend.
+
+    @target: Either a _Display subclass, or a string of the form "module:Class" naming one. In the
+             latter case, the module is not imported until the backend is first requested.
+    """
+    _backends[key] = target
+
+
+def backend(key):
+    """
+    Returns the display class registered under the given key, importing it if necessary.
+    """
+    try:
+        target = _backends[key]
+    except KeyError:
+        raise ValueError("No display registered for {}".format(key))
+
+    if isinstance(target, str):
+        module, name = target.split(':')
+        target = getattr(importlib.import_module(module), name)
+        _backends[key] = target
+
+    return target
+
+
+def __getattr__(name):
+    """
+    Allow the built in displays to still be accessed as members of this module.
+    """
+    if name == 'ConsoleDisplay':
+        return importlib.import_module('console').ConsoleDisplay
+    elif name == 'WindowDisplay':
+        return importlib.import_module('window').WindowDisplay
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
 
 
 class _Display:
@@ -17,11 +64,19 @@ class _Display:
 
     Both methods allow for the ability to display multiple cell planes at a time, with
     additional support for ECHOs and TRACing.
+
+    Every generation displayed is recorded in a rewind.Rewind, so displays can pause, step back
+    and forth through, and seek to any generation still held.
+
+    Ticks are paced by a scheduler.Scheduler at one tick every @clock milliseconds. Displays draw
+    once per frame, after running however many ticks came due since the last.
     """
 
-    def __init__(self, cam, clock, rules, *args):
+    def __init__(self, cam, clock, rules, *args, history=None):
         """
         Test for valid CAM and setup.
+
+        @history: The rewind.Rewind to record generations in, defaulting to one of the default budget.
         """
         self.cam = cam
         if not self._valid():
@@ -30,218 +85,58 @@ class _Display:
         self.clock = clock
         self.rules = rules
         self.tick_args = args
+        self.history = history if history is not None else rewind.Rewind(cam, rules=rules)
+        self.scheduler = sch.Scheduler.from_clock(clock)
+        self.paused = False
 
-    def _valid(self):
-        """
-        Ensures passed cam is supported for display type.
-        """
-        return True
-
-    def run(self):
-        """
-        Initiate the main display loop.
-        """
-        pass
-
-
-class ConsoleDisplay(_Display):
-    """
-    Displays CAM onto console via the curses library.
-
-    Note a couple concepts go hand in hand with displaying all the bits:
-
-    First, it is unlikely the entirety of a CAM can be displayed on the screen
-    at a time, so instead we emulate the use of a pad, allowing navigation
-    via the arrow keys.
-
-    Second, to provide support for color mapping and multiple planes, we use panels
-    which allow for exactly this overlaying we are trying to simulate.
-    """
-
-    def __init__(self, cam, clock, rules, *args):
+    def advance(self):
         """
-        Here we initialize the curses library, and begin construction of the necessary overlays.
+        Move the CAM to its next generation, replaying it from history if held (i.e. after stepping
+        back) and ticking otherwise.
         """
-        super().__init__(cam, clock, rules, *args)
-
-        # Basic Curses Setup
-        self.stdscr = curses.initscr()
-        self.stdscr.keypad(True)
-        self.stdscr.nodelay(True)
-
-        # Other setup
-        curses.noecho()
-        curses.cbreak()
-        curses.start_color()
-        curses.use_default_colors()
-
-        # Specifies the offsets the grid are taken at
-        self.x, self.y = 0, 0
-        self.width, self.height = self.cam.master.shape
-
-        # Construct the necessary planes
-        self.overlays = []
-        for i, plane in enumerate(self.cam.planes):
-            pad = curses.newpad(self.width+1, self.height+1)
-            self.overlays.append(pad)
-            if i > 0:
-                self.overlays[i-1].overlay(pad)
-
-    def _valid(self):
-        """
-        Ensures only 2D CAMs are accepted.
-        """
-        return len(self.cam.master.shape) == 2
+        if self.cam.total + 1 in self.history:
+            self.history.seek(self.cam.total + 1)
+        else:
+            self.cam.tick(self.rules, *self.tick_args)
+            self.history.record()
 
-    def _shift(self, ch):
+    def frame(self, block=True):
         """
-        Move all panels over by specified amount.
+        Run every tick due this frame (none while paused), returning how many were run.
 
-        Note we want functionality to wrap around, so we make
-        sure to mod based on which direction we've gone. Directionality
-        is determined by the passed character value.
+        @block: Whether to wait for the next tick to come due, rather than returning 0.
         """
-        if ch == curses.KEY_UP:
-            self.y = (self.y + 1) % self.height
-        elif ch == curses.KEY_DOWN:
-            self.y = (self.y - 1) % self.height
-        elif ch == curses.KEY_LEFT:
-            self.x = (self.x + 1) % self.width
-        elif ch == curses.KEY_RIGHT:
-            self.x = (self.x - 1) % self.width
-
-    def _draw_overlay(self, overlay, plane):
-        """
-        Draw the grid onto the overlay.
+        if self.paused:
+            self.scheduler.reset()
+            return 0
 
-        Wherever a one occurs, we make sure to draw it. Otherwise, we create a transparent
-        spot so any overlays below can be seen.
-        """
-        overlay.clear()
-
-        line = 0
-        for i in range(plane.shape[0]):
-            overlay.move(line, 0)
-            line += 1
-
-            # Make sure to account for movement
-            y_offset = ((i + self.y) % plane.shape[0]) * plane.shape[1]
-            bits = plane.bits[y_offset:y_offset+plane.shape[1]]
-            cycle = bits[self.x:] + bits[:self.x]
-
-            # Draw only active states
-            for k, g in itertools.groupby(cycle):
-                values = list(g)
-                if any(values):
-                    overlay.addstr('+' * len(values))
-                else:
-                    pass
-                    y, x = overlay.getyx()
-                    overlay.move(y, x + len(values))
+        count = self.scheduler.wait() if block else self.scheduler.due()
+        for _ in range(count):
+            self.advance()
+        return count
 
-    def run(self):
+    def step_back(self):
         """
-        Commence actual loop.
-
-        The following draws out all panels, and, in the case of an exception
-        (which could be user thrown by Ctrl-C), restores the terminal back
-        to a usable state.
+        Pause, and move the CAM to its previous generation (if still held).
         """
-        try:
-            while True:
-
-                # Note the user can change the size of the terminal,
-                # so we query for these values every time
-                max_y, max_x = self.stdscr.getmaxyx()
-
-                # Navigate the plane
-                # Note in the __init__ method, this was set to not block
-                self._shift(self.stdscr.getch())
-
-                # Cycle around grid
-                for i, plane in enumerate(self.cam.planes):
-                    if plane.dirty:
-                        plane.dirty = False
-                        self._draw_overlay(self.overlays[i], plane)
-                        self.overlays[i].noutrefresh(0, 0, 0, 0, max_y-1, max_x-1)
-
-                # Prepare for next loop
-                curses.doupdate()
-                time.sleep(self.clock / 1000)
-                self.cam.tick(self.rules, *self.tick_args)
-
-        except:
-            self.stdscr.keypad(False)
-            curses.nocbreak()
-            curses.echo()
-            curses.endwin()
-            print("Exception: ", sys.exc_info()[0])
-            raise
-
-
-class WindowDisplay(_Display):
-    """
-    Displays CAM onto window via the matplotlib library.
+        self.paused = True
+        return self.history.step_back()
 
-    We use the AxesImage object in matplotlib and constantly animate
-    the graph to display the automata. Unlike the curses library, this
-    class also provides support for 3D display, though note this is
-    much more intensive.
-    """
-    def __init__(self, cam, clock, rules, *args):
+    def seek(self, tick):
         """
-        Initialize matplotlib objects.
+        Pause, and move the CAM to the given generation, clamped to those held.
         """
-        super().__init__(cam, clock, rules, *args)
-
-        # Keep local reference for convenience
-        self.fig, self.ax = plt.subplots()
-
-        # Note we draw out planes in the reverse direction
-        # for proper superimposition
-        self.matrices = []
-        for plane in self.cam.planes:
-            mshown = plt.matshow(plane.matrix(), self.fig.number, cmap='Greys')
-            self.matrices.append(mshown)
+        self.paused = True
+        self.history.seek(min(max(tick, self.history.first), self.history.last))
 
     def _valid(self):
         """
-        Ensures only 2D/3D CAMs are accepted.
-        """
-        return 2 <= len(self.cam.master.shape) <= 3
-
-    def _animate(self, frame):
-        """
-        Display the next state of the automaton.
-
-        Note that the framerate must be considered; one shouldn't just try to run
-        the animation as fast as possible, as this callback will only be bottled up.
-        The limiting factor is the tick method, which should be fast enough for reasonably
-        sized CAMs (100x100 runs in <50 ms on my computer), but runs in quadratic time.
+        Ensures passed cam is supported for display type.
         """
-        self.cam.tick(self.rules, *self.tick_args)
-        if len(self.cam.master.shape) == 2:
-            self.matrices[0].set_array(self.cam.master.matrix())
-            return [self.matrices[0]]
-        else:
-            pass
+        return True
 
     def run(self):
         """
-        Commence actual loop.
-
-        The following expands out each plane (from a bitarray to a matrix of bits)
-        which are then displayed out via the animate function. We simply superimpose
-        the necessary plots for the desired overlaying.
+        Initiate the main display loop.
         """
-        if len(self.cam.master.shape) == 2:
-            self.ax.set_frame_on(False)
-            self.ax.get_xaxis().set_visible(False)
-            self.ax.get_yaxis().set_visible(False)
-        else:
-            pass
-
-        ani.FuncAnimation(self.fig, self._animate, interval=self.clock)
-        plt.axis('off')
-        plt.show()
-
+        pass
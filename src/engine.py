@@ -0,0 +1,805 @@
+"""
+Vectorized tick engines.
+
+Applying a Ruleset visits every cell from Python, which is as general as it gets but also slow. Most
+rules people actually run are outer totalistic however (the next state of a cell depends only on its
+current state and the number of live cells in its neighborhood), and these can instead be applied to
+an entire plane at once:
+
+* Neighborhood totals are computed for every cell simultaneously by summing shifted views of the
+  plane (padded with a halo honoring the plane's boundaries), one per offset of the neighborhood.
+* The totals are mapped through lookup tables to masks of which cells are born or survive.
+* The next state of every cell is then derived with bitwise operations on whole bit planes.
+
+Engines can be passed to CAM.tick in place of a Ruleset (they provide the same apply_to method), and
+work on both Planes and MultiPlanes. Block rules on the Margolus neighborhood (see Margolus) are
+likewise applied to every block at once through a single table lookup, and 1D rules (see Elementary)
+are evaluated as boolean operations on entire packed lines. Any of the neighborhood engines may be
+made second order (and so reversible) with SecondOrder.
+
+@date: October 18, 2026
+"""
+import time
+import weakref
+import numpy as np
+
+from bitarray import bitarray
+from itertools import product
+
+import plane as pl
+
+
+def unpack(bits, shape):
+    """
+    Expand the bits of a plane of the given shape into a numpy array of 0s and 1s.
+
+    The padding of each row is dropped (the result is a view into the unpacked rows).
+    """
+    return pl.unpack(bits, shape)
+
+
+def pack(cells, endian='big'):
+    """
+    Collapse a numpy array of 0s and 1s into the bits of a plane of the same shape.
+
+    Since padded rows are a whole number of bytes, each row packs independently.
+    """
+    return pl.pack(cells, endian)
+
+
+def moore(dimen):
+    """
+    Offsets of the Moore neighborhood in the given number of dimensions (see Configuration.moore).
+    """
+    return [offset for offset in product([-1, 0, 1], repeat=dimen) if any(offset)]
+
+
+class Halo:
+    """
+    Working copy of a plane surrounded by a border (the halo) of cells lying beyond its edges.
+
+    The halo is as wide along each axis as the furthest offset of a neighborhood along that axis,
+    and is filled according to the boundary of each axis. Once refreshed, the neighbor of every
+    cell at a given offset is found by simply slicing the working copy, so no index ever needs to
+    be wrapped (or checked against the edges of the plane) when counting.
+
+    A halo is meant to be kept around and refreshed once per tick, so the working copy is only
+    allocated once.
+    """
+
+    def __init__(self, shape, offsets, boundaries):
+        self.shape = tuple(shape)
+        self.boundaries = tuple(boundaries)
+        self.offsets = offsets
+        self.radius = tuple(max([abs(o[i]) for o in offsets] + [0]) for i in range(len(shape)))
+        self.cells = np.zeros([n + 2*r for n, r in zip(self.shape, self.radius)], dtype=np.uint8)
+        self.interior = tuple(slice(r, r + n) for n, r in zip(self.shape, self.radius))
+
+        # For each axis, the positions of the halo and the positions they are copied from
+        # (for boundaries not fixed to a constant)
+        self.sources = []
+        for n, r, mode in zip(self.shape, self.radius, self.boundaries):
+            border = np.concatenate([np.arange(-r, 0), np.arange(n, n + r)])
+            if mode == pl.Plane.Boundary.TOROIDAL:
+                source = border % n
+            elif mode == pl.Plane.Boundary.REFLECT:
+                source = border % (2 * n)
+                source = np.where(source >= n, 2 * n - 1 - source, source)
+            else:
+                source = None
+            self.sources.append((border + r, None if source is None else source + r))
+
+    def matches(self, shape, offsets, boundaries):
+        """
+        Whether this halo can be reused for the given arguments.
+        """
+        if offsets is not self.offsets:
+            if not all(abs(o[i]) <= r for o in offsets for i, r in enumerate(self.radius)):
+                return False
+            self.offsets = offsets
+        return self.shape == tuple(shape) and self.boundaries == tuple(boundaries)
+
+    def refresh(self, cells):
+        """
+        Copy the current cells into the interior and fill the halo.
+
+        Axes are filled one after another, each copying entire slabs (halos of earlier axes
+        included), so corners are filled consistently with every boundary involved: a corner takes
+        the value of the last constant boundary among its axes (as Plane.read).
+        """
+        self.cells[self.interior] = cells
+        for axis, (mode, (border, source)) in enumerate(zip(self.boundaries, self.sources)):
+            if len(border) == 0:
+                continue
+            target = [slice(None)] * self.cells.ndim
+            target[axis] = border
+            if source is None:
+                self.cells[tuple(target)] = 1 if mode == pl.Plane.Boundary.ONE else 0
+            else:
+                origin = [slice(None)] * self.cells.ndim
+                origin[axis] = source
+                self.cells[tuple(target)] = self.cells[tuple(origin)]
+
+        return self.cells
+
+    def totals(self, offsets):
+        """
+        Number of live neighbors of every cell of the most recently refreshed plane.
+        """
+        dtype = np.uint8 if len(offsets) < 256 else np.uint16
+        counts = np.zeros(self.shape, dtype=dtype)
+        for offset in offsets:
+            view = tuple(slice(r + o, r + o + n) for n, r, o in zip(self.shape, self.radius, offset))
+            counts += self.cells[view]
+
+        return counts
+
+
+def totals(cells, offsets, boundaries=None, halo=None):
+    """
+    Returns the number of live neighbors of every cell.
+
+    @boundaries: Plane.Boundary of each axis, defaulting to toroidal.
+    @halo:       A Halo to reuse, if it matches the arguments.
+    """
+    if boundaries is None:
+        boundaries = (pl.Plane.Boundary.TOROIDAL,) * cells.ndim
+    if halo is None or not halo.matches(cells.shape, offsets, boundaries):
+        halo = Halo(cells.shape, offsets, boundaries)
+
+    halo.refresh(cells)
+    return halo.totals(offsets)
+
+
+def _layers(plane):
+    """
+    Returns the bit planes of a Plane or MultiPlane.
+    """
+    if isinstance(plane, pl.MultiPlane):
+        return plane.layers()
+    else:
+        return [plane.bits]
+
+
+def _equals(layers, state):
+    """
+    Mask of all cells in the given state.
+    """
+    mask = layers[0] | ~layers[0]
+    for i, layer in enumerate(layers):
+        mask &= layer if (state >> i) & 1 else ~layer
+    return mask
+
+
+def _increment(layers):
+    """
+    Bit planes of every cell's state plus one, via a ripple carry adder across the planes.
+    """
+    carry = layers[0] | ~layers[0]
+    incremented = []
+    for layer in layers:
+        incremented.append(layer ^ carry)
+        carry = layer & carry
+    return incremented
+
+
+class _Engine:
+    """
+    Base of engines applying a neighborhood dependent rule to an entire plane at once.
+
+    Rules are given the bit planes of the current generation and a mask of live neighbor totals
+    per lookup table, and return the bit planes of the next generation.
+    """
+
+    def __init__(self, offsets=None, tables=None):
+        """
+        @offsets: Coordinates (relative to a cell) of its neighborhood. Defaults to the Moore
+                  neighborhood of whatever plane the engine is applied to.
+        @tables:  Optionally, lookup tables already compiled for this rule (as returned by
+                  _tables), keyed by neighborhood size. These are shared, never modified.
+        """
+        self.offsets = None if offsets is None else [tuple(o) for o in offsets]
+        self.instrument = None
+        self._halo = None
+        self._moore = {}
+        self._compiled = {} if tables is None else dict(tables)
+
+    def _offsets(self, plane):
+        """
+        Offsets used for the given plane.
+        """
+        if self.offsets is not None:
+            return self.offsets
+        if plane.N not in self._moore:
+            self._moore[plane.N] = moore(plane.N)
+        return self._moore[plane.N]
+
+    def _alive(self, layers):
+        """
+        Mask of cells counted as live neighbors.
+        """
+        return layers[0]
+
+    def _tables(self, count):
+        """
+        Lookup tables, indexed by neighborhood totals up to @count, each producing a mask.
+        """
+        return []
+
+    def _next(self, layers, masks):
+        """
+        Bit planes of the next generation.
+        """
+        return layers
+
+    def next_bits(self, plane):
+        """
+        Bits of the next generation of the given plane, leaving the plane itself as it is.
+        """
+        inst = self.instrument
+        if inst is not None:
+            start = time.perf_counter()
+
+        layers = _layers(plane)
+        offsets = self._offsets(plane)
+        if self._halo is None or not self._halo.matches(plane.shape, offsets, plane.boundaries):
+            self._halo = Halo(plane.shape, offsets, plane.boundaries)
+        self._halo.refresh(unpack(self._alive(layers), plane.shape))
+        counts = self._halo.totals(offsets)
+        endian = pl._endian(plane.bits)
+
+        if inst is not None:
+            counted = time.perf_counter()
+            inst.phase('counting', counted - start)
+
+        if len(offsets) not in self._compiled:
+            self._compiled[len(offsets)] = self._tables(len(offsets))
+        masks = [pack(table[counts], endian) for table in self._compiled[len(offsets)]]
+        layers = self._next(layers, masks)
+        if isinstance(plane, pl.MultiPlane):
+            bits = plane.join(layers)
+        else:
+            bits = layers[0]
+
+        if inst is not None:
+            inst.phase('rules', time.perf_counter() - counted)
+
+        return bits
+
+    def apply_to(self, plane, *args):
+        """
+        Transition the given plane to its next generation.
+        """
+        bits = self.next_bits(plane)
+
+        inst = self.instrument
+        if inst is not None:
+            start = time.perf_counter()
+
+        delta = plane.update(bits)
+
+        if inst is not None:
+            inst.phase('swap', time.perf_counter() - start)
+            inst.applied(self, [], delta.count())
+
+
+class Totalistic(_Engine):
+    """
+    Life-like rules, optionally with decaying states (the "Generations" family).
+
+    With 2 states, a dead cell with a total in @birth becomes alive, and a live cell survives if its
+    total is in @survive. With more states, live cells that do not survive instead begin to decay,
+    advancing one state per tick until wrapping back around to dead. Decaying cells do not count
+    as live neighbors, and cannot be born or survive. For example, Brian's Brain has birth {2},
+    no survival and 3 states.
+
+    The planes applied to must have enough bits per cell to hold every state.
+    """
+
+    def __init__(self, birth, survive, states=2, offsets=None, tables=None):
+        super().__init__(offsets, tables)
+        self.birth = set(birth)
+        self.survive = set(survive)
+        self.states = max(states, 2)
+
+    def _alive(self, layers):
+        """
+        Only cells in state 1 count.
+        """
+        return _equals(layers, 1)
+
+    def _tables(self, count):
+        """
+        Birth and survival masks.
+        """
+        born = np.zeros(count + 1, dtype=np.uint8)
+        kept = np.zeros(count + 1, dtype=np.uint8)
+        born[[b for b in self.birth if b <= count]] = 1
+        kept[[s for s in self.survive if s <= count]] = 1
+        return [born, kept]
+
+    def _next(self, layers, masks):
+        """
+        Derive the next generation bitwise.
+
+        Cells either stay as they are, are born into state 1, or advance to the next state (where
+        the last state advances back to 0).
+        """
+        if len(layers) < (self.states - 1).bit_length():
+            raise ValueError("Plane cannot hold {} states".format(self.states))
+
+        born, kept = masks
+        alive = _equals(layers, 1)
+        occupied = layers[0].copy()
+        for layer in layers[1:]:
+            occupied |= layer
+
+        born &= ~occupied
+        advancing = (alive & ~kept) | (occupied & ~alive)
+        wrapping = advancing & _equals(layers, self.states - 1)
+        staying = ~(advancing | born)
+
+        incremented = _increment(layers)
+        advancing &= ~wrapping
+        next_layers = []
+        for i, layer in enumerate(layers):
+            next_layer = (staying & layer) | (advancing & incremented[i])
+            if i == 0:
+                next_layer |= born
+            next_layers.append(next_layer)
+
+        return next_layers
+
+
+class Wireworld(_Engine):
+    """
+    Wireworld, on a plane of (at least) 2 bits per cell.
+
+    States are 0 (empty), 1 (electron head), 2 (electron tail) and 3 (conductor). Heads become tails,
+    tails become conductors, and conductors become heads if one or two of their neighbors are heads.
+    """
+
+    def _alive(self, layers):
+        """
+        Electron heads count.
+        """
+        return _equals(layers, 1)
+
+    def _tables(self, count):
+        """
+        Spark mask.
+        """
+        sparks = np.zeros(count + 1, dtype=np.uint8)
+        sparks[1:3] = 1
+        return [sparks]
+
+    def _next(self, layers, masks):
+        """
+        Derive the next generation bitwise.
+        """
+        if len(layers) < 2:
+            raise ValueError("Plane cannot hold 4 states")
+
+        sparks = masks[0]
+        low, high = layers[0], layers[1]
+        heads = low & ~high
+        tails = ~low & high
+        conductors = low & high
+
+        next_low = tails | conductors
+        next_high = heads | tails | (conductors & ~sparks)
+        return [next_low, next_high] + [layer & ~layer for layer in layers[2:]]
+
+
+class Margolus:
+    """
+    Block rules on the Margolus neighborhood.
+
+    The plane is partitioned into blocks of 2 cells along every axis, and every block is replaced
+    as a whole according to a lookup table. Partitions alternate between ticks: on even ticks blocks
+    begin at even coordinates, and on odd ticks they are shifted by one cell along every axis.
+
+    The cells of a block are numbered in row major order (in 2D: top left, top right, bottom left,
+    bottom right), the kth cell contributing the kth bit of the block's index into the table. So a
+    2D table has 16 entries and a 3D table 256. Tables that are permutations give reversible rules.
+
+    Every block is looked up at once, by gathering the cells of each block into an array of indices.
+    The plane must be of even extent along every axis. Along axes that are not toroidal, blocks of
+    the odd partition straddling the edge of the plane are left as they are.
+    """
+
+    def __init__(self, table):
+        """
+        @table: Sequence of 2^(2^N) block indices, for planes of N dimensions.
+        """
+        self.table = np.asarray(table, dtype=np.uint8 if len(table) <= 256 else np.uint16)
+        self.instrument = None
+        self._phases = weakref.WeakKeyDictionary()
+
+    def phase(self, plane):
+        """
+        Partition (0 for even, 1 for odd) the next application to the given plane will use.
+        """
+        return self._phases.get(plane, 0)
+
+    def reset(self, plane=None, phase=0):
+        """
+        Return the given plane (or every plane) to the even partition, or the given plane to
+        @phase.
+        """
+        if plane is None:
+            self._phases.clear()
+        elif phase:
+            self._phases[plane] = 1
+        else:
+            self._phases.pop(plane, None)
+
+    def _cells(self, n):
+        """
+        Slices selecting the kth cell of every block, for each k in order.
+        """
+        return [tuple(slice(o, None, 2) for o in offset) for offset in product((0, 1), repeat=n)]
+
+    def apply_to(self, plane, *args):
+        """
+        Transition the given plane to its next generation, and advance its partition.
+        """
+        if isinstance(plane, pl.MultiPlane):
+            raise ValueError("Margolus rules only apply to planes of a single bit per cell")
+        if len(self.table) != 2 ** (2 ** plane.N):
+            raise ValueError("Expected a table of {} entries".format(2 ** (2 ** plane.N)))
+        if any(size % 2 for size in plane.shape):
+            raise ValueError("Margolus partitions require even extents")
+
+        inst = self.instrument
+        if inst is not None:
+            start = time.perf_counter()
+
+        phase = self.phase(plane)
+        axes = tuple(range(plane.N))
+        cells = unpack(plane.bits, plane.shape)
+        if phase:
+            cells = np.roll(cells, (-1,) * plane.N, axis=axes)
+
+        slices = self._cells(plane.N)
+        indices = np.zeros([size // 2 for size in plane.shape], dtype=self.table.dtype)
+        for k, cell in enumerate(slices):
+            indices |= cells[cell].astype(self.table.dtype) << k
+
+        if inst is not None:
+            counted = time.perf_counter()
+            inst.phase('counting', counted - start)
+
+        replaced = self.table[indices]
+        result = np.empty(plane.shape, dtype=np.uint8)
+        for k, cell in enumerate(slices):
+            result[cell] = (replaced >> k) & 1
+
+        if phase:
+            result = np.roll(result, (1,) * plane.N, axis=axes)
+            original = unpack(plane.bits, plane.shape)
+            for axis, mode in enumerate(plane.boundaries):
+                if mode != pl.Plane.Boundary.TOROIDAL:
+                    edges = [slice(None)] * plane.N
+                    edges[axis] = [0, -1]
+                    result[tuple(edges)] = original[tuple(edges)]
+
+        bits = pack(result, pl._endian(plane.bits))
+
+        if inst is not None:
+            evaluated = time.perf_counter()
+            inst.phase('rules', evaluated - counted)
+
+        delta = plane.update(bits)
+        self._phases[plane] = 1 - phase
+
+        if inst is not None:
+            inst.phase('swap', time.perf_counter() - evaluated)
+            inst.applied(self, [], delta.count())
+
+
+class Elementary:
+    """
+    One dimensional rules of any radius, as numbered by Wolfram.
+
+    The next state of a cell depends on the 2r+1 cells centered on it. Read left to right, these form
+    the binary index of an entry of the rule table, so the leftmost cell is the most significant bit.
+    A rule number is the table read as a binary number, entry 0 being the least significant bit. For
+    example, rule 30 (radius 1) has the table 0, 1, 1, 1, 1, 0, 0, 0.
+
+    Rather than looking up every cell, the table is compiled into boolean operations on whole lines:
+    each neighbor is the line shifted by its offset, and the table is expanded one neighbor at a time
+    (skipping neighbors the remaining entries do not depend on). All operations act on the packed
+    bits, so a generation of a million cells takes a handful of bitarray operations.
+    """
+
+    def __init__(self, rule, radius=1):
+        """
+        @rule:   Either a rule number, or a sequence of the 2^(2r+1) entries of the rule table.
+        @radius: Number of neighbors on either side of a cell.
+        """
+        entries = 2 ** (2 * radius + 1)
+        if isinstance(rule, int):
+            if not 0 <= rule < 2 ** entries:
+                raise ValueError("Rule must be between 0 and 2^{}".format(entries))
+            table = [(rule >> i) & 1 for i in range(entries)]
+        else:
+            table = [int(bool(entry)) for entry in rule]
+            if len(table) != entries:
+                raise ValueError("Expected a table of {} entries".format(entries))
+
+        self.radius = radius
+        self.table = table
+        self.rule = sum(entry << i for i, entry in enumerate(table))
+        self.instrument = None
+
+    def _neighbor(self, cells, offset, boundary):
+        """
+        The line of neighbors at the given offset, i.e. whose ith bit is the (i + offset)th cell.
+        """
+        n = len(cells)
+        shifted = cells << offset if offset > 0 else cells >> -offset
+        if offset == 0 or boundary == pl.Plane.Boundary.ZERO:
+            return shifted
+
+        # Fill in the cells shifted in beyond the edge
+        edge = range(n - offset, n) if offset > 0 else range(0, -offset)
+        for i in edge:
+            j = i + offset
+            if boundary == pl.Plane.Boundary.TOROIDAL:
+                shifted[i] = cells[j % n]
+            elif boundary == pl.Plane.Boundary.REFLECT:
+                j %= 2 * n
+                shifted[i] = cells[j if j < n else 2 * n - 1 - j]
+            else:
+                shifted[i] = 1
+
+        return shifted
+
+    def _expand(self, table, neighbors, ones):
+        """
+        Boolean combination of the neighbors (most significant first) matching the given table.
+        """
+        if not any(table):
+            return ~ones
+        if all(table):
+            return ones.copy()
+
+        half = len(table) // 2
+        low, high = table[:half], table[half:]
+        if low == high:
+            return self._expand(low, neighbors[1:], ones)
+
+        x = neighbors[0]
+        if not any(low):
+            return x & self._expand(high, neighbors[1:], ones)
+        if not any(high):
+            return ~x & self._expand(low, neighbors[1:], ones)
+        return (x & self._expand(high, neighbors[1:], ones)) | (~x & self._expand(low, neighbors[1:], ones))
+
+    def step(self, cells, boundary=pl.Plane.Boundary.TOROIDAL):
+        """
+        Returns the next generation of a line of cells, given as a bitarray.
+        """
+        neighbors = [self._neighbor(cells, offset, boundary) for offset in range(-self.radius, self.radius + 1)]
+        ones = cells | ~cells
+        return self._expand(self.table, neighbors, ones)
+
+    def next_bits(self, plane):
+        """
+        Bits of the next generation of the given (1D) plane, leaving the plane itself as it is.
+        """
+        if plane.N != 1 or isinstance(plane, pl.MultiPlane):
+            raise ValueError("Elementary rules only apply to 1D planes of a single bit per cell")
+
+        inst = self.instrument
+        if inst is not None:
+            start = time.perf_counter()
+
+        n = plane.shape[0]
+        bits = self.step(plane.bits[:n], plane.boundaries[0])
+        padding = bitarray(plane.length - n, endian=pl._endian(bits))
+        padding.setall(0)
+        bits += padding
+
+        if inst is not None:
+            inst.phase('rules', time.perf_counter() - start)
+
+        return bits
+
+    def apply_to(self, plane, *args):
+        """
+        Transition the given (1D) plane to its next generation.
+        """
+        bits = self.next_bits(plane)
+
+        inst = self.instrument
+        if inst is not None:
+            start = time.perf_counter()
+
+        delta = plane.update(bits)
+
+        if inst is not None:
+            inst.phase('swap', time.perf_counter() - start)
+            inst.applied(self, [], delta.count())
+
+    def history(self, plane, generations):
+        """
+        Yields the bits of the given plane for @generations generations, beginning with the current
+        one. The plane is advanced as it goes, and is left at the last generation yielded.
+        """
+        for t in range(generations):
+            if t > 0:
+                self.apply_to(plane)
+            yield plane.bits
+
+    def spacetime(self, plane, generations):
+        """
+        Returns the spacetime diagram of the next @generations generations of a plane.
+
+        This is a 2D plane whose ith row is the ith generation (the first being the current one).
+        Since rows of a plane are padded alike, the bits of each generation are simply concatenated.
+        """
+        bits = plane.bits[:0]
+        for row in self.history(plane, generations):
+            bits += row
+        return pl.Plane((generations, plane.shape[0]), bits)
+
+    def write_spacetime(self, plane, generations, stream):
+        """
+        Write the spacetime diagram of the next @generations generations to a binary stream, as a
+        PBM image (live cells are black).
+
+        Rows are written out as soon as they are computed, so only a single generation is ever held
+        in memory, regardless of how many are written.
+        """
+        n = plane.shape[0]
+        stream.write('P4\n{} {}\n'.format(n, generations).encode('ascii'))
+        for row in self.history(plane, generations):
+            row = row[:n]
+            if pl._endian(row) != 'big':
+                row = bitarray(row, endian='big')
+            stream.write(row.tobytes())
+
+
+class History:
+    """
+    The previous generation of every plane a second order rule is applied to.
+
+    Second order rules give the next generation as f(current) XOR previous, where f is any first
+    order rule. Whatever f is, the current generation is recovered as f(next) XOR next, so such rules
+    are exactly reversible: exchanging the current and previous generations runs time backwards.
+
+    Previous generations are kept per plane (planes not yet seen begin with an empty previous
+    generation), and are held by reference rather than copied, as every application replaces the
+    bits of a plane instead of modifying them.
+    """
+
+    def __init__(self):
+        self._previous = weakref.WeakKeyDictionary()
+
+    def previous(self, plane):
+        """
+        Bits of the generation preceding the current one of the given plane.
+        """
+        if plane not in self._previous:
+            self._previous[plane] = plane.bits & ~plane.bits
+        return self._previous[plane]
+
+    def seed(self, plane, bits):
+        """
+        Set the generation preceding the current one of the given plane.
+        """
+        if len(bits) != len(plane.bits):
+            raise ValueError("Expected {} bits".format(len(plane.bits)))
+        self._previous[plane] = bits & plane._mask(len(bits))
+
+    def advance(self, plane, bits):
+        """
+        Given f(current) of a plane, returns its next generation and remembers the current one.
+        """
+        bits = bits ^ self.previous(plane)
+        self._previous[plane] = plane.bits
+        return bits
+
+    def reverse(self, plane):
+        """
+        Exchange the current and previous generations of a plane, so that further applications
+        retrace its earlier generations. Returns the delta mask, as Plane.update.
+        """
+        previous = self.previous(plane)
+        self._previous[plane] = plane.bits
+        return plane.update(previous)
+
+    def reset(self, plane=None):
+        """
+        Forget the previous generation of the given plane (or every plane).
+        """
+        if plane is None:
+            self._previous.clear()
+        else:
+            self._previous.pop(plane, None)
+
+
+class SecondOrder:
+    """
+    Second order (reversible) form of another engine.
+
+    The wrapped engine computes f(current) over whole bit planes via its next_bits method, and its
+    result is XORed against the previous generation word by word before the plane is updated. Any
+    engine providing next_bits can be wrapped (e.g. SecondOrder(Elementary(90)) or
+    SecondOrder(Totalistic([3], [2, 3]))).
+    """
+
+    def __init__(self, rules):
+        self.rules = rules
+        self.history = History()
+        self.instrument = None
+
+    def seed(self, plane, bits):
+        """
+        Set the generation preceding the current one of the given plane (see History.seed).
+        """
+        self.history.seed(plane, bits)
+
+    def reverse(self, plane):
+        """
+        Run the given plane backwards from here on (see History.reverse).
+        """
+        return self.history.reverse(plane)
+
+    def apply_to(self, plane, *args):
+        """
+        Transition the given plane to its next generation.
+        """
+        # Phases are reported to this instrument if any, leaving the wrapped engine's own alone
+        inst = self.instrument
+        if inst is None:
+            bits = self.rules.next_bits(plane)
+        else:
+            attached, self.rules.instrument = self.rules.instrument, inst
+            try:
+                bits = self.rules.next_bits(plane)
+            finally:
+                self.rules.instrument = attached
+
+        if inst is not None:
+            start = time.perf_counter()
+
+        delta = plane.update(self.history.advance(plane, bits))
+
+        if inst is not None:
+            inst.phase('swap', time.perf_counter() - start)
+            inst.applied(self, [], delta.count())
+
+
+def _billiard_ball():
+    """
+    Table of the billiard ball model: lone balls cross their block diagonally, and two balls on
+    a diagonal (colliding head on) leave along the other diagonal.
+    """
+    table = list(range(16))
+    for a, b in [(0b0001, 0b1000), (0b0010, 0b0100), (0b1001, 0b0110)]:
+        table[a], table[b] = b, a
+    return table
+
+
+def _critters():
+    """
+    Table of Critters: blocks of exactly 2 live cells are unchanged, all others are complemented,
+    and blocks left with a single live cell (i.e. that had 3) are also rotated 180 degrees.
+    """
+    table = []
+    for index in range(16):
+        count = bin(index).count('1')
+        if count == 2:
+            table.append(index)
+        elif count == 3:
+            table.append(int('{:04b}'.format(index ^ 0b1111)[::-1], 2))
+        else:
+            table.append(index ^ 0b1111)
+    return table
+
+
+BILLIARD_BALL = _billiard_ball()
+CRITTERS = _critters()
@@ -0,0 +1,307 @@
+"""
+Headless exporting of a running CAM.
+
+Rather than driving a CAM through matplotlib's animation machinery, an exporter steps the CAM
+itself and encodes each generation directly from the packed bits of its planes. Frames are written
+out as soon as they are produced, so the memory used is that of a single frame regardless of how
+long the run is.
+
+Every plane of the CAM contributes one bit to the color index of a cell (the master being the
+lowest bit), so overlays such as ECHOing map to distinct colors of the palette.
+
+@date: October 18, 2026
+"""
+import zlib
+import struct
+import numpy as np
+
+import engine
+
+
+def _unpack(plane):
+    """
+    Expand the packed bits of a plane into a 2D numpy array of 0s and 1s.
+
+    Note the bitarray buffer is viewed directly; only the unpacked frame is allocated.
+    """
+    return engine.unpack(plane.bits, plane.shape)
+
+
+class _Exporter:
+    """
+    Steps a CAM and writes out each generation as a frame.
+
+    A palette maps the combination of planes active at a given cell to an RGB color. If not
+    supplied, the background is white and each plane is given its own color, with lower planes
+    (the master first) taking precedence when several are active.
+    """
+
+    COLORS = [
+        (0, 0, 0),
+        (230, 57, 70),
+        (69, 123, 157),
+        (42, 157, 143),
+        (244, 162, 97),
+        (131, 56, 236),
+        (255, 190, 11),
+        (128, 128, 128),
+    ]
+
+    def __init__(self, cam, clock, rules, *args, palette=None, scale=1):
+        """
+        @cam:     The CAM to step. Only 2D CAMs of at most 8 planes can be exported.
+        @clock:   Time, in milliseconds, each frame should be shown for.
+        @rules:   Ruleset (and @args) passed along to the CAM on every tick.
+        @palette: Optional list of RGB tuples, indexed by the bits of the active planes.
+        @scale:   Downsampling factor. Each scale x scale block of cells becomes a single pixel,
+                  which is active in any plane any of its cells are active in.
+        """
+        self.cam = cam
+        if not self._valid():
+            raise ValueError("Invalid Dimension for Export")
+
+        self.clock = clock
+        self.rules = rules
+        self.tick_args = args
+
+        self.scale = max(int(scale), 1)
+        self.height, self.width = (d // self.scale for d in cam.master.shape)
+        if self.height == 0 or self.width == 0:
+            raise ValueError("Scale larger than CAM")
+
+        self.palette = list(palette) if palette is not None else self._palette()
+        if len(self.palette) < 2 ** len(self.cam.planes):
+            raise ValueError("Palette does not cover every combination of planes")
+
+    def _valid(self):
+        """
+        Ensures only 2D CAMs with a representable number of planes are accepted.
+        """
+        return len(self.cam.master.shape) == 2 and len(self.cam.planes) <= 8
+
+    def _palette(self):
+        """
+        Construct the default palette.
+        """
+        palette = [(255, 255, 255)]
+        for index in range(1, 2 ** len(self.cam.planes)):
+            lowest = (index & -index).bit_length() - 1
+            palette.append(_Exporter.COLORS[lowest])
+
+        return palette
+
+    def _frame(self):
+        """
+        Build the (downsampled) matrix of palette indices of the current generation.
+        """
+        frame = np.zeros(self.cam.master.shape, dtype=np.uint8)
+        for i, plane in enumerate(self.cam.planes):
+            frame |= _unpack(plane) << i
+
+        if self.scale > 1:
+            s = self.scale
+            frame = frame[:self.height*s, :self.width*s]
+            blocks = frame.reshape(self.height, s, self.width, s)
+            frame = np.bitwise_or.reduce(blocks, axis=(1, 3))
+
+        return frame
+
+    def _begin(self, target):
+        """
+        Prepare the target before any frames are written.
+        """
+        pass
+
+    def _write(self, frame, index):
+        """
+        Encode a single frame.
+        """
+        pass
+
+    def _end(self):
+        """
+        Finalize the target after all frames are written.
+        """
+        pass
+
+    def run(self, target, frames):
+        """
+        Write out @frames generations, beginning with the current one, to the given target.
+        """
+        self._begin(target)
+        try:
+            for i in range(frames):
+                if i > 0:
+                    self.cam.tick(self.rules, *self.tick_args)
+                self._write(self._frame(), i)
+        finally:
+            self._end()
+
+
+class GIFExporter(_Exporter):
+    """
+    Writes an animated, infinitely looping GIF.
+
+    Each frame is LZW compressed and flushed to the file as it is produced. Since generations
+    of a CAM tend to consist of long runs of the same color, the compression is generally quite good.
+    """
+
+    def _begin(self, target):
+        """
+        Write the header, global color table and looping extension.
+        """
+        self.depth = max((len(self.palette) - 1).bit_length(), 1)
+        table = self.palette + [(0, 0, 0)] * (2 ** self.depth - len(self.palette))
+
+        self.out = open(target, 'wb')
+        self.out.write(b'GIF89a')
+        self.out.write(struct.pack('<HHBBB', self.width, self.height, 0xF0 | (self.depth - 1), 0, 0))
+        self.out.write(bytes(c for color in table for c in color))
+        self.out.write(b'\x21\xFF\x0BNETSCAPE2.0\x03\x01\x00\x00\x00')
+
+    def _write(self, frame, index):
+        """
+        Write the graphic control extension, image descriptor and image data of a frame.
+        """
+        delay = int(round(self.clock / 10))
+        self.out.write(struct.pack('<BBBBHBB', 0x21, 0xF9, 4, 0x04, delay, 0, 0))
+        self.out.write(struct.pack('<BHHHHB', 0x2C, 0, 0, self.width, self.height, 0))
+
+        min_size = max(self.depth, 2)
+        data = GIFExporter._lzw(frame.tobytes(), min_size)
+        self.out.write(bytes([min_size]))
+        for i in range(0, len(data), 255):
+            chunk = data[i:i+255]
+            self.out.write(bytes([len(chunk)]))
+            self.out.write(chunk)
+        self.out.write(b'\x00')
+
+    def _end(self):
+        """
+        Write the trailer.
+        """
+        self.out.write(b'\x3B')
+        self.out.close()
+
+    @staticmethod
+    def _lzw(pixels, min_size):
+        """
+        Variable length LZW compression as specified by GIF89a.
+
+        Strings are tracked by the code of their prefix and their last pixel, and the
+        table is reset via a clear code once all 12 bit codes are exhausted.
+        """
+        clear = 1 << min_size
+        out = bytearray()
+        acc, n_bits = 0, 0
+
+        table = {}
+        next_code = clear + 2
+        code_size = min_size + 1
+
+        acc |= clear << n_bits
+        n_bits += code_size
+
+        prefix = pixels[0]
+        for pixel in pixels[1:]:
+            key = (prefix << 8) | pixel
+            code = table.get(key)
+            if code is not None:
+                prefix = code
+                continue
+
+            acc |= prefix << n_bits
+            n_bits += code_size
+            while n_bits >= 8:
+                out.append(acc & 0xFF)
+                acc >>= 8
+                n_bits -= 8
+
+            if next_code < 4096:
+                table[key] = next_code
+                if next_code == (1 << code_size):
+                    code_size += 1
+                next_code += 1
+            else:
+                acc |= clear << n_bits
+                n_bits += code_size
+                table.clear()
+                next_code = clear + 2
+                code_size = min_size + 1
+
+            prefix = pixel
+
+        acc |= prefix << n_bits
+        n_bits += code_size
+
+        # The decoder adds one last entry upon reading the final prefix, which may widen the end code
+        if next_code == (1 << code_size) and code_size < 12:
+            code_size += 1
+        acc |= (clear + 1) << n_bits
+        n_bits += code_size
+
+        while n_bits > 0:
+            out.append(acc & 0xFF)
+            acc >>= 8
+            n_bits -= 8
+
+        return bytes(out)
+
+
+class PNGExporter(_Exporter):
+    """
+    Writes a sequence of palette based PNG images.
+
+    The target should be a format string (e.g. "frame_{:05d}.png") which is given the index
+    of each frame. Such a sequence can be handed to a video encoder directly.
+    """
+
+    def _begin(self, target):
+        """
+        Precompute the header and palette chunks shared by every image.
+        """
+        self.target = target
+        ihdr = struct.pack('>IIBBBBB', self.width, self.height, 8, 3, 0, 0, 0)
+        plte = bytes(c for color in self.palette for c in color)
+        self.header = b'\x89PNG\r\n\x1a\n' + self._chunk(b'IHDR', ihdr) + self._chunk(b'PLTE', plte)
+
+    def _write(self, frame, index):
+        """
+        Write a single image, each row using the "None" filter.
+        """
+        rows = np.zeros((self.height, self.width + 1), dtype=np.uint8)
+        rows[:, 1:] = frame
+        with open(self.target.format(index), 'wb') as f:
+            f.write(self.header)
+            f.write(self._chunk(b'IDAT', zlib.compress(rows.tobytes())))
+            f.write(self._chunk(b'IEND', b''))
+
+    @staticmethod
+    def _chunk(kind, data):
+        """
+        Length prefixed and CRC suffixed PNG chunk.
+        """
+        crc = zlib.crc32(kind + data) & 0xFFFFFFFF
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', crc)
+
+
+class RawExporter(_Exporter):
+    """
+    Writes frames as raw 24 bit RGB to a binary stream.
+
+    This allows piping a run straight into a video encoder without touching the disk, e.g.
+    ffmpeg -f rawvideo -pix_fmt rgb24 -s WIDTHxHEIGHT -i - out.mp4
+    """
+
+    def _begin(self, target):
+        """
+        Build the palette lookup table.
+        """
+        self.out = target
+        self.lookup = np.array(self.palette, dtype=np.uint8)
+
+    def _write(self, frame, index):
+        """
+        Map palette indices to colors and write them out.
+        """
+        self.out.write(self.lookup[frame].tobytes())
@@ -0,0 +1,166 @@
+"""
+Opt-in instrumentation of CAM ticks.
+
+An instrument is attached to a CAM (and the rulesets it is ticked with) and records, for every tick,
+the wall time spent in each phase of the tick, the number of cells changed, the population of the
+master plane and how many cells each configuration of a ruleset passed. Observers may subscribe to
+receive each record as it completes, and a running aggregate is kept for cheap summaries.
+
+When no instrument is attached, the CAM and rulesets only perform a single check against None per
+tick (and per configuration), so disabled instrumentation costs essentially nothing.
+
+@date: October 18, 2026
+"""
+import time
+
+
+class TickRecord:
+    """
+    Measurements of a single tick.
+
+    Phases are keyed by name (see Instrument.PHASES) and given in seconds. Passes maps each ruleset
+    applied during the tick to the list of cells passing each of its configurations, in order.
+    """
+
+    def __init__(self, tick):
+        self.tick = tick
+        self.elapsed = 0.0
+        self.phases = dict.fromkeys(Instrument.PHASES, 0.0)
+        self.changed = 0
+        self.population = 0
+        self.passes = {}
+
+    def __repr__(self):
+        phases = ', '.join('{}={:.6f}'.format(k, v) for k, v in self.phases.items())
+        return 'TickRecord(tick={}, elapsed={:.6f}, {}, changed={}, population={})'.format(
+            self.tick, self.elapsed, phases, self.changed, self.population)
+
+
+class Instrument:
+    """
+    Collects per-tick measurements and forwards them to observers.
+
+    The CAM notifies the instrument at the start and end of every tick, rulesets report the time
+    spent counting neighbors, evaluating configurations and swapping in the next generation, and
+    displays report the time spent drawing. Note displays draw after a tick has completed, so the
+    display phase is added onto the most recent record (and the aggregate) after observers have
+    already been notified of it.
+    """
+
+    PHASES = ('counting', 'rules', 'swap', 'display')
+
+    def __init__(self):
+        self.observers = []
+        self.record = None
+        self.reset()
+
+    def reset(self):
+        """
+        Clear the aggregate summary.
+        """
+        self.ticks = 0
+        self.elapsed = 0.0
+        self.fastest = None
+        self.slowest = None
+        self.changed = 0
+        self.population = 0
+        self.phases = dict.fromkeys(Instrument.PHASES, 0.0)
+        self.passes = {}
+
+    def attach(self, cam, *rulesets):
+        """
+        Instrument the given CAM and rulesets.
+        """
+        cam.instrument = self
+        for rules in rulesets:
+            rules.instrument = self
+
+    def detach(self, cam, *rulesets):
+        """
+        Remove instrumentation from the given CAM and rulesets.
+        """
+        cam.instrument = None
+        for rules in rulesets:
+            rules.instrument = None
+
+    def subscribe(self, callback):
+        """
+        Register a callback, invoked with the TickRecord of every completed tick.
+        """
+        self.observers.append(callback)
+
+    def unsubscribe(self, callback):
+        """
+        Remove a previously registered callback.
+        """
+        self.observers.remove(callback)
+
+    def begin(self, tick):
+        """
+        Called by the CAM before any planes are updated.
+        """
+        self.record = TickRecord(tick)
+        self._start = time.perf_counter()
+
+    def end(self, master):
+        """
+        Called by the CAM after all planes have been updated.
+        """
+        record = self.record
+        record.elapsed = time.perf_counter() - self._start
+        record.population = master.population
+
+        self.ticks += 1
+        self.elapsed += record.elapsed
+        self.changed += record.changed
+        self.population = record.population
+        if self.fastest is None or record.elapsed < self.fastest:
+            self.fastest = record.elapsed
+        if self.slowest is None or record.elapsed > self.slowest:
+            self.slowest = record.elapsed
+
+        for callback in self.observers:
+            callback(record)
+
+    def phase(self, name, seconds):
+        """
+        Add time spent in the named phase to the current tick and aggregate.
+        """
+        self.phases[name] += seconds
+        if self.record is not None:
+            self.record.phases[name] += seconds
+
+    def applied(self, rules, passes, changed):
+        """
+        Called by a ruleset once applied to a plane.
+
+        @passes:  Number of cells passing each configuration, in order.
+        @changed: Number of cells whose state differs from before.
+        """
+        if self.record is not None:
+            self.record.changed += changed
+            self.record.passes.setdefault(rules, [0] * len(passes))
+            for i, count in enumerate(passes):
+                self.record.passes[rules][i] += count
+
+        totals = self.passes.setdefault(rules, [0] * len(passes))
+        for i, count in enumerate(passes):
+            totals[i] += count
+
+    def summary(self):
+        """
+        Aggregate measurements over all ticks since the last reset.
+        """
+        mean = self.elapsed / self.ticks if self.ticks else 0.0
+        return {
+            'ticks': self.ticks,
+            'elapsed': self.elapsed,
+            'mean': mean,
+            'fastest': self.fastest,
+            'slowest': self.slowest,
+            'rate': self.ticks / self.elapsed if self.elapsed else 0.0,
+            'phases': dict(self.phases),
+            'changed': self.changed,
+            'population': self.population,
+            'passes': [list(p) for p in self.passes.values()],
+        }
@@ -0,0 +1,156 @@
+"""
+Future states of regions of a plane, computed from their backward light cones.
+
+The state of a cell k ticks from now depends only on the cells within k neighborhood radii of it,
+so the state of a region at t + k is determined by the region expanded by k radii along every axis
+(its backward light cone). Rather than ticking the whole plane k times, only that window is cut out
+of the plane and ticked. Cells within a radius of an edge of the window that was cut from the plane
+are wrong after each tick (their neighbors beyond the edge are missing), so the window is trimmed
+by a radius at each such edge as it goes, arriving at exactly the region on the last tick. Queries
+then cost time proportional to the volume of the cone, however large the plane.
+
+Edges of the window that coincide with edges of the plane keep the plane's boundary, and toroidal
+axes wrap, so regions may straddle the edges of a torus. The plane itself is left unchanged.
+
+    cells = lightcone.future(cam.master, parser.engine, (slice(500, 532), slice(900, 932)), 64)
+
+@date: October 18, 2026
+"""
+import numpy as np
+
+import plane as pl
+import engine as e
+import ruleset as r
+
+
+def _reach(offsets, N):
+    """
+    Radius of a neighborhood along each axis.
+    """
+    offsets = [tuple(o) for o in offsets]
+    return tuple(max([abs(o[i]) for o in offsets if len(o) > i] + [0]) for i in range(N))
+
+
+def radius(rules, N):
+    """
+    Radius along each axis of the neighborhood of the given rules, on a plane of @N dimensions.
+
+    Only rules of a fixed neighborhood, depending on the current generation alone, have light cones;
+    block (Margolus) and second order rules raise a ValueError.
+    """
+    if isinstance(rules, e.Elementary):
+        return (rules.radius,) * N
+    if isinstance(rules, e._Engine):
+        return _reach(rules.offsets if rules.offsets is not None else e.moore(N), N)
+    if isinstance(rules, r.Ruleset) and rules.blocks is None and rules.history is None:
+        return _reach([o for config in rules.configurations for o in config.offsets], N)
+    raise ValueError("Light cones require rules of a fixed neighborhood and a single generation")
+
+
+def _region(plane, region):
+    """
+    A region as (start, stop) per axis, given as slices or pairs.
+    """
+    if len(region) != plane.N:
+        raise ValueError("Expected a region of {} dimensions".format(plane.N))
+
+    bounds = []
+    for extent, n, mode in zip(region, plane.shape, plane.boundaries):
+        if isinstance(extent, slice):
+            if extent.step not in (None, 1):
+                raise ValueError("Regions must be contiguous")
+            extent = (0 if extent.start is None else extent.start, n if extent.stop is None else extent.stop)
+        start, stop = extent
+        if mode == pl.Plane.Boundary.TOROIDAL:
+            valid = start < stop <= start + n
+        else:
+            valid = 0 <= start < stop <= n
+        if not valid:
+            raise ValueError("Region {} does not lie within the plane".format(tuple(region)))
+        bounds.append((start, stop))
+    return bounds
+
+
+def _gather(plane, indices):
+    """
+    Array of the cells at the given indices along each axis, read straight from the packed bits.
+    """
+    layers = len(plane.bits) // plane.length
+    data = np.frombuffer(plane.bits, dtype=np.uint8)
+    data = data.reshape((layers,) + tuple(plane.padded[:-1]) + (plane.padded[-1] // 8,))
+
+    *rows, columns = indices
+    grid = data[np.ix_(np.arange(layers), *rows, columns // 8)]
+    shift = columns % 8 if pl._endian(plane.bits) == 'little' else 7 - columns % 8
+    bits = (grid >> shift.astype(np.uint8)) & 1
+
+    if layers == 1:
+        return bits[0]
+    cells = np.zeros(bits.shape[1:], dtype=np.int64)
+    for layer in range(layers):
+        cells |= bits[layer].astype(np.int64) << layer
+    return cells
+
+
+def _window(plane, cells, boundaries):
+    """
+    A plane holding a window of cells of the given plane.
+    """
+    endian = pl._endian(plane.bits)
+    if isinstance(plane, pl.MultiPlane):
+        return pl.MultiPlane.fromcells(cells, plane.depth, boundaries, endian)
+    return pl.Plane.fromcells(cells, boundaries, endian)
+
+
+def future(plane, rules, region, k, *args, offsets=None):
+    """
+    Returns the array of cells of a region of a plane @k ticks from now, as the given rules would
+    leave it, without changing the plane.
+
+    @region:  One slice or (start, stop) pair per axis. Along toroidal axes, starts may be negative
+              or stops beyond the plane, wrapping around.
+    @args:    Passed on to the rules on every tick.
+    @offsets: Neighborhood of the rules, if not derived from them (see radius).
+    """
+    bounds = _region(plane, region)
+    reach = radius(rules, plane.N) if offsets is None else _reach(offsets, plane.N)
+
+    # Cells of the window before and after the region along each axis, and whether those edges
+    # were cut from the plane (and so must be trimmed as ticks go)
+    indices, boundaries, margins, cut = [], [], [], []
+    for (start, stop), n, spread, mode in zip(bounds, plane.shape, reach, plane.boundaries):
+        margin = k * spread
+        if mode == pl.Plane.Boundary.TOROIDAL and stop - start + 2 * margin >= n:
+            # The cone wraps all the way around, so the whole axis is taken (rotated to the region)
+            indices.append(np.arange(start, start + n) % n)
+            boundaries.append(mode)
+            margins.append([0, n - (stop - start)])
+            cut.append((False, False))
+        elif mode == pl.Plane.Boundary.TOROIDAL:
+            indices.append(np.arange(start - margin, stop + margin) % n)
+            boundaries.append(pl.Plane.Boundary.ZERO)
+            margins.append([margin, margin])
+            cut.append((True, True))
+        else:
+            low, high = max(start - margin, 0), min(stop + margin, n)
+            indices.append(np.arange(low, high))
+            boundaries.append(mode)
+            margins.append([start - low, high - stop])
+            cut.append((low > 0, high < n))
+
+    window = _window(plane, _gather(plane, indices), tuple(boundaries))
+    for _ in range(k):
+        rules.apply_to(window, *args)
+
+        trim = [(min(spread, before) if low else 0, min(spread, after) if high else 0)
+                for spread, (before, after), (low, high) in zip(reach, margins, cut)]
+        if any(any(t) for t in trim):
+            view = tuple(slice(low, n - high) for (low, high), n in zip(trim, window.shape))
+            window = _window(plane, window.cells(np.int64)[view], window.boundaries)
+            for margin, (low, high) in zip(margins, trim):
+                margin[0] -= low
+                margin[1] -= high
+
+    view = tuple(slice(before, n - after) for (before, after), n in zip(margins, window.shape))
+    cells = window.cells(np.int64)[view]
+    return cells if isinstance(plane, pl.MultiPlane) else cells.astype(np.uint8)
@@ -0,0 +1,152 @@
+"""
+Searching a plane for occurrences of a pattern.
+
+A pattern is a small array of cells, each either 1 (live), 0 (dead) or -1 (don't care), and occurs
+at every origin (the position of its first cell) whose cells agree with every cell of the pattern
+that is cared about. Rather than testing every origin in turn, all origins are tested at once:
+
+* For small patterns, the plane is packed into a bitarray, and for every cell of the pattern the
+  bits are shifted by that cell's flattened offset, and AND-ed (complemented, for dead cells) into
+  a mask of the origins that still match. Each cell of the pattern costs a few word operations
+  per row of the plane.
+* For large patterns, the number of mismatching cells at every origin is instead computed as a
+  single correlation of the plane with the pattern, via FFT.
+
+Patterns wrap around toroidal axes; along any other axis, they must lie entirely within the plane.
+
+    origins = pattern.search(cam.master, pattern.GLIDER, symmetric=True)
+
+@date: October 18, 2026
+"""
+import numpy as np
+
+import plane as pl
+import engine as e
+import census
+
+
+# Cared about cells past which search correlates via FFT rather than shifting
+FFT_CELLS = 256
+
+# The glider of Life, heading south east
+GLIDER = np.array([[0, 1, 0], [0, 0, 1], [1, 1, 1]], dtype=np.int8)
+
+
+def _pattern(pattern, care=None):
+    """
+    A pattern as an array of 1, 0 and -1 (don't care).
+
+    @care: Optional mask of the cells cared about, in addition to any -1s of the pattern.
+    """
+    pattern = np.array(pattern, dtype=np.int8)
+    if care is not None:
+        pattern[np.asarray(care) == 0] = -1
+    return pattern
+
+
+def variants(pattern, care=None):
+    """
+    Every distinct rotation and reflection of a pattern (8 at most in 2D), beginning with the
+    pattern itself.
+    """
+    pattern = _pattern(pattern, care)
+    seen, distinct = set(), []
+    for permutation, mirror in census.symmetries(pattern.ndim):
+        variant = np.transpose(pattern, permutation)
+        axes = [axis for axis, flip in enumerate(mirror) if flip]
+        if axes:
+            variant = np.flip(variant, axis=axes)
+        key = (variant.shape, variant.tobytes())
+        if key not in seen:
+            seen.add(key)
+            distinct.append(np.ascontiguousarray(variant))
+    return distinct
+
+
+def _limits(plane, pattern):
+    """
+    Number of origins along each axis.
+    """
+    limits = []
+    for n, extent, mode in zip(plane.shape, pattern.shape, plane.boundaries):
+        if extent > n:
+            raise ValueError("Pattern of shape {} does not fit the plane".format(pattern.shape))
+        limits.append(n if mode == pl.Plane.Boundary.TOROIDAL else n - extent + 1)
+    return limits
+
+
+def _shifted(cells, plane, pattern, limits):
+    """
+    Mask of matching origins, by shifting and AND-ing packed bits.
+    """
+    # Extend toroidal axes so that every origin's pattern lies within the working array
+    for axis, (extent, mode) in enumerate(zip(pattern.shape, plane.boundaries)):
+        if mode == pl.Plane.Boundary.TOROIDAL and extent > 1:
+            widths = [(0, 0)] * cells.ndim
+            widths[axis] = (0, extent - 1)
+            cells = np.pad(cells, widths, mode='wrap')
+
+    bits = e.pack(cells)
+    strides = np.cumprod((pl._padded(cells.shape)[1:] + (1,))[::-1])[::-1]
+    matched = bits | ~bits
+    for offset in zip(*np.nonzero(pattern >= 0)):
+        shifted = bits << int(np.dot(offset, strides))
+        if pattern[offset]:
+            matched &= shifted
+        else:
+            matched &= ~shifted
+
+    origins = e.unpack(matched, cells.shape)
+    return origins[tuple(slice(0, n) for n in limits)]
+
+
+def _correlated(cells, plane, pattern, limits):
+    """
+    Mask of matching origins, by counting mismatches with an FFT correlation.
+    """
+    # Pad non-toroidal axes, so the circular correlation never wraps onto valid origins
+    widths = [(0, 0 if mode == pl.Plane.Boundary.TOROIDAL else extent - 1)
+              for extent, mode in zip(pattern.shape, plane.boundaries)]
+    cells = np.pad(cells.astype(np.float64), widths)
+
+    # Mismatches at x are the live cells under cells expected dead, plus the dead cells
+    # under cells expected live
+    kernel = (pattern == 0).astype(np.float64) - (pattern == 1)
+    axes = tuple(range(cells.ndim))
+    spectrum = np.fft.rfftn(cells) * np.conj(np.fft.rfftn(kernel, s=cells.shape, axes=axes))
+    mismatches = np.fft.irfftn(spectrum, s=cells.shape, axes=axes) + np.count_nonzero(pattern == 1)
+
+    origins = np.rint(mismatches[tuple(slice(0, n) for n in limits)]) == 0
+    return origins
+
+
+def search(plane, pattern, care=None, symmetric=False, method='auto'):
+    """
+    Returns the origins of every occurrence of a pattern in a plane, as an array of shape (k, N) in
+    row major order.
+
+    @care:      Optional mask of the cells of the pattern cared about (see _pattern).
+    @symmetric: Whether to also search for every rotation and reflection of the pattern. Origins are
+                then those of whichever variant matched (see variants).
+    @method:    'shift', 'fft', or 'auto' to correlate via FFT for patterns of more than FFT_CELLS
+                cells cared about.
+
+    Cells of a MultiPlane are live if they are in any nonzero state.
+    """
+    pattern = _pattern(pattern, care)
+    if pattern.ndim != plane.N:
+        raise ValueError("Expected a pattern of {} dimensions".format(plane.N))
+
+    cells = e.unpack(plane._occupied(plane.bits), plane.shape)
+    found = []
+    for variant in (variants(pattern) if symmetric else [pattern]):
+        limits = _limits(plane, variant)
+        cared = np.count_nonzero(variant >= 0)
+        if method == 'fft' or (method == 'auto' and cared > FFT_CELLS):
+            origins = _correlated(cells, plane, variant, limits)
+        else:
+            origins = _shifted(cells, plane, variant, limits)
+        found.append(np.argwhere(origins))
+
+    found = np.concatenate(found) if found else np.zeros((0, plane.N), dtype=np.int64)
+    return np.unique(found, axis=0) if symmetric else found
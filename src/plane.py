@@ -1,3 +1,4 @@
+import enum
 import random
 import operator
 import numpy as np
@@ -7,6 +8,80 @@ from bitarray import bitarray
 from collections import deque
 
 
+# Rows (the last axis of a plane) are padded to a multiple of this many bits
+WORD = 64
+
+
+def _padded(shape):
+    """
+    Shape of the underlying bits of a plane, the last axis padded to a whole number of words.
+    """
+    if len(shape) == 0:
+        return tuple(shape)
+    return tuple(shape[:-1]) + (-(-shape[-1] // WORD) * WORD,)
+
+
+def _endian(bits):
+    """
+    Bit order of a bitarray (older releases of bitarray expose this as a method).
+    """
+    endian = bits.endian
+    return endian() if callable(endian) else endian
+
+
+def pack(cells, endian='big', chunk=None):
+    """
+    Collapse an array of cells (bool or integer, nonzero cells being live) into the padded bits of
+    a plane of the same shape.
+
+    Since padded rows are a whole number of bytes, each row packs independently straight into its
+    place in a single preallocated buffer, which the returned bitarray then adopts without copying
+    (so it cannot be resized).
+
+    @chunk: Number of rows packed at a time, bounding the temporary memory used for huge planes.
+    """
+    cells = np.asarray(cells)
+    if cells.ndim == 0:
+        return bitarray([bool(cells)], endian=endian)
+
+    padded = _padded(cells.shape)
+    width = padded[-1] // 8
+    buffer = np.zeros(reduce(operator.mul, padded, 1) // 8, dtype=np.uint8)
+    rows = buffer.reshape(-1, width)
+    cells = cells.reshape(-1, cells.shape[-1])
+    used = -(-cells.shape[-1] // 8)
+    step = chunk or max(len(cells), 1)
+    for start in range(0, len(cells), step):
+        rows[start:start+step, :used] = np.packbits(cells[start:start+step], axis=-1, bitorder=endian)
+
+    return bitarray(buffer=buffer, endian=endian)
+
+
+def unpack(bits, shape, dtype=np.uint8, chunk=None):
+    """
+    Expand the (padded) bits of a plane of the given shape into an array of 0s and 1s, or of bools.
+
+    Without a chunk, every row is unpacked at once and the padding of each row dropped, so the
+    result is a view into the unpacked rows. Otherwise rows are unpacked @chunk at a time into a
+    contiguous array, bounding the temporary memory used for huge planes.
+    """
+    padded = _padded(shape)
+    size = reduce(operator.mul, padded, 1)
+    packed = np.frombuffer(bits, dtype=np.uint8)
+    if chunk is None or len(shape) == 0:
+        cells = np.unpackbits(packed, count=size, bitorder=_endian(bits)).reshape(padded)
+        cells = cells[..., :shape[-1]] if len(shape) > 0 else cells
+        return cells.view(bool) if dtype is bool else cells.astype(dtype, copy=False)
+
+    cells = np.empty(shape, dtype=dtype)
+    rows = packed[:size // 8].reshape(-1, padded[-1] // 8)
+    flat = cells.reshape(-1, shape[-1])
+    for start in range(0, len(rows), chunk):
+        unpacked = np.unpackbits(rows[start:start+chunk], axis=-1, count=shape[-1], bitorder=_endian(bits))
+        flat[start:start+chunk] = unpacked
+    return cells
+
+
 class Plane:
     """
     Represents a cell plane, with underlying usage of bitarrays.
@@ -21,16 +96,42 @@ class Plane:
     The use of just a bitarray also means it is significantly more compact, indexing of a plane should be
     more efficient, and the entire association between an N-1 dimensional grid with the current shape of
     the plane is no longer a concern.
+
+    Coordinates outside of the plane wrap around each axis when indexing. What lies beyond the edges of
+    the plane when evaluating neighborhoods however is determined by the boundary of each axis.
+
+    Each row (i.e. the last axis) is padded with zeros to a multiple of 64 bits, so that every row
+    begins on a word boundary. Moving between rows is then a whole number of words, and shifting a
+    row never crosses into its neighbors. The padding is never visible when indexing; flattened
+    indices however refer to positions in the padded bits (see flatten), which is why the bits of
+    a plane number plane.length rather than plane.size.
     """
+    class Boundary(enum.Enum):
+        """
+        Specifies what lies beyond the edges of an axis, as seen by neighborhoods.
+
+        * Toroidal boundaries wrap around to the opposite edge
+        * Zero and one boundaries act as if every cell beyond the edge is fixed to the given value
+        * Reflective boundaries mirror the plane at its edge (the edge cell itself included), so the
+          cell just beyond an edge is equivalent to the edge cell
+
+        Cells beyond the edges of several axes at once (corners) are fixed to the value of the last
+        such axis with a zero or one boundary, if any, and are otherwise wrapped or mirrored along
+        every axis.
+        """
+        TOROIDAL = 0
+        ZERO     = 1
+        ONE      = 2
+        REFLECT  = 3
 
-    def __init__(self, shape, bits = None):
+    def __init__(self, shape, bits = None, boundary = Boundary.TOROIDAL):
         """
         Construction of a plane. There are three cases:
 
         First, the user may pass in there own custom bitarray to allow manipulating the
-        data in the same manner as it is done internally. When this happens, the product
-        of the shape parameter's components must be equivalent to the length of the
-        bitarray.
+        data in the same manner as it is done internally. When this happens, the bitarray
+        must either already be padded (see above), or have exactly as many bits as there
+        are cells, in which case a padded copy is made.
 
         Otherwise, we determine a grid based off solely the shape parameter. If shape
         is the empty tuple, we have an undefined plane. Consequently nothing is in it.
@@ -39,31 +140,55 @@ class Plane:
         to the number of components in the shape. For example, @shape = (100,100,100) means
         we have a 3-D grid with 1000000 cells in total (not necessarily in the CAM, just
         the plane in question).
+
+        @boundary: Either a single Plane.Boundary applying to every axis, or one per axis.
         """
         # Keep track of dimensionality
-        self.shape = shape
+        self.shape = tuple(shape)
         self.N = len(shape)
+        self.padded = _padded(self.shape)
+
+        # Per axis boundary conditions
+        if isinstance(boundary, Plane.Boundary):
+            self.boundaries = (boundary,) * self.N
+        elif len(boundary) == self.N:
+            self.boundaries = tuple(boundary)
+        else:
+            raise ValueError("Expected {} boundaries".format(self.N))
 
         # Preprocess all index offsets instead of performing them each time accessing occurs
         prod = 1
         self.offsets = deque()
-        for d in reversed(shape):
+        for d in reversed(self.padded):
             self.offsets.appendleft(prod)
             prod *= d
 
+        # Total number of cells, and of bits once padded
+        self.size = reduce(operator.mul, self.shape, 1)
+        self.length = prod
+        self._valid = None
+
         # Allow the user to override grid construction
         if bits is not None:
-            if len(bits) != reduce(operator.mul, shape, 1):
-                raise ValueError("Shape with incorrect dimensionality")
-            self.bits = bits
+            self.bits = self._pad(bits)
         # Generate bitarray automatically
         else:
-            self.bits = reduce(operator.mul, shape, 1) * bitarray('0')
+            self.bits = self.length * bitarray('0')
 
         # Check if a plane has been updated recently
         # This should be changed to True if it is ever "ticked."
         self.dirty = False
 
+        # XOR mask of the cells changed by the last update (see delta.Delta)
+        self.changed = None
+
+        # Population and per-axis counts of live cells, maintained incrementally by update.
+        # These only describe the bitarray referenced by _tracked; if the bits are replaced
+        # or modified in any other way, they are recomputed in full when next requested
+        self._tracked = None
+        self._population = 0
+        self._marginals = []
+
     def __getitem__(self, index):
         """
         Indexing of a plane mirrors that of a numpy array.
@@ -79,18 +204,20 @@ class Plane:
         # If it does not, can simply return the new plane given the subset accessed.
         # If it does, we return the actual bit.
         if type(index) is tuple:
-            offset = sum([x*y for (x,y) in zip(index, self.offsets)]) % len(self.bits)
+            offset = self._offset(index)
             if len(index) == self.N:
                 return self.bits[offset]
             else:
                 remain = self.shape[len(index):]
                 shift = self.offsets[len(index)-1]
-                return Plane(remain, bits[offset:offset+shift])
+                return Plane(remain, self.bits[offset:offset+shift], self.boundaries[len(index):])
 
         # A list accessor allows one to access multiple elements at the offsets specified
         # by the list elements. For example, for a plane P, P[[1, 4, 6]] returns a list
         # containing the 1, 4, and 6th element.
         elif type(index) is list:
+            if self._coordinates(index):
+                return self.gather(index).tolist()
             elements = []
             for idx in index:
                 elements.append(self[idx])
@@ -99,11 +226,11 @@ class Plane:
         # Otherwise we were passed a simply number and we access the element like normal
         # (making sure to consider the shape of the plane of course)
         elif self.N == 1:
-            return self.bits[index]
+            return self.bits[index % self.size]
         else:
             delta = self.offsets[0]
-            offset = (index * delta) % len(self.bits)
-            return Plane(self.shape[1:], self.bits[offset:offset+delta])
+            offset = (index % self.shape[0]) * delta
+            return Plane(self.shape[1:], self.bits[offset:offset+delta], self.boundaries[1:])
 
     def __setitem__(self, index, value):
         """
@@ -116,25 +243,36 @@ class Plane:
         For example, with a plane P with shape (100, 100), P[0] = 1 sets the first
         100 elements (the 100 bits in the first row) to 1.
         """
+        self._tracked = None
         if type(index) is tuple:
-            offset = sum([x*y for (x,y) in zip(index, self.offsets)]) % len(self.bits)
+            offset = self._offset(index)
             if len(index) == self.N:
                 self.bits[offset] = value
             else:
-                shift = self.offsets[len(index)-1]
-                self.bits[offset:offset+shift] = value
+                self._fill(offset, self.offsets[len(index)-1], value)
 
         elif type(index) is list:
-            elements = []
+            if self._coordinates(index):
+                self.scatter(index, value)
+                return
             for idx in index:
                 self[idx] = value
 
         elif self.N == 1:
-            self.bits[index] = value
+            self.bits[index % self.size] = value
         else:
             delta = self.offsets[0]
-            offset = (index * delta) % len(self.bits)
-            self.bits[offset:offset+delta] = value
+            offset = (index % self.shape[0]) * delta
+            self._fill(offset, delta, value)
+
+    def _fill(self, offset, length, value):
+        """
+        Set every cell within the given (row aligned) span of bits, leaving the padding clear.
+        """
+        if value:
+            self.bits[offset:offset+length] = self.mask()[:length]
+        else:
+            self.bits[offset:offset+length] = 0
 
     def randomize(self):
         """
@@ -147,25 +285,148 @@ class Plane:
         method below.
         """
         if self.N > 0:
-            bit_count = reduce(operator.mul, self.shape, 1)
+            bit_count = self.length
             sequence = bin(random.randrange(0, 2**bit_count-1))[2:]
-            self.bits = bitarray(sequence.zfill(bit_count))
+            self.bits = bitarray(sequence.zfill(bit_count)) & self.mask()
+
+    def _pad(self, bits):
+        """
+        Returns the given bits if already laid out as a plane of this shape, or a padded copy if
+        they hold exactly one bit per cell.
+        """
+        if len(bits) == self.length:
+            return bits
+        if len(bits) != self.size:
+            raise ValueError("Shape with incorrect dimensionality")
+
+        packed = np.frombuffer(bits, dtype=np.uint8)
+        cells = np.unpackbits(packed, count=self.size, bitorder=_endian(bits)).reshape(self.shape)
+        return self._packed(cells, _endian(bits))
+
+    def _packed(self, cells, endian):
+        """
+        Lay out an array of cells (shaped like the plane) into padded bits.
+        """
+        return pack(cells, endian)
+
+    @classmethod
+    def frombuffer(cls, shape, buffer, endian='big', boundary=Boundary.TOROIDAL):
+        """
+        A plane adopting an existing buffer (anything supporting the buffer protocol, e.g. a numpy
+        array, bytearray or mmap) of packed, padded bits, without copying.
+
+        The plane and buffer then share memory, so writes to either are seen by the other. Note
+        writes to the buffer that bypass the plane must be followed by invalidate.
+        """
+        return cls(shape, bitarray(buffer=buffer, endian=endian), boundary)
+
+    @classmethod
+    def fromcells(cls, cells, boundary=Boundary.TOROIDAL, endian='big', chunk=None):
+        """
+        A plane holding the given array of cells (bool or integer, nonzero cells being live).
+        """
+        cells = np.asarray(cells)
+        return cls(cells.shape, pack(cells, endian, chunk), boundary)
+
+    def cells(self, dtype=np.uint8, chunk=None):
+        """
+        Returns a numpy array of the cells of the plane (see unpack).
+        """
+        return unpack(self.bits, self.shape, dtype, chunk)
+
+    def words(self):
+        """
+        Zero copy view of the packed bits as 64 bit words, shaped like the plane with the last axis
+        given in words. Writes through the view must be followed by invalidate.
+        """
+        if self.N == 0:
+            raise ValueError("Planes of no dimensions are not a whole number of words")
+        words = np.frombuffer(self.bits, dtype=np.uint64)
+        layers = len(self.bits) // self.length
+        shape = tuple(self.padded[:-1]) + (self.padded[-1] // WORD,)
+        return words.reshape(shape if layers == 1 else (layers,) + shape)
+
+    def __buffer__(self, flags):
+        """
+        The packed bits, for the buffer protocol (Python 3.12 onwards; use memoryview(plane.bits) or
+        words before that).
+        """
+        return memoryview(self.bits)
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        The cells of the plane, so numpy functions accept planes directly.
+        """
+        cells = self.matrix()
+        return cells if dtype is None else cells.astype(dtype)
+
+    def mask(self):
+        """
+        Returns a bitarray with every cell set and all padding clear.
+        """
+        if self._valid is None or _endian(self._valid) != _endian(self.bits):
+            row = bitarray(self.padded[-1] if self.N > 0 else 1, endian=_endian(self.bits))
+            row.setall(0)
+            row[:self.shape[-1] if self.N > 0 else 1] = 1
+            self._valid = row * (self.length // len(row))
+        return self._valid
+
+    def indices(self):
+        """
+        Returns an array of the flattened index of every cell (i.e. skipping the padding), in order.
+        """
+        if self.N == 0:
+            return np.zeros(1, dtype=np.int64)
+        rows = np.arange(0, self.length, self.padded[-1], dtype=np.int64)
+        return (rows[:, None] + np.arange(self.shape[-1], dtype=np.int64)).ravel()
+
+    def _offset(self, index):
+        """
+        Flattened offset of the (possibly partial) coordinates, wrapping around each axis.
+        """
+        offset = 0
+        for coor, dimen, stride in zip(index, self.shape, self.offsets):
+            offset += (coor % dimen) * stride
+
+        return offset
 
     def flatten(self, coordinates):
         """
         Given coordinates, converts them to flattened value for direct bit access.
 
-        Note this can be used for relative coordinates as well, and negative values
-        are also supported fine.
+        Negative values, or values beyond the extent of an axis, wrap around that axis. Note
+        the flattened value accounts for the padding of rows, so flattened indices range over
+        plane.length (not plane.size) values.
         """
         if len(coordinates) != self.N:
             raise ValueError("Invalid Coordinates {}".format(coordinates))
 
-        index = 0
+        return self._offset(coordinates)
+
+    def read(self, coordinates):
+        """
+        Returns the bit at the given coordinates, respecting the boundary of each axis.
+
+        Unlike indexing, coordinates beyond the edges of the plane do not necessarily wrap around.
+        This is how neighborhoods see the plane.
+        """
+        index, fixed = 0, None
         for i, coor in enumerate(coordinates):
+            dimen = self.shape[i]
+            if not 0 <= coor < dimen:
+                mode = self.boundaries[i]
+                if mode == Plane.Boundary.TOROIDAL:
+                    coor %= dimen
+                elif mode == Plane.Boundary.REFLECT:
+                    coor %= 2 * dimen
+                    if coor >= dimen:
+                        coor = 2 * dimen - 1 - coor
+                else:
+                    fixed = 0 if mode == Plane.Boundary.ZERO else 1
+                    continue
             index += coor * self.offsets[i]
 
-        return index % len(self.bits)
+        return self.bits[index] if fixed is None else fixed
 
     def unflatten(self, f_index):
         """
@@ -178,6 +439,213 @@ class Plane:
 
         return tuple(coordinates)
 
+    def _coordinates(self, index):
+        """
+        Determines whether a list index consists solely of complete coordinates.
+
+        Such lists can be handed off to the batch methods below, as opposed to indexing
+        each element separately.
+        """
+        return len(index) > 0 and all(type(idx) is tuple and len(idx) == self.N for idx in index)
+
+    def _buffer(self):
+        """
+        Returns a (writable) numpy view of the bytes backing the bitarray.
+
+        Note the bitarray cannot be resized while this view is alive.
+        """
+        return np.frombuffer(self.bits, dtype=np.uint8)
+
+    def _locate(self, f_indices):
+        """
+        Given flat indices, returns the byte each bit resides in and a mask selecting it.
+        """
+        if _endian(self.bits) == 'big':
+            shifts = 7 - (f_indices & 7)
+        else:
+            shifts = f_indices & 7
+
+        return f_indices >> 3, (1 << shifts).astype(np.uint8)
+
+    def flatten_all(self, coordinates):
+        """
+        Batch variant of flatten.
+
+        @coordinates: Array-like of shape (k, N), each row a set of coordinates. These may
+                      again be negative, and wrap around each axis.
+
+        Returns an array of the k flattened indices.
+        """
+        coordinates = np.asarray(coordinates, dtype=np.int64)
+        if coordinates.ndim == 1 and self.N == 1:
+            coordinates = coordinates.reshape(-1, 1)
+        if coordinates.ndim != 2 or coordinates.shape[1] != self.N:
+            raise ValueError("Invalid Coordinates of shape {}".format(coordinates.shape))
+
+        offsets = np.array(self.offsets, dtype=np.int64)
+        return (coordinates % np.array(self.shape, dtype=np.int64)) @ offsets
+
+    def unflatten_all(self, f_indices):
+        """
+        Batch variant of unflatten.
+
+        Returns an array of shape (k, N) of the coordinates of the k flattened indices.
+        """
+        f_indices = np.asarray(f_indices, dtype=np.int64) % self.length
+        coordinates = np.empty((len(f_indices), self.N), dtype=np.int64)
+        for i, offset in enumerate(self.offsets):
+            coordinates[:, i], f_indices = np.divmod(f_indices, offset)
+
+        return coordinates
+
+    def gather(self, coordinates):
+        """
+        Returns an array of the bits at each of the (k, N) given coordinates.
+        """
+        locations, masks = self._locate(self.flatten_all(coordinates))
+        return (self._buffer()[locations] & masks != 0).astype(np.uint8)
+
+    def scatter(self, coordinates, values):
+        """
+        Assigns bits at each of the (k, N) given coordinates.
+
+        @values: Either a single bit assigned to every coordinate, or an array of k bits.
+                 If a coordinate is repeated with conflicting values, it is set to 1.
+        """
+        self._tracked = None
+        self._assign(self.flatten_all(coordinates), values)
+
+    def _assign(self, f_indices, values):
+        """
+        Assigns the given bits (or a single bit) at the given indices of the underlying bitarray.
+        """
+        values = np.broadcast_to(np.asarray(values, dtype=bool), f_indices.shape)
+
+        buffer = self._buffer()
+        locations, masks = self._locate(f_indices[~values])
+        np.bitwise_and.at(buffer, locations, ~masks)
+        locations, masks = self._locate(f_indices[values])
+        np.bitwise_or.at(buffer, locations, masks)
+
+    def _set_indices(self, bits):
+        """
+        Returns the flattened indices of all set bits of the given bitarray.
+
+        Only bytes containing a set bit are expanded, so this is cheap for sparse bitarrays
+        (e.g. the changes between two generations).
+        """
+        packed = np.frombuffer(bits, dtype=np.uint8)
+        nonzero = np.flatnonzero(packed)
+        expanded = np.unpackbits(packed[nonzero].reshape(-1, 1), axis=1, bitorder=_endian(bits))
+        rows, columns = np.nonzero(expanded)
+        f_indices = nonzero[rows] * 8 + columns
+
+        return f_indices[f_indices < len(bits)]
+
+    def _occupied(self, bits):
+        """
+        Returns the bitarray of which cells are alive, given the underlying bits of a plane.
+        """
+        return bits
+
+    def _refresh(self):
+        """
+        Recompute population and per-axis counts if they no longer describe the current bits.
+        """
+        if self._tracked is not self.bits:
+            occupied = self._occupied(self.bits)
+            self._population = occupied.count()
+            self._marginals = []
+            if self.N > 0:
+                packed = np.frombuffer(occupied, dtype=np.uint8)
+                cells = np.unpackbits(packed, count=self.length, bitorder=_endian(occupied))
+                cells = cells.reshape(self.padded)[..., :self.shape[-1]]
+                for axis in range(self.N):
+                    others = tuple(i for i in range(self.N) if i != axis)
+                    self._marginals.append(cells.sum(axis=others, dtype=np.int64))
+            self._tracked = self.bits
+
+    def _adjust(self, f_indices, amount):
+        """
+        Incrementally add @amount to the counts of all cells at the given flattened indices.
+        """
+        self._population += amount * len(f_indices)
+        if len(f_indices) > 0:
+            coordinates = self.unflatten_all(f_indices)
+            for axis, marginal in enumerate(self._marginals):
+                np.add.at(marginal, coordinates[:, axis], amount)
+
+    def update(self, bits):
+        """
+        Replace the bits of the plane by those of the next generation.
+
+        This is how tick engines should transition a plane. The population and per-axis counts
+        are adjusted using only the cells that changed, which are returned as a bitarray mask.
+        Any bits set in the padding of rows are cleared (in a copy, leaving the given bits as they
+        are).
+        """
+        if self.N > 0 and self.padded[-1] != self.shape[-1]:
+            bits = bits & self._mask(len(bits))
+        delta = self.bits ^ bits
+        if self._tracked is self.bits and self.N > 0:
+            before, after = self._occupied(self.bits), self._occupied(bits)
+            changed = before ^ after
+            self._adjust(self._set_indices(changed & after), 1)
+            self._adjust(self._set_indices(changed & before), -1)
+            self._tracked = bits
+
+        self.bits = bits
+        self.changed = delta
+        return delta
+
+    def invalidate(self):
+        """
+        Must be called if the bits of a plane are modified in place by any means other than
+        indexing the plane, so the population and counts are recomputed.
+        """
+        self._tracked = None
+
+    @property
+    def population(self):
+        """
+        Number of live cells in the plane.
+        """
+        self._refresh()
+        return self._population
+
+    @property
+    def density(self):
+        """
+        Fraction of cells of the plane that are alive.
+        """
+        return self.population / self.size if self.size else 0.0
+
+    @property
+    def bounding_box(self):
+        """
+        Smallest box containing every live cell, as a tuple of (first, last) coordinates per axis.
+
+        Note no attempt is made to account for patterns wrapping around the edges of the plane.
+        If there are no live cells, None is returned instead.
+        """
+        self._refresh()
+        if self._population == 0:
+            return None
+
+        extents = []
+        for marginal in self._marginals:
+            occupied = np.flatnonzero(marginal)
+            extents.append((int(occupied[0]), int(occupied[-1])))
+
+        return tuple(extents)
+
+    def counts(self, axis=0):
+        """
+        Number of live cells in each slice along the given axis (e.g. per row with axis 0).
+        """
+        self._refresh()
+        return self._marginals[axis].copy()
+
     def matrix(self):
         """
         Convert bitarray into a corresponding numpy matrix.
@@ -185,6 +653,198 @@ class Plane:
         This should not be used for computation! This is merely a convenience method
         for displaying out to matplotlib via the AxesImages plotting methods.
         """
-        tmp = np.array(self.bits)
-        return np.reshape(tmp, self.shape)
+        return self.cells(chunk=self.shape[0] if self.N > 0 else None)
+
+    def _mask(self, length):
+        """
+        Mask of valid cells for the underlying bits of the plane (see MultiPlane).
+        """
+        return self.mask()
+
+
+
+class MultiPlane(Plane):
+    """
+    Represents a cell plane whose cells take on one of 2^depth states.
+
+    States are stored as @depth (padded) bit planes laid out one after another in a single contiguous
+    bitarray, the first holding the least significant bit of every cell's state. This allows
+    rules to act on whole states at a time through bitwise operations on entire bit planes, as
+    opposed to inspecting each cell separately.
+
+    Indexing mirrors that of a Plane, but full coordinates refer to integer states (and may be
+    assigned any state) instead of single bits. A cell is considered alive (with regards to
+    population and bounding boxes) if it is in any nonzero state.
+    """
+
+    def __init__(self, shape, depth, bits=None, boundary=Plane.Boundary.TOROIDAL):
+        """
+        @depth: Number of bits per cell.
+        @bits:  Optionally, the depth * length bits of the plane, laid out as described above.
+        """
+        super().__init__(shape, boundary=boundary)
+        self.depth = max(depth, 1)
+        if bits is not None:
+            if len(bits) != self.depth * self.length:
+                raise ValueError("Shape with incorrect dimensionality")
+            self.bits = bits
+        else:
+            self.bits = self.depth * self.length * bitarray('0')
+
+    @property
+    def states(self):
+        """
+        Number of distinct states a cell may take on.
+        """
+        return 2 ** self.depth
 
+    def layer(self, i):
+        """
+        Returns a copy of the ith bit plane.
+        """
+        return self.bits[i*self.length:(i+1)*self.length]
+
+    def layers(self):
+        """
+        Returns copies of all bit planes, least significant first.
+        """
+        return [self.layer(i) for i in range(self.depth)]
+
+    def join(self, layers):
+        """
+        Builds the underlying bits of a plane of this shape out of the given bit planes.
+
+        The result is intended to be passed to update.
+        """
+        bits = bitarray(endian=_endian(self.bits))
+        for layer in layers:
+            bits += layer
+        return bits
+
+    def _occupied(self, bits):
+        """
+        A cell is alive if any of its state bits are set.
+        """
+        occupied = bits[:self.length]
+        for i in range(1, self.depth):
+            occupied |= bits[i*self.length:(i+1)*self.length]
+        return occupied
+
+    def __getitem__(self, index):
+        """
+        Full coordinates return the state of a cell; partial coordinates return a MultiPlane.
+        """
+        if type(index) is tuple and len(index) == self.N:
+            offset = self.flatten(index)
+            return sum(self.bits[i*self.length + offset] << i for i in range(self.depth))
+
+        elif type(index) is list:
+            if self._coordinates(index):
+                return self.gather(index).tolist()
+            return [self[idx] for idx in index]
+
+        elif self.N == 1:
+            return self[(index,)]
+
+        else:
+            if type(index) is not tuple:
+                index = (index,)
+            offset = self._offset(index)
+            shift = self.offsets[len(index)-1]
+            remain = self.shape[len(index):]
+            bits = self.join(self.bits[i*self.length+offset:i*self.length+offset+shift] for i in range(self.depth))
+            return MultiPlane(remain, self.depth, bits, self.boundaries[len(index):])
+
+    def __setitem__(self, index, value):
+        """
+        Assigns a state to a cell or all cells of a given (partial) index.
+        """
+        self._tracked = None
+        if type(index) is list:
+            if self._coordinates(index):
+                self.scatter(index, value)
+            else:
+                for idx in index:
+                    self[idx] = value
+            return
+
+        if type(index) is not tuple:
+            index = (index,)
+        offset = self._offset(index)
+        shift = self.offsets[len(index)-1]
+        for i in range(self.depth):
+            self._fill(i*self.length + offset, shift, (value >> i) & 1)
+
+    def randomize(self):
+        """
+        Sets every cell to a random state.
+        """
+        if self.N > 0:
+            bit_count = self.depth * self.length
+            sequence = bin(random.getrandbits(bit_count))[2:]
+            self.bits = bitarray(sequence.zfill(bit_count)) & self._mask(bit_count)
+
+    def _mask(self, length):
+        """
+        The mask of valid cells repeated for every bit plane.
+        """
+        return self.mask() * (length // self.length)
+
+    def gather(self, coordinates):
+        """
+        Returns an array of the states at each of the (k, N) given coordinates.
+        """
+        f_indices = self.flatten_all(coordinates)
+        buffer = self._buffer()
+        states = np.zeros(len(f_indices), dtype=np.int64)
+        for i in range(self.depth):
+            locations, masks = self._locate(f_indices + i*self.length)
+            states |= (buffer[locations] & masks != 0).astype(np.int64) << i
+
+        return states
+
+    def scatter(self, coordinates, values):
+        """
+        Assigns states at each of the (k, N) given coordinates.
+
+        @values: Either a single state assigned to every coordinate, or an array of k states.
+        """
+        self._tracked = None
+        f_indices = self.flatten_all(coordinates)
+        values = np.asarray(values, dtype=np.int64)
+        for i in range(self.depth):
+            self._assign(f_indices + i*self.length, (values >> i) & 1)
+
+    def matrix(self):
+        """
+        Convert the bit planes into a numpy matrix of states.
+        """
+        return self.cells(np.int64)
+
+    def cells(self, dtype=np.uint8, chunk=None):
+        """
+        Returns a numpy array of the states of every cell.
+        """
+        states = np.zeros(self.shape, dtype=dtype)
+        for i in range(self.depth):
+            states |= unpack(self.layer(i), self.shape, dtype, chunk) << i
+        return states
+
+    @classmethod
+    def frombuffer(cls, shape, depth, buffer, endian='big', boundary=Plane.Boundary.TOROIDAL):
+        """
+        A plane adopting an existing buffer of @depth packed bit planes, without copying (see
+        Plane.frombuffer).
+        """
+        return cls(shape, depth, bitarray(buffer=buffer, endian=endian), boundary)
+
+    @classmethod
+    def fromcells(cls, cells, depth, boundary=Plane.Boundary.TOROIDAL, endian='big', chunk=None):
+        """
+        A plane holding the given array of states.
+        """
+        cells = np.asarray(cells)
+        bits = bitarray(endian=endian)
+        for i in range(depth):
+            bits += pack((cells >> i) & 1, endian, chunk)
+        return cls(cells.shape, depth, bits, boundary)
@@ -0,0 +1,243 @@
+"""
+Deterministic record and replay of CAM runs.
+
+A replay log holds everything needed to re-run a CAM from the start: the bits of every plane, the
+rule's notation, the seed of the random generators, the CAM's tick schedule (see CAM.ticks) and,
+every @every ticks, a checksum of the master plane. Replaying a log re-runs it, comparing checksums
+as it goes, and reports the first tick whose generation differs from the one recorded.
+
+Checksums are CRC32s of bands of the master plane (consecutive rows along its first axis, or words
+of a 1D plane), so a divergence is also narrowed down to the bands that differ. They cost a single
+pass over the bits per checked tick, and a few bytes of log each.
+
+Logs are JSON lines: a header, followed by one line per checked tick. Since a log only depends on
+the rule and not on how it was run, a log recorded with the reference Ruleset can verify any engine
+of the same rule at scale:
+
+    python src/replay.py life.log --engine
+
+@date: October 18, 2026
+"""
+import sys
+import json
+import zlib
+import base64
+import random
+import argparse
+import numpy as np
+
+from bitarray import bitarray
+
+import cam
+import plane as pl
+import cam_parser
+
+
+# Version of the log format
+VERSION = 1
+
+
+def _bands(plane, bands):
+    """
+    Extents of the bands of a plane along its first axis, as a list of (start, stop) units, along
+    with the number of bits per unit (a row, or a word for 1D planes).
+    """
+    if plane.N > 1:
+        units, width = plane.shape[0], plane.offsets[0]
+    else:
+        units, width = max(plane.length // pl.WORD, 1), min(plane.length, pl.WORD)
+    step = -(-units // max(min(bands, units), 1))
+    return [(start, min(start + step, units)) for start in range(0, units, step)], width
+
+
+def checksum(plane, bands=16):
+    """
+    Returns the CRC32 of each band of a plane (see above). Bands of a MultiPlane cover every one of
+    its bit planes.
+    """
+    extents, width = _bands(plane, bands)
+    view = memoryview(plane.bits)
+    layers = len(plane.bits) // plane.length
+    sums = []
+    for start, stop in extents:
+        crc = 0
+        for layer in range(layers):
+            first = (layer * plane.length + start * width) // 8
+            last = (layer * plane.length + stop * width + 7) // 8
+            crc = zlib.crc32(view[first:last], crc)
+        sums.append(crc)
+    return sums
+
+
+def _encode(bits):
+    """
+    Bits as a JSON friendly dict.
+    """
+    return {'length': len(bits), 'endian': pl._endian(bits), 'data': base64.b64encode(bits.tobytes()).decode('ascii')}
+
+
+def _decode(encoded):
+    """
+    Bits encoded by _encode.
+    """
+    bits = bitarray(endian=encoded['endian'])
+    bits.frombytes(base64.b64decode(encoded['data']))
+    del bits[encoded['length']:]
+    return bits
+
+
+def _seed(seed):
+    """
+    Seed every random generator a rule may draw from.
+    """
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed % 2 ** 32)
+
+
+class Recorder:
+    """
+    Writes the replay log of a CAM to a text stream, from its current state onwards.
+    """
+
+    def __init__(self, stream, cam, rule, seed=None, every=1, bands=16):
+        """
+        The header is written immediately, and the random generators seeded.
+
+        @rule:  Notation of the rule the CAM is run with (see CAMParser), or None if the rule
+                cannot be written down (in which case replays must be given the rules to run).
+        @seed:  Seed of Python's and numpy's random generators, reseeded on replay.
+        @every: Number of ticks between checksums.
+        @bands: Number of bands each checksum is broken into.
+        """
+        self.stream = stream
+        self.cam = cam
+        self.every = max(every, 1)
+        self.bands = bands
+
+        header = {
+            'version': VERSION,
+            'rule': rule,
+            'seed': seed,
+            'shape': list(cam.master.shape),
+            'depth': getattr(cam.master, 'depth', 1),
+            'boundaries': [b.name for b in cam.master.boundaries],
+            'ticks': [list(t) for t in cam.ticks],
+            'total': cam.total,
+            'every': self.every,
+            'bands': bands,
+            'planes': [_encode(p.bits) for p in cam.planes],
+        }
+        stream.write(json.dumps(header) + '\n')
+        _seed(seed)
+
+    def record(self):
+        """
+        Write the checksum of the CAM's current generation, if it is due one.
+        """
+        if self.cam.total % self.every == 0:
+            line = {'tick': self.cam.total, 'checksum': checksum(self.cam.master, self.bands)}
+            self.stream.write(json.dumps(line) + '\n')
+
+    def run(self, rules, count, *args):
+        """
+        Tick the CAM @count times, recording every tick.
+        """
+        for _ in range(count):
+            self.cam.tick(rules, *args)
+            self.record()
+        self.stream.flush()
+
+
+class Divergence:
+    """
+    The first generation of a replay not matching its log.
+
+    @tick:    The tick diverged on.
+    @bands:   Indices of the bands that differ.
+    @regions: Extents (start, stop) of those bands, in rows along the first axis of the plane (or
+              cells, for 1D planes).
+    """
+
+    def __init__(self, tick, bands, regions):
+        self.tick = tick
+        self.bands = bands
+        self.regions = regions
+
+    def __repr__(self):
+        return 'Divergence(tick={}, regions={})'.format(self.tick, self.regions)
+
+
+def load(stream):
+    """
+    Returns the header of a log, and an iterator over its checksum lines.
+    """
+    header = json.loads(stream.readline())
+    if header.get('version') != VERSION:
+        raise ValueError("Unsupported replay log version {}".format(header.get('version')))
+    return header, (json.loads(line) for line in stream if line.strip())
+
+
+def restore(header):
+    """
+    Construct the CAM a log begins with.
+    """
+    boundaries = tuple(pl.Plane.Boundary[b] for b in header['boundaries'])
+    restored = cam.CAM(len(header['planes']), tuple(header['shape']), depth=header['depth'], boundary=boundaries)
+    for p, encoded in zip(restored.planes, header['planes']):
+        p.bits = _decode(encoded)
+    restored.ticks = [tuple(t) for t in header['ticks']]
+    restored.total = header['total']
+    return restored
+
+
+def replay(stream, rules=None, *args, engine=False):
+    """
+    Re-run a log, returning the first Divergence from it, or None if every checksum matches.
+
+    @rules:  Rules to run the log with, taking the place of those given by its notation.
+    @engine: When running the log's notation, use the rule's vectorized engine rather than its
+             reference ruleset (see CAMParser).
+    """
+    header, lines = load(stream)
+    restored = restore(header)
+    if rules is None:
+        if header['rule'] is None:
+            raise ValueError("Log has no rule notation; rules must be given")
+        parser = cam_parser.CAMParser(header['rule'], restored)
+        rules = parser.engine if engine else parser.ruleset
+
+    _seed(header['seed'])
+    extents, width = _bands(restored.master, header['bands'])
+    if restored.master.N <= 1:
+        extents = [(start * width, stop * width) for start, stop in extents]
+
+    for line in lines:
+        while restored.total < line['tick']:
+            restored.tick(rules, *args)
+        actual = checksum(restored.master, header['bands'])
+        if actual != line['checksum']:
+            bands = [i for i, (a, b) in enumerate(zip(actual, line['checksum'])) if a != b]
+            return Divergence(line['tick'], bands, [extents[i] for i in bands])
+
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('log', help="Replay log to verify")
+    parser.add_argument('--engine', action='store_true', help="Run the rule's vectorized engine")
+    options = parser.parse_args(argv)
+
+    with open(options.log) as f:
+        divergence = replay(f, engine=options.engine)
+
+    if divergence is None:
+        print("Replay matches log")
+        return 0
+    print("First divergence at tick {}, in regions {}".format(divergence.tick, divergence.regions))
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,212 @@
+"""
+Bounded history of the generations of a CAM, for stepping backwards through a run.
+
+Keeping a copy of every generation is prohibitive for all but the smallest planes. Instead, history
+is kept as segments, each beginning with a keyframe (the compressed bits of every plane) followed by
+the compressed deltas (see delta.Delta) of up to @keyframe - 1 following generations. Any retained
+generation is rebuilt by decompressing the keyframe of its segment and applying deltas forward.
+
+Rules that keep state of their own per plane are restored along with the bits when given: block
+(Margolus) rules record the partition of every plane at every generation, and second order rules
+the generation preceding each keyframe (others precede a generation held in history anyway), so
+that ticking on after a seek retraces the recorded run.
+
+History is bounded by a byte budget. Once exceeded, whole segments are evicted oldest first (a delta
+is of no use without the keyframe it leads from), though the newest segment is always kept.
+
+    history = rewind.Rewind(cam, budget=16 * 2 ** 20)
+    cam.tick(rules)
+    history.record()
+    ...
+    history.seek(cam.total - 10)
+
+@date: October 18, 2026
+"""
+import zlib
+
+from bitarray import bitarray
+
+import delta
+import engine as e
+import plane as pl
+
+
+class _Segment:
+    """
+    A keyframe and the deltas of the generations directly following it.
+    """
+
+    def __init__(self, start, keyframe, previous=None):
+        self.start = start
+        self.keyframe = keyframe
+        self.previous = previous
+        self.deltas = []
+        self.phases = []
+        self.nbytes = sum(len(k) for k in keyframe) + sum(len(p) for p in previous or [])
+
+    @property
+    def stop(self):
+        """
+        The last generation held.
+        """
+        return self.start + len(self.deltas)
+
+
+class Rewind:
+    """
+    Keyframes and deltas of the generations of a CAM, within a byte budget.
+
+    Generations are recorded by calling record after each tick, beginning with the generation the
+    CAM is in when the history is constructed. Recording a generation at or before the newest one
+    held (e.g. after seeking back and ticking on) discards every generation from it onwards first.
+    """
+
+    def __init__(self, cam, budget=64 * 2 ** 20, keyframe=32, level=1, rules=None):
+        """
+        @budget:   Maximum number of bytes of compressed keyframes and deltas held.
+        @keyframe: Number of generations per segment, i.e. between keyframes.
+        @level:    zlib compression level.
+        @rules:    The rules the CAM is ticked with, whose state is restored on seeking (see above).
+        """
+        self.cam = cam
+        self.blocks = rules if isinstance(rules, e.Margolus) else getattr(rules, 'blocks', None)
+        history = getattr(rules, 'history', None)
+        self.generations = history if isinstance(history, e.History) else None
+        self.budget = budget
+        self.keyframe = max(keyframe, 1)
+        self.level = level
+        self.nbytes = 0
+        self._segments = []
+        self._layout = [(len(p.bits), pl._endian(p.bits)) for p in cam.planes]
+        self._last = None
+        self.record()
+
+    def __contains__(self, tick):
+        return bool(self._segments) and self.first <= tick <= self.last
+
+    def __len__(self):
+        return sum(len(s.deltas) + 1 for s in self._segments)
+
+    @property
+    def first(self):
+        """
+        The oldest generation held.
+        """
+        return self._segments[0].start
+
+    @property
+    def last(self):
+        """
+        The newest generation held.
+        """
+        return self._segments[-1].stop
+
+    def _truncate(self, tick):
+        """
+        Discard every generation from @tick onwards.
+        """
+        while self._segments and self._segments[-1].start >= tick:
+            self.nbytes -= self._segments.pop().nbytes
+        if self._segments and self.last >= tick:
+            segment = self._segments[-1]
+            for dropped in segment.deltas[tick - segment.start - 1:]:
+                nbytes = sum(len(d) for d in dropped)
+                segment.nbytes -= nbytes
+                self.nbytes -= nbytes
+            del segment.deltas[tick - segment.start - 1:]
+            del segment.phases[tick - segment.start:]
+            self._last = None
+
+    def record(self):
+        """
+        Add the CAM's current generation to the history.
+        """
+        tick = self.cam.total
+        bits = [p.bits.copy() for p in self.cam.planes]
+        if self._segments and tick <= self.last:
+            self._truncate(tick)
+
+        segment = self._segments[-1] if self._segments else None
+        if segment is None or self._last is None or tick != self.last + 1 or len(segment.deltas) + 1 >= self.keyframe:
+            previous = None
+            if self.generations is not None:
+                previous = [zlib.compress(self.generations.previous(p).tobytes(), self.level) for p in self.cam.planes]
+            segment = _Segment(tick, [zlib.compress(b.tobytes(), self.level) for b in bits], previous)
+            self._segments.append(segment)
+            self.nbytes += segment.nbytes
+        else:
+            changes = [zlib.compress(delta.Delta.between(a, b).tobytes(), self.level) for a, b in zip(self._last, bits)]
+            segment.deltas.append(changes)
+            nbytes = sum(len(c) for c in changes)
+            segment.nbytes += nbytes
+            self.nbytes += nbytes
+        if self.blocks is not None:
+            segment.phases.append([self.blocks.phase(p) for p in self.cam.planes])
+        self._last = bits
+
+        # Evict the oldest segments beyond the budget
+        while self.nbytes > self.budget and len(self._segments) > 1:
+            self.nbytes -= self._segments.pop(0).nbytes
+
+    def _segment(self, tick):
+        """
+        The segment holding the given generation.
+        """
+        return next(s for s in reversed(self._segments) if s.start <= tick)
+
+    def _decompress(self, compressed):
+        """
+        Bits of every plane, from their compressed bytes.
+        """
+        planes = []
+        for data, (length, endian) in zip(compressed, self._layout):
+            bits = bitarray(endian=endian)
+            bits.frombytes(zlib.decompress(data))
+            del bits[length:]
+            planes.append(bits)
+        return planes
+
+    def bits(self, tick):
+        """
+        Rebuild the bits of every plane of the given generation.
+        """
+        if tick not in self:
+            raise KeyError("Generation {} is not held".format(tick))
+
+        segment = self._segment(tick)
+        planes = self._decompress(segment.keyframe)
+        for changes in segment.deltas[:tick - segment.start]:
+            for bits, change in zip(planes, changes):
+                delta.Delta.frombytes(zlib.decompress(change)).xor(bits)
+        return planes
+
+    def seek(self, tick):
+        """
+        Return the CAM to the given generation.
+
+        Further recording continues from there (discarding generations after it), unless the
+        CAM is moved forward by seeking instead.
+        """
+        segment = self._segment(tick) if tick in self else None
+        for p, bits in zip(self.cam.planes, self.bits(tick)):
+            p.update(bits)
+            p.dirty = True
+        self.cam.total = tick
+
+        if self.blocks is not None:
+            for p, phase in zip(self.cam.planes, segment.phases[tick - segment.start]):
+                self.blocks.reset(p, phase)
+        if self.generations is not None:
+            previous = self._decompress(segment.previous) if tick == segment.start else self.bits(tick - 1)
+            for p, bits in zip(self.cam.planes, previous):
+                self.generations.seed(p, bits)
+        self._last = None if tick != self.last else [p.bits.copy() for p in self.cam.planes]
+
+    def step_back(self):
+        """
+        Return the CAM to its previous generation, if held. Returns whether it was.
+        """
+        if self.cam.total - 1 not in self:
+            return False
+        self.seek(self.cam.total - 1)
+        return True
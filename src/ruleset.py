@@ -1,5 +1,7 @@
 import enum
+import time
 import numpy as np
+import engine as e
 import configuration as c
 
 from bitarray import bitarray
@@ -33,21 +35,46 @@ class Ruleset:
         * Always passing allows the first configuration to always yield a success. It is redundant to add
           any additional configurations in this case (in fact it is inefficient since neighborhoods are computer
           in advance).
+        * Margolus rules ignore configurations altogether. Instead, the plane is partitioned into 2x2 (or 2x2x2,
+          etc.) blocks, alternating between even and odd partitions every application, and each block is
+          replaced according to a table (see engine.Margolus).
         """
         MATCH       = 0
         TOLERATE    = 1
         SATISFY     = 2
         ALWAYS_PASS = 3
+        MARGOLUS    = 4
 
-    def __init__(self, method):
+    def __init__(self, method, table=None, second_order=False):
         """
         A ruleset does not begin with any configurations; only a means of verifying them.
 
-        @method: One of the values defined in the Ruleset.Method enumeration. View class for description.
+        @method:       One of the values defined in the Ruleset.Method enumeration. View class for description.
+        @table:        The block table of a Margolus ruleset, e.g. engine.BILLIARD_BALL.
+        @second_order: Whether the ruleset depends on the previous generation as well. If so, the states
+                       given by configurations are XORed with the previous generation of the plane, which
+                       makes the ruleset reversible (see reverse).
         """
         self.method = method
         self.configurations = []
 
+        # Block rules are applied to the entire plane at once
+        self.blocks = None
+        if method == Ruleset.Method.MARGOLUS:
+            if table is None:
+                raise ValueError("Margolus rulesets require a block table")
+            self.blocks = e.Margolus(table)
+
+        # Previous generations of second order rulesets
+        self.history = None
+        if second_order:
+            if self.blocks is not None:
+                raise ValueError("Margolus rulesets cannot be second order")
+            self.history = e.History()
+
+        # Optional instrument.Instrument, reporting on each application (see CAM.instrument)
+        self.instrument = None
+
     def apply_to(self, plane, *args):
         """
         Depending on the set method, applies ruleset to each cell in the plane.
@@ -58,6 +85,15 @@ class Ruleset:
                value of its neighbors.
         """
 
+        if self.blocks is not None:
+            self.blocks.instrument = self.instrument
+            self.blocks.apply_to(plane)
+            return
+
+        # Timings are only taken when instrumented (checked once per configuration)
+        inst = self.instrument
+        passes = []
+
         # These are the states of configurations that pass (note if all configurations
         # fail for any state, the state remains the same)
         next_plane = plane.bits.copy()
@@ -65,11 +101,19 @@ class Ruleset:
         # These are the states we attempt to apply a configuration to
         # Since totals are computed for a configuration at once, we save
         # which states do not pass for each configuration
-        current_states = enumerate(plane.bits)
+        remaining = plane.size
+        current_states = ((index, plane.bits[index]) for index in plane.indices().tolist())
         for config in self.configurations:
 
+            if inst is not None:
+                start = time.perf_counter()
+
             totals = c.Neighborhood.get_totals(plane, config.offsets)
 
+            if inst is not None:
+                counted = time.perf_counter()
+                inst.phase('counting', counted - start)
+
             # Determine which function should be used to test success
             if self.method == Ruleset.Method.MATCH:
                 vfunc = config.matches
@@ -81,13 +125,14 @@ class Ruleset:
                 vfunc = lambda *args: True
 
             next_states = []
+            neighborhood = c.Neighborhood(0)
             for index, state in current_states:
 
                 # Passes a mostly uninitialized neighborhood to the given function
                 # Note if you need actual states of the neighborhood, make sure to
-                # call the neighborhood's populate function
-                neighborhood = c.Neighborhood(index)
-                neighborhood.total = totals[index]
+                # call the neighborhood's populate function. The same neighborhood is
+                # moved across every cell, so callbacks should not hold on to it
+                neighborhood.move(index, totals[index])
 
                 # Apply changes to for any successful configurations
                 success, to_state = config.passes(plane, neighborhood, vfunc, *args)
@@ -98,6 +143,28 @@ class Ruleset:
 
             current_states = next_states
 
+            if inst is not None:
+                inst.phase('rules', time.perf_counter() - counted)
+                passes.append(remaining - len(next_states))
+                remaining = len(next_states)
+
         # All configurations tested, transition plane
-        plane.bits = next_plane
+        if inst is not None:
+            start = time.perf_counter()
+
+        if self.history is not None:
+            next_plane = self.history.advance(plane, next_plane)
+        delta = plane.update(next_plane)
 
+        if inst is not None:
+            inst.phase('swap', time.perf_counter() - start)
+            inst.applied(self, passes, delta.count())
+
+    def reverse(self, plane):
+        """
+        Exchange the current and previous generations of the plane, so that applying a second order
+        ruleset from here on retraces the plane's earlier generations.
+        """
+        if self.history is None:
+            raise ValueError("Only second order rulesets can be reversed")
+        return self.history.reverse(plane)
@@ -0,0 +1,250 @@
+"""
+Headless batch runs of rules.
+
+A job runs a rule (given by its notation, see CAMParser) on a plane of a given shape, from either a
+random soup or an initial pattern file, for a number of steps as fast as its engine allows (no
+display and no scheduling). Any of the following may be written out:
+
+* A checkpoint of the final generation, as a .npy array of cells (which can itself be given as the
+  pattern of a later job, to continue the run).
+* The diff stream of every step, as length prefixed delta.Delta records (see delta.dump).
+* Statistics of the run, including its throughput in ticks and cells per second, as JSON.
+
+Patterns are read from .npy arrays, run length encoded .rle files, or plain text files (rows of '.'
+for dead and 'O' or '*' for live cells, with lines beginning '!' ignored), and are placed at the
+center of the plane.
+
+Jobs can also be run as a batch, from a manifest of one JSON object per line giving the parameters
+of run (relative paths being taken from the manifest's directory). Jobs run in a pool of worker
+processes, one per CPU by default, and each job's statistics are printed as it completes:
+
+    python src/runner.py run --rule B3/S23 --shape 1024 1024 --steps 1000 --stats life.json
+    python src/runner.py batch jobs.jsonl --workers 8
+
+@date: October 18, 2026
+"""
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import numpy as np
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import cam
+import delta
+import plane as pl
+import cam_parser
+
+
+# Parameters of run holding paths, resolved relative to the manifest of a batch
+PATHS = ('pattern', 'checkpoint', 'deltas', 'stats')
+
+
+def _rle(text):
+    """
+    Cells of a run length encoded pattern.
+    """
+    lines = [line for line in text.splitlines() if line.strip() and not line.startswith('#')]
+    if lines and lines[0].lstrip().startswith('x'):
+        lines = lines[1:]
+
+    rows, row = [], []
+    for count, tag in re.findall(r'(\d*)([bo$!A-Za-z.])', ''.join(lines)):
+        count = int(count) if count else 1
+        if tag == '!':
+            break
+        elif tag == '$':
+            rows.append(row)
+            rows.extend([[]] * (count - 1))
+            row = []
+        else:
+            row.extend([0 if tag in 'b.' else 1] * count)
+    rows.append(row)
+
+    width = max(len(r) for r in rows)
+    return np.array([r + [0] * (width - len(r)) for r in rows], dtype=np.uint8)
+
+
+def _plaintext(text):
+    """
+    Cells of a plain text pattern.
+    """
+    rows = [line.rstrip() for line in text.splitlines() if not line.startswith('!')]
+    while rows and not rows[-1]:
+        rows.pop()
+    width = max((len(r) for r in rows), default=0)
+    return np.array([[1 if ch in 'O*' else 0 for ch in r.ljust(width, '.')] for r in rows], dtype=np.uint8)
+
+
+def read_pattern(path):
+    """
+    Returns the array of cells of a pattern file (see above).
+    """
+    if path.endswith('.npy'):
+        return np.load(path)
+    with open(path) as f:
+        text = f.read()
+    return _rle(text) if path.endswith('.rle') else _plaintext(text)
+
+
+def _place(pattern, shape):
+    """
+    An array of cells of the given shape, with the pattern at its center.
+    """
+    pattern = np.asarray(pattern)
+    if pattern.ndim != len(shape) or any(p > n for p, n in zip(pattern.shape, shape)):
+        raise ValueError("Pattern of shape {} does not fit a plane of shape {}".format(pattern.shape, shape))
+    cells = np.zeros(shape, dtype=pattern.dtype)
+    cells[tuple(slice((n - p) // 2, (n - p) // 2 + p) for p, n in zip(pattern.shape, shape))] = pattern
+    return cells
+
+
+def run(rule, shape, steps, seed=0, density=0.5, pattern=None, engine='engine', boundary='TOROIDAL',
+        depth=1, checkpoint=None, deltas=None, stats=None):
+    """
+    Run a single job, returning its statistics.
+
+    @rule:       Notation of the rule (see CAMParser).
+    @shape:      Number of cells along each axis.
+    @steps:      Number of ticks to run.
+    @seed:       Seed of the random soup, when no pattern is given.
+    @density:    Fraction of live cells of the random soup.
+    @pattern:    Path of the pattern the plane begins with (see read_pattern).
+    @engine:     'engine' to run the rule's vectorized engine, or 'ruleset' for its reference ruleset.
+    @boundary:   Name of the plane.Plane.Boundary of every axis.
+    @depth:      Number of bits per cell (enough to hold every state of Generations rules).
+    @checkpoint: Path the final generation is saved to, as a .npy array of cells.
+    @deltas:     Path the delta of every tick is written to (see delta.dump).
+    @stats:      Path the statistics are written to, as JSON.
+    """
+    if engine not in ('engine', 'ruleset'):
+        raise ValueError("Unknown engine {}".format(engine))
+
+    shape = tuple(shape)
+    machine = cam.CAM(1, shape, depth=depth, boundary=pl.Plane.Boundary[boundary])
+    if pattern is not None:
+        cells = _place(read_pattern(pattern), shape)
+    else:
+        cells = (np.random.default_rng(seed).random(shape) < density).astype(np.uint8)
+    master = machine.master
+    if depth > 1:
+        loaded = pl.MultiPlane.fromcells(cells, depth, master.boundaries, pl._endian(master.bits))
+    else:
+        loaded = pl.Plane.fromcells(cells, master.boundaries, pl._endian(master.bits))
+    master.bits = loaded.bits
+
+    parser = cam_parser.CAMParser(rule, machine)
+    rules = getattr(parser, engine)
+
+    written = 0
+    began = time.perf_counter()
+    if deltas is not None:
+        with open(deltas, 'wb') as f:
+            written = delta.dump((change for _, change in machine.deltas(rules, count=steps)), f)
+    else:
+        for _ in range(steps):
+            machine.tick(rules)
+    seconds = time.perf_counter() - began
+
+    if checkpoint is not None:
+        np.save(checkpoint, machine.master.cells())
+
+    record = {
+        'rule': rule,
+        'shape': list(shape),
+        'engine': engine,
+        'steps': steps,
+        'seconds': seconds,
+        'ticks_per_second': steps / seconds if seconds > 0 else 0.0,
+        'cells_per_second': steps * machine.master.size / seconds if seconds > 0 else 0.0,
+        'population': machine.master.population,
+        'delta_bytes': written,
+    }
+    if stats is not None:
+        with open(stats, 'w') as f:
+            json.dump(record, f, indent=2)
+    return record
+
+
+def _run(job):
+    """
+    Entry point of workers.
+    """
+    return run(**job)
+
+
+def manifest(path):
+    """
+    Returns the jobs of a manifest file, with paths resolved relative to it.
+    """
+    root = os.path.dirname(os.path.abspath(path))
+    jobs = []
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                job = json.loads(line)
+                for key in PATHS:
+                    if job.get(key) is not None:
+                        job[key] = os.path.join(root, job[key])
+                jobs.append(job)
+    return jobs
+
+
+def batch(jobs, workers=None):
+    """
+    Run jobs in a pool of worker processes, yielding pairs of the index of each job and its
+    statistics as it completes.
+
+    @workers: Number of worker processes (defaults to the number of CPUs).
+    """
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_run, job): i for i, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def _summary(record):
+    return "{} {}: {} ticks in {:.3f}s ({:.1f} ticks/s, {:.2f} Mcells/s), population {}".format(
+        record['rule'], 'x'.join(str(n) for n in record['shape']), record['steps'], record['seconds'],
+        record['ticks_per_second'], record['cells_per_second'] / 1e6, record['population'])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    single = commands.add_parser('run', help="Run a single job")
+    single.add_argument('--rule', required=True, help="Rule notation, e.g. B3/S23")
+    single.add_argument('--shape', type=int, nargs='+', default=[256, 256], help="Cells along each axis")
+    single.add_argument('--steps', type=int, default=100, help="Number of ticks")
+    single.add_argument('--seed', type=int, default=0, help="Seed of the random soup")
+    single.add_argument('--density', type=float, default=0.5, help="Fraction of live cells of the soup")
+    single.add_argument('--pattern', help="Initial pattern (.npy, .rle or plain text)")
+    single.add_argument('--engine', choices=['engine', 'ruleset'], default='engine')
+    single.add_argument('--boundary', choices=[b.name for b in pl.Plane.Boundary], default='TOROIDAL')
+    single.add_argument('--depth', type=int, default=1, help="Bits per cell")
+    single.add_argument('--checkpoint', help="Save the final generation to this .npy file")
+    single.add_argument('--deltas', help="Write the delta of every tick to this file")
+    single.add_argument('--stats', help="Write statistics to this JSON file")
+
+    many = commands.add_parser('batch', help="Run the jobs of a manifest")
+    many.add_argument('manifest', help="File of one JSON object of run parameters per line")
+    many.add_argument('--workers', type=int, help="Number of worker processes")
+
+    options = vars(parser.parse_args(argv))
+    command = options.pop('command')
+    if command == 'run':
+        print(_summary(run(**options)))
+    else:
+        jobs = manifest(options['manifest'])
+        for i, record in batch(jobs, options['workers']):
+            print("[{}/{}] {}".format(i + 1, len(jobs), _summary(record)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""
+Drift free scheduling of ticks.
+
+Sleeping for a fixed clock between ticks makes the real period the clock plus however long ticking
+and drawing took, so a run slows down the larger its planes get. A Scheduler instead targets a fixed
+rate of ticks per second against monotonic deadlines: the nth tick is due n / rate seconds after the
+schedule began, however long earlier ticks took.
+
+When a frame (drawing, say) overruns, every tick that has come due since is run before the next
+frame, so the simulation keeps pace and frames are skipped instead. Only once more than @catchup
+ticks are due at once (i.e. ticking alone cannot keep up) is the backlog dropped, and the schedule
+slides back to the present rather than trying to make up for it later.
+
+    schedule = Scheduler(rate=30)
+    while True:
+        for _ in range(schedule.wait()):
+            cam.tick(rules)
+        draw()
+
+@date: October 18, 2026
+"""
+import time
+
+
+class Scheduler:
+    """
+    Deadlines of ticks at a target rate.
+    """
+
+    def __init__(self, rate=None, catchup=8, clock=time.monotonic, sleep=time.sleep):
+        """
+        @rate:    Target ticks per second, or None to tick as fast as possible.
+        @catchup: Most ticks run in a single frame.
+        @clock:   Monotonic clock, in seconds.
+        @sleep:   Function sleeping for the given number of seconds.
+        """
+        self.rate = rate if rate else None
+        self.catchup = max(catchup, 1)
+        self.clock = clock
+        self.sleep = sleep
+        self.reset()
+
+    @classmethod
+    def from_clock(cls, clock, **kwargs):
+        """
+        A scheduler of one tick every @clock milliseconds (as given to displays), where a clock of
+        0 ticks as fast as possible.
+        """
+        return cls(1000 / clock if clock and clock > 0 else None, **kwargs)
+
+    def reset(self):
+        """
+        Restart the schedule from now (e.g. after pausing), clearing statistics.
+        """
+        self._start = None
+        self._began = None
+        self._due = 0
+        self.ticks = 0
+        self.frames = 0
+        self.skipped = 0
+        self.dropped = 0
+
+    def due(self):
+        """
+        Returns how many ticks should be run this frame, without blocking. This may be 0 if the
+        next tick is not due yet.
+        """
+        now = self.clock()
+        if self._start is None:
+            self._start = self._began = now
+
+        if self.rate is None:
+            count = 1
+        else:
+            # Deadlines passed, allowing for rounding so waking at a deadline finds its tick due
+            count = int((now - self._start) * self.rate + 1e-6) + 1 - self._due
+            if count > self.catchup:
+                # Too far behind to catch up; slide the schedule forward instead
+                self.dropped += count - self.catchup
+                self._start += (count - self.catchup) / self.rate
+                count = self.catchup
+            count = max(count, 0)
+
+        self._due += count
+        self.ticks += count
+        if count > 0:
+            self.frames += 1
+            self.skipped += count - 1
+        return count
+
+    def deadline(self):
+        """
+        Time (as given by the clock) the next tick is due, or None if unscheduled.
+        """
+        if self.rate is None or self._start is None:
+            return None
+        return self._start + self._due / self.rate
+
+    def wait(self):
+        """
+        Block until the next tick is due, returning how many ticks should be run this frame.
+        """
+        count = self.due()
+        while count == 0:
+            self.sleep(max(self.deadline() - self.clock(), 0))
+            count = self.due()
+        return count
+
+    def report(self):
+        """
+        Target and achieved rates (in ticks per second), along with the number of frames, ticks
+        run without a frame of their own (skipped) and ticks given up on (dropped).
+        """
+        elapsed = self.clock() - self._began if self._began is not None else 0.0
+        return {
+            'target': self.rate,
+            'achieved': self.ticks / elapsed if elapsed > 0 else 0.0,
+            'ticks': self.ticks,
+            'frames': self.frames,
+            'skipped': self.skipped,
+            'dropped': self.dropped,
+        }
@@ -0,0 +1,215 @@
+"""
+Classification of outer totalistic rules by behavior.
+
+Every Life-like rule is given by which neighbor totals (0 through 8) give birth and which allow
+survival, so there are 2^18 such rules in all. Rather than constructing a CAM and parser for each,
+a search compiles every rule into a single engine once, and runs it against several random soups.
+Each soup is stepped until it either dies out, falls into a cycle (in which case it stabilized or
+oscillates), fills enough of the plane to be considered to have exploded, or reaches the generation
+limit without settling (it remained chaotic).
+
+Rules are surveyed in a pool of worker processes. Workers share nothing; each is only handed the
+index of a rule and the search parameters, and returns a plain record of its outcomes. Soups are
+seeded by the rule and soup number, so results do not depend on how rules are scheduled.
+
+Records are appended to a results file (one JSON object per line) as soon as they complete. When
+run again against the same file, rules already present are skipped, so an interrupted search simply
+resumes where it left off.
+
+@date: October 18, 2026
+"""
+import os
+import json
+import enum
+import numpy as np
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import plane as pl
+import engine as e
+
+
+# Number of distinct outer totalistic rules on the 2D Moore neighborhood
+RULES = 2 ** 18
+
+
+class Behavior(enum.Enum):
+    """
+    Fate of a soup.
+    """
+    DIES       = 0
+    STABILIZES = 1
+    OSCILLATES = 2
+    EXPLODES   = 3
+    CHAOTIC    = 4
+
+
+def notation(index):
+    """
+    The B/S notation of the rule with the given index.
+
+    The lower 9 bits of the index are the birth totals, and the upper 9 the survival totals.
+    """
+    birth = ''.join(str(i) for i in range(9) if (index >> i) & 1)
+    survive = ''.join(str(i) for i in range(9) if (index >> (9 + i)) & 1)
+    return 'B{}/S{}'.format(birth, survive)
+
+
+def index(rule):
+    """
+    The index of a rule given in B/S notation (inverse of notation).
+    """
+    birth, survive = (part[1:] for part in rule.split('/'))
+    return sum(1 << int(b) for b in birth) | sum(1 << (9 + int(s)) for s in survive)
+
+
+def outcome(rules, plane, generations, explode=0.5):
+    """
+    Step a plane until its fate is decided, returning a dict of its behavior, the tick it was
+    decided on, the period of any cycle it fell into and its final population.
+
+    @explode: Fraction of the plane that must be alive for the plane to have exploded.
+    """
+    seen = {plane.bits.tobytes(): 0}
+    limit = explode * plane.size
+    for tick in range(1, generations + 1):
+        rules.apply_to(plane)
+        population = plane.population
+
+        if population == 0:
+            return {'behavior': Behavior.DIES.name, 'tick': tick, 'period': 0, 'population': 0}
+
+        key = plane.bits.tobytes()
+        if key in seen:
+            period = tick - seen[key]
+            behavior = Behavior.STABILIZES if period == 1 else Behavior.OSCILLATES
+            return {'behavior': behavior.name, 'tick': tick, 'period': period, 'population': population}
+        seen[key] = tick
+
+        if population >= limit:
+            return {'behavior': Behavior.EXPLODES.name, 'tick': tick, 'period': 0, 'population': population}
+
+    return {'behavior': Behavior.CHAOTIC.name, 'tick': generations, 'period': 0, 'population': plane.population}
+
+
+def soup(shape, density, seed):
+    """
+    A plane of the given shape, each of whose cells is alive with probability @density.
+    """
+    rng = np.random.default_rng(seed)
+    cells = (rng.random(shape) < density).astype(np.uint8)
+    return pl.Plane(shape, e.pack(cells))
+
+
+def survey(rule, shape=(64, 64), soups=4, generations=500, density=0.5, explode=0.5, seed=0):
+    """
+    Run a rule (given by index) against several soups, returning its record.
+
+    The rule is compiled into an engine once, and reused by every soup.
+    """
+    birth = [i for i in range(9) if (rule >> i) & 1]
+    survive = [i for i in range(9) if (rule >> (9 + i)) & 1]
+    rules = e.Totalistic(birth, survive)
+
+    outcomes = []
+    for i in range(soups):
+        plane = soup(shape, density, (seed, rule, i))
+        outcomes.append(outcome(rules, plane, generations, explode))
+
+    behavior = Counter(o['behavior'] for o in outcomes).most_common(1)[0][0]
+    return {'index': rule, 'rule': notation(rule), 'behavior': behavior, 'outcomes': outcomes}
+
+
+def _survey(arguments):
+    """
+    Entry point of workers (arguments are packed to be picklable).
+    """
+    rule, parameters = arguments
+    return survey(rule, **parameters)
+
+
+class Search:
+    """
+    Surveys a space of rules in parallel, streaming records to a results file.
+    """
+
+    def __init__(self, shape=(64, 64), soups=4, generations=500, density=0.5, explode=0.5, seed=0):
+        """
+        @shape:       Shape of every soup.
+        @soups:       Number of soups each rule is run against.
+        @generations: Number of generations after which a soup is considered chaotic.
+        @density:     Fraction of live cells of each soup.
+        @explode:     Fraction of live cells past which a soup is considered to have exploded.
+        @seed:        Seed of every soup, along with the rule and soup number.
+        """
+        self.parameters = {
+            'shape': tuple(shape),
+            'soups': soups,
+            'generations': generations,
+            'density': density,
+            'explode': explode,
+            'seed': seed,
+        }
+
+    @staticmethod
+    def load(path):
+        """
+        Returns the records of a results file, keyed by rule index.
+
+        Lines that cannot be read (e.g. one left half written by an interrupted search) are skipped.
+        """
+        records = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        records[record['index']] = record
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        return records
+
+    def run(self, path, rules=None, workers=None, window=None):
+        """
+        Survey the given rules (indices, defaulting to all of them), appending a record of each to
+        the results file at @path as it completes. Rules already recorded there are skipped.
+
+        @workers: Number of worker processes (defaults to the number of CPUs).
+        @window:  Maximum number of rules handed to the pool at once, so that rules are not all
+                  queued up front. Defaults to 4 per worker.
+
+        Returns the number of rules surveyed.
+        """
+        rules = range(RULES) if rules is None else rules
+        done = set(Search.load(path))
+        pending = (rule for rule in rules if rule not in done)
+
+        workers = workers or os.cpu_count() or 1
+        window = window or 4 * workers
+        surveyed = 0
+
+        with ProcessPoolExecutor(max_workers=workers) as pool, open(path, 'a') as out:
+            # Start on a fresh line, should the last run have been interrupted mid write
+            if out.tell() > 0:
+                with open(path, 'rb') as f:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        out.write('\n')
+
+            running = set()
+            while True:
+                for rule in pending:
+                    running.add(pool.submit(_survey, (rule, self.parameters)))
+                    if len(running) >= window:
+                        break
+                if not running:
+                    break
+
+                finished, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    out.write(json.dumps(future.result()) + '\n')
+                    surveyed += 1
+                out.flush()
+
+        return surveyed
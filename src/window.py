@@ -0,0 +1,104 @@
+import time
+import matplotlib.pyplot as plt
+import matplotlib.animation as ani
+
+from display import _Display
+
+
+# Milliseconds between frames when ticking slower than this
+FRAME = 1000 / 30
+
+
+class WindowDisplay(_Display):
+    """
+    Displays CAM onto window via the matplotlib library.
+
+    We use the AxesImage object in matplotlib and constantly animate
+    the graph to display the automata. Unlike the curses library, this
+    class also provides support for 3D display, though note this is
+    much more intensive.
+
+    Space pauses and resumes, the left and right arrow keys step back and forth a generation, and
+    Home and End seek to the oldest and newest generations held.
+    """
+    def __init__(self, cam, clock, rules, *args, history=None):
+        """
+        Initialize matplotlib objects.
+        """
+        super().__init__(cam, clock, rules, *args, history=history)
+
+        # Keep local reference for convenience
+        self.fig, self.ax = plt.subplots()
+        self.fig.canvas.mpl_connect('key_press_event', self._control)
+
+        # Note we draw out planes in the reverse direction
+        # for proper superimposition
+        self.matrices = []
+        for plane in self.cam.planes:
+            mshown = plt.matshow(plane.matrix(), self.fig.number, cmap='Greys')
+            self.matrices.append(mshown)
+
+    def _valid(self):
+        """
+        Ensures only 2D/3D CAMs are accepted.
+        """
+        return 2 <= len(self.cam.master.shape) <= 3
+
+    def _control(self, event):
+        """
+        Pause, step through or seek the history of the CAM.
+        """
+        if event.key == ' ':
+            self.paused = not self.paused
+        elif event.key == 'left':
+            self.step_back()
+        elif event.key == 'right':
+            self.paused = True
+            self.advance()
+        elif event.key == 'home':
+            self.seek(self.history.first)
+        elif event.key == 'end':
+            self.seek(self.history.last)
+
+    def _animate(self, frame):
+        """
+        Display the next state of the automaton.
+
+        Note that the framerate must be considered; one shouldn't just try to run
+        the animation as fast as possible, as this callback will only be bottled up.
+        The limiting factor is the tick method, which should be fast enough for reasonably
+        sized CAMs (100x100 runs in <50 ms on my computer), but runs in quadratic time.
+        """
+        self.frame(block=False)
+        if len(self.cam.master.shape) == 2:
+            start = time.perf_counter()
+            self.matrices[0].set_array(self.cam.master.matrix())
+            report = self.scheduler.report()
+            self.fig.suptitle('Generation {}, Population {}, {:.1f} ticks/s'.format(
+                self.cam.total, self.cam.master.population, report['achieved']))
+            if self.cam.instrument is not None:
+                self.cam.instrument.phase('display', time.perf_counter() - start)
+            return [self.matrices[0]]
+        else:
+            pass
+
+    def run(self):
+        """
+        Commence actual loop.
+
+        The following expands out each plane (from a bitarray to a matrix of bits)
+        which are then displayed out via the animate function. We simply superimpose
+        the necessary plots for the desired overlaying.
+        """
+        if len(self.cam.master.shape) == 2:
+            self.ax.set_frame_on(False)
+            self.ax.get_xaxis().set_visible(False)
+            self.ax.get_yaxis().set_visible(False)
+        else:
+            pass
+
+        # Frames are requested at least as often as ticks come due, and the scheduler decides
+        # how many ticks each runs
+        ani.FuncAnimation(self.fig, self._animate, interval=min(self.clock, FRAME) if self.clock > 0 else 1)
+        plt.axis('off')
+        plt.show()
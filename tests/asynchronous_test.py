@@ -0,0 +1,104 @@
+import os, sys
+sys.path.insert(0, os.path.join('..', 'src'))
+
+import cam
+import asyncio
+import cam_parser
+import asynchronous
+
+
+class TestAsynchronous:
+    """
+
+    """
+    def setUp(self):
+        self.cam = cam.CAM(1, 20, 2)
+        self.parser = cam_parser.CAMParser('B3/S23', self.cam)
+        self.cam.master[[(1, 2), (2, 3), (3, 1), (3, 2), (3, 3)]] = 1
+
+    def _collect(self, **kwargs):
+        async def collect():
+            stream = asynchronous.generations(self.cam, self.parser.ruleset, **kwargs)
+            return [item async for item in stream]
+        return asyncio.run(collect())
+
+    def test_generations(self):
+        """
+        Generation Stream.
+        """
+        items = self._collect(count=5)
+        assert [tick for tick, _ in items] == [0, 1, 2, 3, 4]
+        assert all(bits.count() == 5 for _, bits in items)
+        assert items[-1][1] == self.cam.master.bits
+
+    def test_diffs(self):
+        """
+        Diff Stream.
+        """
+        items = self._collect(count=4, diffs=True, prefetch=2)
+        bits = items[0][1]
+        for _, delta in items[1:]:
+            bits ^= delta
+        assert bits == self.cam.master.bits
+        assert self.cam.total == 3
+
+    def test_backpressure(self):
+        """
+        Prefetch Bound.
+        """
+        async def consume():
+            stream = asynchronous.generations(self.cam, self.parser.ruleset, prefetch=2)
+            await stream.__anext__()
+            await stream.__anext__()
+            await asyncio.sleep(0.2)
+            ticked = self.cam.total
+            await stream.aclose()
+            return ticked
+
+        assert asyncio.run(consume()) <= 4
+
+    def test_drain(self):
+        """
+        Prefetched Generations Outlive The Producer.
+        """
+        async def consume():
+            stream = asynchronous.generations(self.cam, self.parser.ruleset, count=4, prefetch=4)
+            items = [await stream.__anext__()]
+            await asyncio.sleep(0.2)
+            return items + [item async for item in stream]
+
+        assert [tick for tick, _ in asyncio.run(consume())] == [0, 1, 2, 3]
+
+    def test_cancellation(self):
+        """
+        Cancellation.
+        """
+        async def consume():
+            async def run():
+                async for _ in asynchronous.generations(self.cam, self.parser.ruleset):
+                    await asyncio.sleep(0)
+            task = asyncio.ensure_future(run())
+            await asyncio.sleep(0.05)
+            task.cancel()
+            await asyncio.wait([task])
+            return self.cam.total
+
+        stopped = asyncio.run(consume())
+        assert stopped == self.cam.total
+
+    def test_shared(self):
+        """
+        Concurrent CAMs.
+        """
+        other = cam.CAM(1, 20, 2)
+        other.master[[(5, 5), (5, 6), (5, 7)]] = 1
+
+        async def both():
+            a = asynchronous.generations(self.cam, self.parser.ruleset, count=6)
+            b = asynchronous.generations(other, self.parser.ruleset, count=6)
+            async def drain(stream):
+                return [tick async for tick, _ in stream]
+            return await asyncio.gather(drain(a), drain(b))
+
+        assert asyncio.run(both()) == [list(range(6)), list(range(6))]
+        assert other.master.population == 3
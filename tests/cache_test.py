@@ -0,0 +1,81 @@
+import os, sys
+sys.path.insert(0, os.path.join('..', 'src'))
+
+import threading
+
+import cam
+import cache
+import cam_parser
+
+
+class TestCache:
+    """
+
+    """
+    def setUp(self):
+        self.cache = cache.LRUCache(2)
+        self.cam = cam.CAM(1, 10, 2)
+
+    def test_lru(self):
+        """
+        Least Recently Used Eviction.
+        """
+        assert self.cache.get('a', lambda: 1) == 1
+        assert self.cache.get('b', lambda: 2) == 2
+        assert self.cache.get('a', lambda: 3) == 1
+        assert self.cache.get('c', lambda: 4) == 4
+        assert 'a' in self.cache and 'b' not in self.cache
+
+        stats = self.cache.stats()
+        assert (stats['hits'], stats['misses'], stats['evictions'], stats['size']) == (1, 3, 1, 2)
+
+        self.cache.resize(1)
+        assert len(self.cache) == 1 and 'c' in self.cache
+        self.cache.clear()
+        assert self.cache.stats()['misses'] == 0
+
+    def test_threads(self):
+        """
+        Concurrent Lookups.
+        """
+        c = cache.LRUCache(8)
+        results = []
+
+        def lookup():
+            for i in range(200):
+                results.append(c.get(i % 16, lambda i=i: i % 16))
+
+        threads = [threading.Thread(target=lookup) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = c.stats()
+        assert stats['hits'] + stats['misses'] == 800
+        assert stats['size'] == 8
+        assert sorted(set(results)) == list(range(16))
+
+    def test_parser(self):
+        """
+        Shared Compiled Rules.
+        """
+        previous = cache.rules()
+        cache.set_rules(self.cache)
+        try:
+            p1 = cam_parser.CAMParser('23/3', self.cam)
+            p2 = cam_parser.CAMParser('B3/S23', cam.CAM(1, 20, 2))
+            assert p1.compiled is p2.compiled
+            assert p1.compiled.notation == 'B3/S23'
+            assert p1.compiled.masks == (0b1000, 0b1100)
+            assert p1.engine._compiled[8][0] is p2.engine._compiled[8][0]
+
+            # Parsers get their own offsets, leaving the shared ones untouched
+            p1.offsets[(0, 0)] = 1
+            assert (0, 0) not in p2.offsets and (0, 0) not in p1.compiled.offsets
+            assert self.cache.stats()['hits'] == 1
+
+            cam_parser.CAMParser('B3/S23', cam.CAM(1, 10, 3))
+            assert self.cache.stats()['misses'] == 2
+        finally:
+            cache.set_rules(previous)
@@ -0,0 +1,74 @@
+import os, sys
+sys.path.insert(0, os.path.join('..', 'src'))
+
+import plane
+import census
+import configuration as c
+
+
+GLIDER = [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+
+
+class TestCensus:
+    """
+
+    """
+    def setUp(self):
+        self.plane2d = plane.Plane((20, 30))
+        self.plane2d[[(1 + y, 1 + x) for y, x in GLIDER]] = 1
+        self.plane2d[[(10, 10), (10, 11), (11, 10), (11, 11)]] = 1
+        self.plane2d[[(15, 20), (15, 21), (15, 22)]] = 1
+
+    def test_components(self):
+        """
+        Component Labeling.
+        """
+        components = census.components(self.plane2d)
+        assert [len(component) for component in components] == [5, 4, 3]
+        assert components[0].bounding_box == ((1, 3), (1, 3))
+        assert components[1].bounding_box == ((10, 11), (10, 11))
+        assert components[2].cells.tolist() == [[15, 20], [15, 21], [15, 22]]
+
+    def test_connectivity(self):
+        """
+        Moore And Von Neumann Connectivity.
+        """
+        p = plane.Plane((5, 5))
+        p[[(1, 1), (2, 2), (3, 3)]] = 1
+        assert len(census.components(p, c.Configuration.moore(p))) == 1
+        assert len(census.components(p, c.Configuration.neumann(p))) == 3
+
+    def test_edges(self):
+        """
+        Components Across Edges.
+        """
+        p = plane.Plane((10, 10))
+        p[[(9, 4), (0, 4), (1, 4)]] = 1
+        components = census.components(p)
+        assert len(components) == 1
+        assert components[0].bounding_box == ((9, 11), (4, 4))
+
+        p = plane.Plane((10, 10), boundary=plane.Plane.Boundary.ZERO)
+        p[[(9, 4), (0, 4), (1, 4)]] = 1
+        assert len(census.components(p)) == 2
+
+    def test_hash(self):
+        """
+        Canonical Hashes.
+        """
+        rotated = [(x, 2 - y) for y, x in GLIDER]
+        reflected = [(y, 2 - x) for y, x in GLIDER]
+        assert census.canonical(GLIDER) == census.canonical(rotated)
+        assert census.canonical(GLIDER) == census.canonical(reflected)
+        assert census.canonical([(0, 0), (0, 1), (0, 2)]) == census.canonical([(5, 7), (6, 7), (7, 7)])
+        assert census.canonical([(0, 0), (0, 1), (0, 2)]) != census.canonical([(0, 0), (0, 1), (1, 1)])
+
+    def test_census(self):
+        """
+        Object Tally.
+        """
+        self.plane2d[[(5 + x, 25 - y) for y, x in GLIDER]] = 1
+        tally = census.census(self.plane2d)
+        assert sorted(tally.values()) == [1, 1, 2]
+        assert tally[census.canonical(GLIDER)] == 2
+        assert census.census(plane.Plane((4, 4))) == {}
@@ -0,0 +1,64 @@
+import os, sys
+sys.path.insert(0, os.path.join('..', 'src'))
+
+import random
+
+import cam
+import plane
+import delta
+import cam_parser
+
+
+class TestDelta:
+    """
+
+    """
+    def setUp(self):
+        random.seed(0)
+        self.cam = cam.CAM(1, 100, 2)
+        self.parser = cam_parser.CAMParser('B3/S23', self.cam)
+        self.cam.master.randomize()
+
+    def test_rebuild(self):
+        """
+        Deltas Rebuild Plane.
+        """
+        copy = plane.Plane(self.cam.master.shape, self.cam.master.bits.copy())
+        for tick, change in self.cam.deltas(self.parser.ruleset, count=10):
+            assert change.tick == tick
+            change.apply_to(copy)
+            assert copy.bits == self.cam.master.bits
+        assert self.cam.total == 10
+
+    def test_indices(self):
+        """
+        Changed Indices and Runs.
+        """
+        p = plane.Plane((3, 100))
+        for coordinates in [(0, 5), (0, 6), (0, 7), (1, 99), (2, 0)]:
+            p[coordinates] = 1
+        change = delta.Delta.between(plane.Plane((3, 100)).bits, p.bits)
+        assert len(change) == 5
+        assert len(change.tiles) == 3
+        assert change.indices().tolist() == [5, 6, 7, 227, 256]
+        assert change.runs().tolist() == [[5, 3], [227, 1], [256, 1]]
+        assert change.mask() == p.bits
+
+        # Applying a delta again undoes it
+        change.apply_to(p)
+        assert p.population == 0
+
+    def test_serialize(self):
+        """
+        Serialized Deltas.
+        """
+        _, change = next(self.cam.deltas(self.parser.ruleset, count=1))
+        data = change.tobytes()
+        assert len(data) == change.nbytes
+        assert len(data) < len(self.cam.master.bits.tobytes()) * 2
+        restored = delta.Delta.frombytes(data)
+        assert restored == change
+        assert restored.tick == 1
+
+        empty = delta.Delta.of(self.cam.master.bits & ~self.cam.master.bits)
+        assert len(empty.tobytes()) == delta._HEADER.size
@@ -0,0 +1,75 @@
+import os, sys
+sys.path.insert(0, os.path.join('..', 'src'))
+
+import subprocess
+
+import cam
+import display
+
+
+# Seconds a headless "import cam" may take, measured in a fresh interpreter
+IMPORT_BUDGET = 0.6
+
+
+class TestDisplay:
+    """
+
+    """
+    def setUp(self):
+        self.src = os.path.abspath(os.path.join('..', 'src'))
+
+    def _headless(self, statement):
+        """
+        Run the given statement after importing cam in a fresh interpreter.
+        """
+        script = '; '.join([
+            'import sys, time',
+            'sys.path.insert(0, {!r})'.format(self.src),
+            'start = time.perf_counter()',
+            'import cam',
+            'elapsed = time.perf_counter() - start',
+            statement,
+        ])
+        return subprocess.check_output([sys.executable, '-c', script]).decode().split()
+
+    def test_headlessModules(self):
+        """
+        Headless Import Modules.
+        """
+        loaded = self._headless("print(*[m in sys.modules for m in ('matplotlib', 'curses', 'console', 'window')])")
+        assert loaded == ['False'] * 4
+
+    def test_headlessBudget(self):
+        """
+        Headless Import Time.
+        """
+        elapsed = min(float(self._headless('print(elapsed)')[0]) for _ in range(3))
+        assert elapsed < IMPORT_BUDGET
+
+    def test_register(self):
+        """
+        Custom Backend.
+        """
+        class Recorder(display._Display):
+            def run(self):
+                self.cam.tick(self.rules, *self.tick_args)
+
+        class Rules:
+            def apply_to(self, plane, *args):
+                plane[(0, 0)] = 1
+
+        display.register('recorder', Recorder)
+        c = cam.CAM(1, 10, 2)
+        c.start('recorder', clock=0, rules=Rules())
+        assert display.backend('recorder') is Recorder
+        assert c.master[(0, 0)] == 1
+
+    def test_unregistered(self):
+        """
+        Unknown Backend.
+        """
+        try:
+            display.backend('missing')
+            assert False
+        except ValueError:
+            pass
@@ -0,0 +1,217 @@
+import os, sys
+sys.path.insert(0, os.path.join('..', 'src'))
+
+import io
+import random
+
+import cam
+import plane
+import engine
+import cam_parser
+import instrument
+import numpy as np
+
+
+class TestEngine:
+    """
+
+    """
+    def setUp(self):
+        random.seed(0)
+        self.cam = cam.CAM(2, 20, 2)
+        self.parser = cam_parser.CAMParser('B3/S23', self.cam)
+        self.cam.master.randomize()
+        self.cam.planes[1].bits = self.cam.master.bits.copy()
+
+    def test_totals(self):
+        """
+        Neighborhood Totals.
+        """
+        cells = np.zeros((5, 5), dtype=np.uint8)
+        cells[0, 0] = 1
+        counts = engine.totals(cells, engine.moore(2))
+        assert counts.sum() == 8
+        assert counts[4, 4] == 1
+        assert counts[0, 0] == 0
+
+    def test_boundaries(self):
+        """
+        Totals Across Boundaries.
+        """
+        B = plane.Plane.Boundary
+        cells = np.zeros((4, 5), dtype=np.uint8)
+        cells[0, 0] = 1
+
+        counts = engine.totals(cells, engine.moore(2), (B.ZERO, B.ZERO))
+        assert counts.sum() == 3
+        counts = engine.totals(cells, engine.moore(2), (B.REFLECT, B.TOROIDAL))
+        assert counts[0, 0] == 1
+        assert counts[0, 4] == 2
+        counts = engine.totals(cells, engine.moore(2), (B.ONE, B.ONE))
+        assert counts[0, 0] == 5
+        assert counts[2, 2] == 0
+
+    def test_boundaryRuleset(self):
+        """
+        Life Matches Ruleset Within Walls.
+        """
+        c = cam.CAM(2, 12, 2, boundary=(plane.Plane.Boundary.ZERO, plane.Plane.Boundary.REFLECT))
+        p = cam_parser.CAMParser('B3/S23', c)
+        c.master.randomize()
+        c.planes[1].bits = c.master.bits.copy()
+        for _ in range(5):
+            p.ruleset.apply_to(c.master)
+            p.engine.apply_to(c.planes[1])
+            assert c.master.bits == c.planes[1].bits
+
+    def test_rectangular(self):
+        """
+        Life Matches Ruleset On Padded Rows.
+        """
+        c = cam.CAM(2, (7, 70))
+        p = cam_parser.CAMParser('B3/S23', c)
+        c.master.randomize()
+        c.planes[1].bits = c.master.bits.copy()
+        for _ in range(3):
+            p.ruleset.apply_to(c.master)
+            p.engine.apply_to(c.planes[1])
+            assert c.master.bits == c.planes[1].bits
+        assert c.master.population == c.master.matrix().sum()
+
+    def test_packing(self):
+        """
+        Packing and Unpacking.
+        """
+        bits = self.cam.master.bits
+        cells = engine.unpack(bits, self.cam.master.shape)
+        assert cells.shape == (20, 20)
+        assert cells.sum() == bits.count()
+        assert engine.pack(cells) == bits
+
+    def test_life(self):
+        """
+        Life Matches Ruleset.
+        """
+        for _ in range(5):
+            self.parser.ruleset.apply_to(self.cam.master)
+            self.parser.engine.apply_to(self.cam.planes[1])
+            assert self.cam.master.bits == self.cam.planes[1].bits
+
+    def test_generations(self):
+        """
+        Generations Decay.
+        """
+        c = cam.CAM(1, 10, 2, depth=2)
+        p = cam_parser.CAMParser('B2/S/C3', c)
+        c.master[[(4, 4), (4, 5)]] = 1
+
+        c.tick(p.ruleset)
+        assert c.master[(4, 4)] == 2
+        assert c.master[(3, 4)] == 1
+        assert c.master.population == 6
+
+        c.tick(p.ruleset)
+        assert c.master[(4, 4)] == 0
+        assert c.master[(3, 4)] == 2
+
+    def test_wireworld(self):
+        """
+        Wireworld Electron.
+        """
+        p = plane.MultiPlane((3, 8), 2)
+        p[1] = 3
+        p[(1, 1)] = 2
+        p[(1, 2)] = 1
+
+        engine.Wireworld().apply_to(p)
+        assert p[[(1, 0), (1, 1), (1, 2), (1, 3), (1, 4)]] == [3, 3, 2, 1, 3]
+
+    def test_depth(self):
+        """
+        Insufficient Depth.
+        """
+        try:
+            cam_parser.CAMParser('B2/S/C3', self.cam)
+            assert False
+        except ValueError:
+            pass
+
+    def test_elementary(self):
+        """
+        Elementary Rule 30.
+        """
+        c = cam.CAM(1, 101, 1)
+        p = cam_parser.CAMParser('W30', c)
+        c.master[50] = 1
+        for _ in range(3):
+            c.tick(p.ruleset)
+        assert [c.master[i] for i in range(46, 55)] == [0, 1, 1, 0, 1, 1, 1, 1, 0]
+
+        ref = plane.Plane((64,), boundary=plane.Plane.Boundary.REFLECT)
+        ref.randomize()
+        rules = engine.Elementary(110)
+        for _ in range(10):
+            before = plane.Plane(ref.shape, ref.bits.copy(), ref.boundaries)
+            rules.apply_to(ref)
+            for i in range(64):
+                index = (before.read((i-1,)) << 2) | (before.read((i,)) << 1) | before.read((i+1,))
+                assert ref[i] == (110 >> index) & 1
+
+    def test_spacetime(self):
+        """
+        Spacetime Diagrams.
+        """
+        line = plane.Plane((70,))
+        line[35] = 1
+        diagram = engine.Elementary(90).spacetime(line, 5)
+        assert diagram.shape == (5, 70)
+        assert [diagram[(4, i)] for i in range(31, 40)] == [1, 0, 0, 0, 0, 0, 0, 0, 1]
+        assert diagram[4].bits == line.bits
+
+        stream = io.BytesIO()
+        engine.Elementary(90).write_spacetime(line, 3, stream)
+        assert stream.getvalue().startswith(b'P4\n70 3\n')
+        assert len(stream.getvalue()) == len(b'P4\n70 3\n') + 3 * 9
+
+        try:
+            engine.Elementary(256)
+            assert False
+        except ValueError:
+            pass
+
+    def test_secondOrder(self):
+        """
+        Second Order Rules Reverse.
+        """
+        rules = engine.SecondOrder(engine.Totalistic([3], [2, 3]))
+        start = self.cam.master.bits.copy()
+        for _ in range(20):
+            rules.apply_to(self.cam.master)
+        assert self.cam.master.bits != start
+
+        rules.reverse(self.cam.master)
+        for _ in range(19):
+            rules.apply_to(self.cam.master)
+        assert self.cam.master.bits == start
+
+        # Rule 150R, against its definition
+        line = plane.Plane((80,))
+        line.randomize()
+        previous = line.bits.copy()
+        line.randomize()
+        rules = engine.SecondOrder(engine.Elementary(150))
+        rules.seed(line, previous)
+        before = line.bits.copy()
+        rules.apply_to(line)
+        assert line.bits == engine.Elementary(150).next_bits(plane.Plane((80,), before)) ^ previous
+
+        # Neither the given bits nor the wrapped engine's instrument are disturbed
+        history = engine.History()
+        history.seed(line, previous)
+        given = line.bits.copy()
+        assert history.advance(line, given) == line.bits ^ previous
+        assert given == line.bits
+        inner = engine.Totalistic([3], [2, 3])
+        inner.instrument = instrument.Instrument()
+        engine.SecondOrder(inner).apply_to(self.cam.master)
+        assert inner.instrument is not None
@@ -0,0 +1,105 @@
+import os, sys
+sys.path.insert(0, os.path.join('..', 'src'))
+
+import io
+import zlib
+import struct
+import tempfile
+
+import cam
+import export
+import cam_parser
+import numpy as np
+
+
+class TestExport:
+    """
+
+    """
+    def setUp(self):
+        self.cam = cam.CAM(2, 20, 2)
+        self.parser = cam_parser.CAMParser('B3/S23', self.cam)
+        self.cam.master[[(1, 2), (2, 3), (3, 1), (3, 2), (3, 3)]] = 1
+        self.cam.planes[1][(0, 0)] = 1
+        self.tmpdir = tempfile.mkdtemp()
+
+    def test_palette(self):
+        """
+        Default Palette.
+        """
+        e = export.RawExporter(self.cam, 50, self.parser.ruleset)
+        assert len(e.palette) == 4
+        assert e.palette[0] == (255, 255, 255)
+        assert e.palette[1] == e.palette[3]
+        assert e.palette[1] != e.palette[2]
+
+    def test_frame(self):
+        """
+        Frame Construction.
+        """
+        e = export.RawExporter(self.cam, 50, self.parser.ruleset)
+        frame = e._frame()
+        assert frame.shape == (20, 20)
+        assert frame[0, 0] == 2
+        assert frame[1, 2] == 1
+        assert np.count_nonzero(frame) == 6
+
+    def test_downsample(self):
+        """
+        Frame Downsampling.
+        """
+        e = export.RawExporter(self.cam, 50, self.parser.ruleset, scale=3)
+        frame = e._frame()
+        assert frame.shape == (6, 6)
+        assert frame[0, 0] == 3
+        assert frame[1, 0] == 1
+
+    def test_raw(self):
+        """
+        Raw Export.
+        """
+        stream = io.BytesIO()
+        export.RawExporter(self.cam, 50, self.parser.ruleset).run(stream, 3)
+        assert len(stream.getvalue()) == 3 * 20 * 20 * 3
+        assert self.cam.total == 2
+
+    def test_png(self):
+        """
+        PNG Export.
+        """
+        target = os.path.join(self.tmpdir, 'frame_{}.png')
+        export.PNGExporter(self.cam, 50, self.parser.ruleset).run(target, 2)
+        with open(target.format(1), 'rb') as f:
+            data = f.read()
+
+        assert data.startswith(b'\x89PNG\r\n\x1a\n')
+        idat = data.index(b'IDAT')
+        length = struct.unpack('>I', data[idat-4:idat])[0]
+        rows = np.frombuffer(zlib.decompress(data[idat+4:idat+4+length]), dtype=np.uint8)
+        rows = rows.reshape(20, 21)
+        assert np.count_nonzero(rows[:, 0]) == 0
+        assert np.count_nonzero(rows[:, 1:] & 1) == 5
+
+    def test_gif(self):
+        """
+        GIF Export.
+        """
+        target = os.path.join(self.tmpdir, 'run.gif')
+        export.GIFExporter(self.cam, 50, self.parser.ruleset).run(target, 4)
+        with open(target, 'rb') as f:
+            data = f.read()
+
+        assert data.startswith(b'GIF89a')
+        assert data.endswith(b'\x3B')
+        assert struct.unpack('<HH', data[6:10]) == (20, 20)
+        assert data.count(b'\x21\xF9\x04') == 4
+
+    def test_invalid(self):
+        """
+        Invalid Export.
+        """
+        try:
+            export.RawExporter(cam.CAM(1, 10, 3), 50, self.parser.ruleset)
+            assert False
+        except ValueError:
+            pass
@@ -0,0 +1,58 @@
+import os, sys
+sys.path.insert(0, os.path.join('..', 'src'))
+
+import cam
+import cam_parser
+import instrument
+
+
+class TestInstrument:
+    """
+
+    """
+    def setUp(self):
+        self.cam = cam.CAM(1, 20, 2)
+        self.parser = cam_parser.CAMParser('B3/S23', self.cam)
+        self.cam.master[[(1, 2), (2, 3), (3, 1), (3, 2), (3, 3)]] = 1
+        self.instrument = instrument.Instrument()
+        self.instrument.attach(self.cam, self.parser.ruleset)
+
+    def test_records(self):
+        """
+        Tick Records.
+        """
+        records = []
+        self.instrument.subscribe(records.append)
+        for _ in range(3):
+            self.cam.tick(self.parser.ruleset)
+
+        assert [rec.tick for rec in records] == [1, 2, 3]
+        for rec in records:
+            assert rec.population == 5
+            assert rec.changed == 4
+            assert rec.passes[self.parser.ruleset] == [20 * 20]
+            assert rec.elapsed >= rec.phases['counting'] + rec.phases['rules']
+
+    def test_summary(self):
+        """
+        Aggregate Summary.
+        """
+        for _ in range(4):
+            self.cam.tick(self.parser.ruleset)
+
+        summary = self.instrument.summary()
+        assert summary['ticks'] == 4
+        assert summary['changed'] == 16
+        assert summary['population'] == 5
+        assert summary['passes'] == [[4 * 20 * 20]]
+        assert summary['fastest'] <= summary['mean'] <= summary['slowest']
+
+    def test_detach(self):
+        """
+        Detached Instrument.
+        """
+        self.instrument.detach(self.cam, self.parser.ruleset)
+        self.cam.tick(self.parser.ruleset)
+        assert self.instrument.summary()['ticks'] == 0
+        assert self.cam.instrument is None
+        assert self.parser.ruleset.instrument is None
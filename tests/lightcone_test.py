@@ -0,0 +1,68 @@
+import os, sys
+sys.path.insert(0, os.path.join('..', 'src'))
+
+import numpy as np
+
+import cam
+import plane
+import engine
+import ruleset
+import lightcone
+import cam_parser
+
+
+class TestLightcone:
+    """
+
+    """
+    def setUp(self):
+        self.rng = np.random.default_rng(7)
+
+    def _compare(self, rule, shape, region, k, boundary=plane.Plane.Boundary.TOROIDAL, depth=1, method='engine'):
+        c = cam.CAM(1, shape, depth=depth, boundary=boundary)
+        cells = (self.rng.random(shape) < 0.4).astype(np.uint8)
+        if depth > 1:
+            c.master.bits = plane.MultiPlane.fromcells(cells, depth, c.master.boundaries).bits
+        else:
+            c.master.bits = plane.Plane.fromcells(cells, c.master.boundaries).bits
+        rules = getattr(cam_parser.CAMParser(rule, c), method)
+
+        before = c.master.bits.copy()
+        cells = c.future(rules, region, k)
+        assert c.master.bits == before
+
+        for _ in range(k):
+            c.tick(rules)
+        expected = c.master.cells(np.int64)[np.ix_(*[np.arange(a, b) % n for (a, b), n in zip(region, shape)])]
+        return np.array_equal(cells, expected)
+
+    def test_radius(self):
+        """
+        Neighborhood Radii.
+        """
+        assert lightcone.radius(engine.Totalistic([3], [2, 3]), 2) == (1, 1)
+        assert lightcone.radius(engine.Totalistic([3], [2, 3], offsets=[(0, 2), (-1, 0)]), 2) == (1, 2)
+        assert lightcone.radius(engine.Elementary(30, radius=2), 1) == (2,)
+        try:
+            lightcone.radius(ruleset.Ruleset(ruleset.Ruleset.Method.ALWAYS_PASS, second_order=True), 2)
+            assert False
+        except ValueError:
+            pass
+
+    def test_future(self):
+        """
+        Future Regions.
+        """
+        assert self._compare('B3/S23', (64, 64), [(10, 20), (30, 45)], 5)
+        assert self._compare('B3/S23', (32, 32), [(8, 16), (4, 20)], 3, method='ruleset')
+        assert self._compare('B2/S/C3', (48, 48), [(10, 20), (30, 45)], 4, depth=2)
+        assert self._compare('W30', (200,), [(90, 110)], 20)
+
+    def test_boundaries(self):
+        """
+        Regions At Edges.
+        """
+        assert self._compare('B3/S23', (64, 64), [(-5, 5), (60, 70)], 7)
+        assert self._compare('B3/S23', (40, 30), [(10, 20), (5, 25)], 30)
+        for boundary in (plane.Plane.Boundary.ZERO, plane.Plane.Boundary.ONE, plane.Plane.Boundary.REFLECT):
+            assert self._compare('B3/S23', (64, 64), [(0, 10), (50, 64)], 6, boundary)
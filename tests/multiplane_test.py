@@ -0,0 +1,86 @@
+import os, sys
+sys.path.insert(0, os.path.join('..', 'src'))
+
+import plane
+import numpy as np
+
+
+class TestMultiPlane:
+    """
+
+    """
+    def setUp(self):
+        self.plane2d = plane.MultiPlane((10, 10), 2)
+        self.plane3d = plane.MultiPlane((5, 5, 5), 3)
+
+    def test_bitsLength(self):
+        """
+        Bit expansion.
+        """
+        assert len(self.plane2d.bits) == 2 * 10 * 64
+        assert len(self.plane3d.bits) == 3 * 5 * 5 * 64
+        assert self.plane2d.states == 4
+        assert self.plane3d.states == 8
+
+    def test_tupleAccessing(self):
+        """
+        Tuple Accessing.
+        """
+        self.plane2d[(1, 2)] = 3
+        self.plane3d[(1, 2, 3)] = 5
+        assert self.plane2d[(1, 2)] == 3
+        assert self.plane3d[(1, 2, 3)] == 5
+        assert self.plane3d.layer(0).count() == 1
+        assert self.plane3d.layer(1).count() == 0
+        assert self.plane3d.layer(2).count() == 1
+
+    def test_listAccessing(self):
+        """
+        List Accessing.
+        """
+        self.plane2d[[(0, 4), (1, 5)]] = 2
+        assert self.plane2d[[(0, 4), (1, 5), (1, 6)]] == [2, 2, 0]
+
+    def test_singleAccessing(self):
+        """
+        Single Accessing.
+        """
+        self.plane2d[3] = 1
+        assert self.plane2d[3][4] == 1
+        assert self.plane2d[(3, 9)] == 1
+        assert self.plane2d[(4, 0)] == 0
+
+    def test_scatter(self):
+        """
+        Batch assignment.
+        """
+        self.plane2d.scatter([(0, 0), (0, 1), (0, 2)], [1, 2, 3])
+        assert self.plane2d.gather([(0, 0), (0, 1), (0, 2), (0, 3)]).tolist() == [1, 2, 3, 0]
+        assert self.plane2d.matrix()[0, :4].tolist() == [1, 2, 3, 0]
+
+    def test_population(self):
+        """
+        Population.
+        """
+        self.plane2d[[(0, 0), (5, 5), (9, 8)]] = 2
+        assert self.plane2d.population == 3
+        assert self.plane2d.bounding_box == ((0, 9), (0, 8))
+
+        layers = self.plane2d.layers()
+        layers[1][0] = 0
+        self.plane2d.update(self.plane2d.join(layers))
+        assert self.plane2d.population == 2
+        assert self.plane2d.bounding_box == ((5, 9), (5, 8))
+
+    def test_fromcells(self):
+        """
+        States To and From Arrays.
+        """
+        states = np.arange(5 * 70).reshape(5, 70) % 4
+        p = plane.MultiPlane.fromcells(states, 2)
+        assert (p.matrix() == states).all()
+        assert p[(0, 3)] == 3
+        assert p.words().shape == (2, 5, 2)
+
+        adopted = plane.MultiPlane.frombuffer((5, 70), 2, bytearray(p.bits.tobytes()))
+        assert (adopted.cells() == states).all()
@@ -71,8 +71,8 @@ class TestNeighborhood:
         """
         t1 = Neighborhood.get_totals(self.plane2d, self.offsets2d)
         t2 = Neighborhood.get_totals(self.plane3d, self.offsets3d)
-        assert len(t1) == np.product(self.plane2d.shape)
-        assert len(t2) == np.product(self.plane3d.shape)
+        assert len(t1) == len(self.plane2d.bits)
+        assert len(t2) == len(self.plane3d.bits)
         assert np.count_nonzero(np.array(t1)) == 0
         assert np.count_nonzero(np.array(t2)) == 0
 
@@ -100,3 +100,59 @@ class TestNeighborhood:
         self.plane2d[self.offsets2d] = 1
         self.neigh2d.populate(self.plane2d, self.offsets2d)
         assert self.neigh2d.neighbors.count() == 2
+
+    def test_neighborhoodStencil(self):
+        """
+        Stencil Matches Plane Reads.
+        """
+        B = plane.Plane.Boundary
+        for boundary in [(B.TOROIDAL, B.REFLECT), (B.ZERO, B.ONE), (B.ONE, B.ZERO)]:
+            p = plane.Plane((7, 70), boundary=boundary)
+            p.randomize()
+            offsets = [(-2, 1), (0, -1), (1, 1), (0, 3)]
+            neighborhood = Neighborhood(0)
+            for i in p.indices().tolist():
+                neighborhood.move(i)
+                neighborhood.populate(p, offsets)
+                center = p.unflatten(i)
+                expected = [p.read([c + o for c, o in zip(center, offset)]) for offset in offsets]
+                assert neighborhood.neighbors.tolist() == expected
+                assert neighborhood.total == len(offsets)
+
+        neighborhood.move(5, 3)
+        assert len(neighborhood.neighbors) == 0 and neighborhood.total == 3
+
+        # Offsets changed in place are not mistaken for those of the cached stencil
+        p = plane.Plane((8, 8))
+        p[(0, 1)] = 1
+        offsets = [(0, 1)]
+        neighborhood = Neighborhood(0)
+        neighborhood.populate(p, offsets)
+        assert neighborhood.neighbors.tolist() == [1]
+        offsets[0] = (1, 0)
+        neighborhood.populate(p, offsets)
+        assert neighborhood.neighbors.tolist() == [0]
+
+    def test_neighborhoodCorners(self):
+        """
+        Corners Of Mixed Boundaries Agree.
+        """
+        B = plane.Plane.Boundary
+        offsets = [(i, j) for i in (-1, 0, 1) for j in (-1, 0, 1) if (i, j) != (0, 0)]
+        for boundary in [(B.ZERO, B.ONE), (B.ONE, B.ZERO), (B.ONE, B.TOROIDAL), (B.REFLECT, B.ZERO)]:
+            p = plane.Plane((4, 4), boundary=boundary)
+            p.randomize()
+            totals = Neighborhood.get_totals(p, offsets)
+            neighborhood = Neighborhood(0)
+            for i in p.indices().tolist():
+                neighborhood.move(i)
+                neighborhood.populate(p, offsets)
+                assert neighborhood.neighbors.count() == totals[i]
+
+        # The last constant boundary wins
+        p = plane.Plane((4, 4), boundary=(B.ZERO, B.ONE))
+        neighborhood = Neighborhood(0)
+        neighborhood.populate(p, [(-1, -1)])
+        assert p.read((-1, -1)) == 1
+        assert neighborhood.neighbors.tolist() == [1]
+        assert Neighborhood.get_totals(p, [(-1, -1)])[0] == 1
@@ -0,0 +1,72 @@
+import os, sys
+sys.path.insert(0, os.path.join('..', 'src'))
+
+import random
+import numpy as np
+
+import plane
+import engine
+import pattern
+
+
+class TestPattern:
+    """
+
+    """
+    def setUp(self):
+        self.cells = np.zeros((30, 70), dtype=np.uint8)
+
+    def _place(self, cells, shape, origin):
+        """
+        Write a pattern into an array of cells, wrapping around its edges.
+        """
+        for offset in zip(*np.nonzero(shape == 1)):
+            cells[tuple((o + x) % n for o, x, n in zip(origin, offset, cells.shape))] = 1
+
+    def test_search(self):
+        """
+        Glider Occurrences.
+        """
+        variants = pattern.variants(pattern.GLIDER)
+        assert len(variants) == 8
+        self._place(self.cells, variants[0], (3, 5))
+        self._place(self.cells, variants[3], (20, 40))
+        self._place(self.cells, variants[5], (28, 68))
+        p = plane.Plane(self.cells.shape, engine.pack(self.cells))
+
+        assert pattern.search(p, pattern.GLIDER).tolist() == [[3, 5]]
+        for method in ['shift', 'fft']:
+            found = pattern.search(p, pattern.GLIDER, symmetric=True, method=method)
+            assert found.tolist() == [[3, 5], [20, 40], [28, 68]]
+
+        # The straddling glider is only found where the plane wraps
+        walled = plane.Plane(self.cells.shape, p.bits, plane.Plane.Boundary.ZERO)
+        for method in ['shift', 'fft']:
+            assert pattern.search(walled, pattern.GLIDER, symmetric=True, method=method).tolist() == [[3, 5], [20, 40]]
+
+    def test_dontCare(self):
+        """
+        Don't Care Cells.
+        """
+        self._place(self.cells, np.array([[1, 1, 1]]), (10, 10))
+        self._place(self.cells, np.array([[1, 0, 1]]), (20, 30))
+        p = plane.Plane(self.cells.shape, engine.pack(self.cells))
+
+        assert pattern.search(p, [[1, 1, 1]]).tolist() == [[10, 10]]
+        assert pattern.search(p, [[1, -1, 1]]).tolist() == [[10, 10], [20, 30]]
+        assert pattern.search(p, [[1, 1, 1]], care=[[1, 0, 1]]).tolist() == [[10, 10], [20, 30]]
+
+    def test_methods(self):
+        """
+        Shifting Agrees With Correlation.
+        """
+        random.seed(0)
+        for shape in [(40, 90), (12, 13, 70)]:
+            p = plane.Plane(shape, boundary=(plane.Plane.Boundary.TOROIDAL, plane.Plane.Boundary.REFLECT) + (plane.Plane.Boundary.TOROIDAL,) * (len(shape) - 2))
+            p.randomize()
+            rng = np.random.default_rng(1)
+            probe = rng.integers(-1, 2, size=(2,) * len(shape))
+            shifted = pattern.search(p, probe, method='shift')
+            correlated = pattern.search(p, probe, method='fft')
+            assert len(shifted) > 0
+            assert np.array_equal(shifted, correlated)
@@ -4,6 +4,8 @@ sys.path.insert(0, os.path.join('..', 'src'))
 import plane
 import numpy as np
 
+from bitarray import bitarray
+
 
 class TestPlane:
     """
@@ -17,15 +19,17 @@ class TestPlane:
         """
         Bit expansion.
         """
-        assert len(self.plane2d.bits) == 100 * 100
-        assert len(self.plane3d.bits) == 100 * 100 * 100
+        assert len(self.plane2d.bits) == 100 * 128
+        assert len(self.plane3d.bits) == 100 * 100 * 128
+        assert self.plane2d.size == 100 * 100
+        assert self.plane3d.size == 100 * 100 * 100
 
     def test_offsets(self):
         """
         Offsets.
         """
-        assert list(self.plane2d.offsets) == [100, 1]
-        assert list(self.plane3d.offsets) == [10000, 100, 1]
+        assert list(self.plane2d.offsets) == [128, 1]
+        assert list(self.plane3d.offsets) == [12800, 128, 1]
 
     def test_randomize(self):
         """
@@ -38,8 +42,9 @@ class TestPlane:
 
         assert bits2d != self.plane2d.bits
         assert bits3d != self.plane3d.bits
-        assert len(self.plane2d.bits) == 100 * 100
-        assert len(self.plane3d.bits) == 100 * 100 * 100
+        assert len(self.plane2d.bits) == 100 * 128
+        assert len(self.plane3d.bits) == 100 * 100 * 128
+        assert (self.plane2d.bits & ~self.plane2d.mask()).count() == 0
 
     def test_tupleAssignment(self):
         """
@@ -98,20 +103,174 @@ class TestPlane:
         Flatten indices.
         """
         assert self.plane2d.flatten((0, 0)) == 0
-        assert self.plane2d.flatten((-1, 0)) == 9900
-        assert self.plane2d.flatten((1, 1)) == 101
+        assert self.plane2d.flatten((-1, 0)) == 12672
+        assert self.plane2d.flatten((1, 1)) == 129
         assert self.plane3d.flatten((0, 0, 0)) == 0
-        assert self.plane3d.flatten((-1, 0, 0)) == 990000
-        assert self.plane3d.flatten((1, 1, 1)) == 10101
+        assert self.plane3d.flatten((-1, 0, 0)) == 1267200
+        assert self.plane3d.flatten((1, 1, 1)) == 12929
 
     def test_unflatten(self):
         """
         Unflatten indices.
         """
         assert self.plane2d.unflatten(0) == (0, 0)
-        assert self.plane2d.unflatten(9900) == (99, 0)
-        assert self.plane2d.unflatten(101) == (1, 1)
+        assert self.plane2d.unflatten(12672) == (99, 0)
+        assert self.plane2d.unflatten(129) == (1, 1)
         assert self.plane3d.unflatten(0) == (0, 0, 0)
-        assert self.plane3d.unflatten(990000) == (99, 0, 0)
-        assert self.plane3d.unflatten(10101) == (1, 1, 1)
+        assert self.plane3d.unflatten(1267200) == (99, 0, 0)
+        assert self.plane3d.unflatten(12929) == (1, 1, 1)
+
+    def test_flattenAll(self):
+        """
+        Batch flatten indices.
+        """
+        coords = [(0, 0), (-1, 0), (1, 1), (100, 1)]
+        assert list(self.plane2d.flatten_all(coords)) == [0, 12672, 129, 1]
+        coords = np.array([(0, 0, 0), (-1, 0, 0), (1, 1, 1)])
+        assert list(self.plane3d.flatten_all(coords)) == [0, 1267200, 12929]
+
+    def test_unflattenAll(self):
+        """
+        Batch unflatten indices.
+        """
+        assert self.plane2d.unflatten_all([0, 12672, 129]).tolist() == [[0, 0], [99, 0], [1, 1]]
+        assert self.plane3d.unflatten_all([1267200, 12929]).tolist() == [[99, 0, 0], [1, 1, 1]]
+
+    def test_gather(self):
+        """
+        Batch accessing.
+        """
+        self.plane2d[(1, 0)] = 1
+        self.plane2d[(99, 0)] = 1
+        assert self.plane2d.gather([(1, 0), (-1, 0), (0, 0)]).tolist() == [1, 1, 0]
+
+    def test_scatter(self):
+        """
+        Batch assignment.
+        """
+        self.plane2d.scatter([(0, 4), (1, 5), (-1, 0)], 1)
+        assert self.plane2d.bits.count() == 3
+        assert self.plane2d[(99, 0)] == 1
+
+        self.plane3d.scatter([(0, 0, 1), (0, 0, 2), (0, 0, 3)], [1, 0, 1])
+        assert self.plane3d[[(0, 0, 1), (0, 0, 2), (0, 0, 3)]] == [1, 0, 1]
+        self.plane3d.scatter([(0, 0, 1)], [0])
+        assert self.plane3d.bits.count() == 1
+
+    def test_population(self):
+        """
+        Population.
+        """
+        assert self.plane2d.population == 0
+        self.plane2d[[(1, 2), (3, 4), (5, 6)]] = 1
+        assert self.plane2d.population == 3
+        assert self.plane2d.density == 3 / (100 * 100)
+
+    def test_boundingBox(self):
+        """
+        Bounding Box.
+        """
+        assert self.plane2d.bounding_box is None
+        self.plane2d[[(10, 2), (3, 40), (5, 6)]] = 1
+        assert self.plane2d.bounding_box == ((3, 10), (2, 40))
+        self.plane3d[(1, 2, 3)] = 1
+        assert self.plane3d.bounding_box == ((1, 1), (2, 2), (3, 3))
+
+    def test_update(self):
+        """
+        Incremental Update.
+        """
+        self.plane2d[[(1, 1), (2, 2)]] = 1
+        assert list(self.plane2d.counts(0)[:3]) == [0, 1, 1]
+
+        bits = self.plane2d.bits.copy()
+        bits[self.plane2d.flatten((1, 1))] = 0
+        bits[self.plane2d.flatten((7, 8))] = 1
+        bits[self.plane2d.flatten((7, 9))] = 1
+        delta = self.plane2d.update(bits)
+
+        assert delta.count() == 3
+        assert self.plane2d.population == 3
+        assert self.plane2d.bounding_box == ((2, 7), (2, 9))
+        assert list(self.plane2d.counts(0)[:8]) == [0, 0, 1, 0, 0, 0, 0, 2]
+        assert list(self.plane2d.counts(1)[8:10]) == [1, 1]
+
+        # Padding is cleared in the plane's bits, not in those given
+        padded = plane.Plane((3, 5))
+        bits = padded.bits.copy()
+        bits.setall(1)
+        padded.update(bits)
+        assert bits.all()
+        assert padded.bits.count() == padded.population == 15
+
+    def test_boundary(self):
+        """
+        Boundary Reads.
+        """
+        p = plane.Plane((4, 4), boundary=(plane.Plane.Boundary.ZERO, plane.Plane.Boundary.REFLECT))
+        p[[(0, 0), (3, 3)]] = 1
+        assert p.read((-1, 0)) == 0
+        assert p.read((0, -1)) == 1
+        assert p.read((3, 4)) == 1
+        assert p.read((0, 5)) == 0
+        assert p.read((4, 0)) == 0
+
+        p = plane.Plane((4, 4), boundary=plane.Plane.Boundary.ONE)
+        assert p.read((-1, -1)) == 1
+        assert p.read((1, 1)) == 0
+
+        try:
+            plane.Plane((4, 4), boundary=(plane.Plane.Boundary.ONE,))
+            assert False
+        except ValueError:
+            pass
+
+    def test_axisWrap(self):
+        """
+        Per Axis Wrapping.
+        """
+        self.plane2d[(0, 100)] = 1
+        assert self.plane2d[(0, 0)] == 1
+        assert self.plane2d[(1, 0)] == 0
+        assert self.plane2d.flatten((0, -1)) == 99
+
+    def test_rectangular(self):
+        """
+        Rectangular Padded Rows.
+        """
+        p = plane.Plane((3, 70))
+        assert len(p.bits) == 3 * 128
+        assert p.offsets[0] == 128
+        p[(0, -1)] = 1
+        p[2] = 1
+        assert p.population == 71
+        assert p.matrix().shape == (3, 70)
+        assert p.matrix().sum() == 71
+        assert p.bits[69] == 1 and p.bits[70:128].count() == 0
+        assert p[1].bits.count() == 0
+        assert len(p.indices()) == 3 * 70
+
+        unpadded = bitarray(p.matrix().ravel().tolist())
+        assert plane.Plane((3, 70), unpadded).bits == p.bits
+
+    def test_numpyInterop(self):
+        """
+        Packing, Unpacking and Adopting Buffers.
+        """
+        rng = np.random.default_rng(0)
+        cells = rng.random((30, 100)) < 0.5
+        p = plane.Plane.fromcells(cells)
+        assert p.population == cells.sum()
+        assert (p.cells(bool) == cells).all()
+        assert (p.cells(chunk=7) == cells).all()
+        assert (np.asarray(p) == cells).all()
+        assert p.words().shape == (30, 2)
 
+        # Adopted buffers share memory with the plane
+        buffer = np.zeros(30 * 128 // 8, dtype=np.uint8)
+        shared = plane.Plane.frombuffer((30, 100), buffer)
+        shared[(0, 0)] = 1
+        assert buffer[0] == 0x80
+        shared.words()[1, 0] = 1
+        shared.invalidate()
+        assert shared.population == 2 and shared.cells()[1].sum() == 1
@@ -0,0 +1,68 @@
+import os, sys
+sys.path.insert(0, os.path.join('..', 'src'))
+
+import io
+import random
+
+import cam
+import replay
+import cam_parser
+
+
+class TestReplay:
+    """
+
+    """
+    def setUp(self):
+        random.seed(0)
+        self.cam = cam.CAM(2, 40, 2)
+        self.cam.ticks.append((1, 3))
+        self.parser = cam_parser.CAMParser('B3/S23', self.cam)
+        self.cam.master.randomize()
+
+        self.log = io.StringIO()
+        recorder = replay.Recorder(self.log, self.cam, 'B3/S23', seed=7, every=2, bands=8)
+        recorder.run(self.parser.ruleset, 12)
+        self.log.seek(0)
+
+    def test_replay(self):
+        """
+        Replays Match Reference Log.
+        """
+        assert len(self.log.getvalue().splitlines()) == 1 + 6
+        assert replay.replay(self.log) is None
+        self.log.seek(0)
+        assert replay.replay(self.log, engine=True) is None
+
+        restored = replay.restore(replay.load(io.StringIO(self.log.getvalue()))[0])
+        assert restored.ticks == [(0, 1), (1, 3)]
+        assert restored.total == 0
+
+    def test_divergence(self):
+        """
+        First Divergent Tick and Region.
+        """
+        class Faulty:
+            """
+            Flips a cell of the master (the first plane applied to) on its 5th tick.
+            """
+            instrument = None
+
+            def __init__(self, rules):
+                self.rules = rules
+                self.master = None
+                self.ticks = 0
+
+            def apply_to(self, plane, *args):
+                self.rules.apply_to(plane)
+                if self.master is None:
+                    self.master = plane
+                if plane is self.master:
+                    self.ticks += 1
+                    if self.ticks == 5:
+                        plane[(22, 3)] = 1 - plane[(22, 3)]
+
+        divergence = replay.replay(self.log, Faulty(self.parser.engine))
+        assert divergence.tick == 6
+        assert divergence.bands == [4]
+        assert divergence.regions == [(20, 25)]
@@ -0,0 +1,128 @@
+import os, sys
+sys.path.insert(0, os.path.join('..', 'src'))
+
+import random
+
+import cam
+import engine
+import rewind
+import ruleset
+import display
+import cam_parser
+
+
+class TestRewind:
+    """
+
+    """
+    def setUp(self):
+        random.seed(0)
+        self.cam = cam.CAM(2, 64, 2)
+        self.cam.ticks.append((1, 4))
+        self.parser = cam_parser.CAMParser('B3/S23', self.cam)
+        self.cam.master.randomize()
+
+    def _run(self, history, count):
+        """
+        Tick and record, returning copies of the bits of every generation.
+        """
+        generations = {self.cam.total: [p.bits.copy() for p in self.cam.planes]}
+        for _ in range(count):
+            self.cam.tick(self.parser.engine)
+            history.record()
+            generations[self.cam.total] = [p.bits.copy() for p in self.cam.planes]
+        return generations
+
+    def test_rebuild(self):
+        """
+        Rebuild Any Generation.
+        """
+        history = rewind.Rewind(self.cam, keyframe=8)
+        generations = self._run(history, 30)
+        assert (history.first, history.last, len(history)) == (0, 30, 31)
+        for tick, bits in generations.items():
+            assert history.bits(tick) == bits
+
+        history.seek(13)
+        assert self.cam.total == 13
+        assert self.cam.master.bits == generations[13][0]
+        assert history.step_back() and self.cam.total == 12
+
+    def test_budget(self):
+        """
+        Oldest Segments Evicted.
+        """
+        history = rewind.Rewind(self.cam, budget=4096, keyframe=4)
+        generations = self._run(history, 40)
+        assert history.nbytes <= 4096
+        assert history.first > 0 and history.first % 4 == 0
+        assert history.last == 40
+        assert history.bits(history.first) == generations[history.first]
+        assert 0 not in history
+
+    def test_branch(self):
+        """
+        Ticking From The Past Discards The Future.
+        """
+        history = rewind.Rewind(self.cam, keyframe=8)
+        self._run(history, 20)
+        history.seek(10)
+        generations = self._run(history, 3)
+        assert history.last == 13
+        for tick, bits in generations.items():
+            assert history.bits(tick) == bits
+
+    def test_display(self):
+        """
+        Display Step Back and Seek.
+        """
+        view = display._Display(self.cam, 0, self.parser.engine)
+        for _ in range(5):
+            view.advance()
+        latest = self.cam.master.bits.copy()
+
+        assert view.step_back() and view.paused
+        assert self.cam.total == 4
+        view.seek(-10)
+        assert self.cam.total == 0
+        for _ in range(5):
+            view.advance()
+        assert self.cam.total == 5 and self.cam.master.bits == latest
+        assert view.history.last == 5
+
+    def test_ruleState(self):
+        """
+        Ticking On After Seeking Retraces The Run.
+        """
+        def second_order():
+            rules = ruleset.Ruleset(ruleset.Ruleset.Method.ALWAYS_PASS, second_order=True)
+            rules.configurations.append(self.parser.ruleset.configurations[0])
+            return rules
+
+        def margolus():
+            return ruleset.Ruleset(ruleset.Ruleset.Method.MARGOLUS, engine.BILLIARD_BALL)
+
+        for make in (margolus, second_order):
+            planes = []
+            for _ in range(2):
+                random.seed(1)
+                c = cam.CAM(1, 16, 2)
+                c.master.randomize()
+                planes.append(c)
+            untouched, recorded = planes
+            rules, reference = make(), make()
+
+            history = rewind.Rewind(recorded, keyframe=4, rules=rules)
+            for _ in range(9):
+                recorded.tick(rules)
+                history.record()
+            for tick in (6, 4):
+                history.seek(tick)
+                for _ in range(3):
+                    recorded.tick(rules)
+                    history.record()
+
+            for _ in range(7):
+                untouched.tick(reference)
+            assert recorded.total == 7
+            assert recorded.master.bits == untouched.master.bits
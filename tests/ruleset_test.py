@@ -1,10 +1,14 @@
 import os, sys
 sys.path.insert(0, os.path.join('..', 'src'))
 
+import random
 import plane
+import engine as e
 import ruleset as r
 import configuration as c
 
+from itertools import product
+
 class TestRuleset:
     """
 
@@ -37,6 +41,31 @@ class TestRuleset:
         assert tmp_p != self.plane2d.bits
         assert self.plane2d.bits.count() == 100 * 100
 
+    def test_secondOrderRuleset(self):
+        """
+
+        """
+        tmp_r = r.Ruleset(r.Ruleset.Method.ALWAYS_PASS, second_order=True)
+        tmp_r.configurations.append(self.config)
+        self.plane2d.randomize()
+        start = self.plane2d.bits.copy()
+
+        # Configurations set every cell, so each generation is the complement of the one before last
+        tmp_r.apply_to(self.plane2d)
+        assert self.plane2d.bits.count() == 100 * 100
+        tmp_r.apply_to(self.plane2d)
+        assert self.plane2d.bits == ~start & self.plane2d.mask()
+
+        tmp_r.reverse(self.plane2d)
+        tmp_r.apply_to(self.plane2d)
+        assert self.plane2d.bits == start
+
+        try:
+            r.Ruleset(r.Ruleset.Method.ALWAYS_PASS).reverse(self.plane2d)
+            assert False
+        except ValueError:
+            pass
+
     def test_matchRuleset(self):
         """
 
@@ -74,3 +103,56 @@ class TestRuleset:
         tmp_r.apply_to(self.plane2d, 0.5)
         assert self.plane2d.bits.count() == 4
 
+
+    def test_margolusRuleset(self):
+        """
+        Billiard Ball Partitions.
+        """
+        tmp_r = r.Ruleset(r.Ruleset.Method.MARGOLUS, e.BILLIARD_BALL)
+        self.plane2d[(10, 10)] = 1
+        tmp_r.apply_to(self.plane2d)
+        assert self.plane2d[(11, 11)] == 1
+        tmp_r.apply_to(self.plane2d)
+        assert self.plane2d[(12, 12)] == 1
+        assert self.plane2d.population == 1
+
+        # Head on collision leaves along the other diagonal
+        tmp_p = plane.Plane((4, 4))
+        tmp_p[[(0, 0), (1, 1)]] = 1
+        r.Ruleset(r.Ruleset.Method.MARGOLUS, e.BILLIARD_BALL).apply_to(tmp_p)
+        assert tmp_p[[(0, 1), (1, 0), (0, 0), (1, 1)]] == [1, 1, 0, 0]
+
+    def test_margolusTable(self):
+        """
+        Vectorized Block Lookup.
+        """
+        random.seed(0)
+        table = list(range(256))
+        random.shuffle(table)
+        tmp_p = plane.Plane((6, 4, 8))
+        tmp_p.randomize()
+        before = tmp_p.bits.copy()
+
+        blocks = e.Margolus(table)
+        blocks.apply_to(tmp_p)
+        for z, y, x in product(range(0, 6, 2), range(0, 4, 2), range(0, 8, 2)):
+            cells = list(product((z, z+1), (y, y+1), (x, x+1)))
+            index = sum(plane.Plane((6, 4, 8), before)[cell] << k for k, cell in enumerate(cells))
+            assert tmp_p[cells] == [(table[index] >> k) & 1 for k in range(8)]
+
+        # The inverse table undoes the same partition
+        assert blocks.phase(tmp_p) == 1
+        blocks.reset(tmp_p)
+        e.Margolus([table.index(i) for i in range(256)]).apply_to(tmp_p)
+        assert tmp_p.bits == before
+
+    def test_margolusInvalid(self):
+        """
+        Invalid Margolus Rulesets.
+        """
+        for table, shape in [(None, (4, 4)), (e.CRITTERS, (4, 4, 4)), (e.CRITTERS, (5, 4))]:
+            try:
+                r.Ruleset(r.Ruleset.Method.MARGOLUS, table).apply_to(plane.Plane(shape))
+                assert False
+            except ValueError:
+                pass
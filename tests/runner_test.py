@@ -0,0 +1,73 @@
+import os, sys
+sys.path.insert(0, os.path.join('..', 'src'))
+
+import json
+import tempfile
+import numpy as np
+
+import delta
+import runner
+
+
+class TestRunner:
+    """
+
+    """
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.glider = os.path.join(self.root, 'glider.rle')
+        with open(self.glider, 'w') as f:
+            f.write('#N Glider\nx = 3, y = 3, rule = B3/S23\nbo$2bo$3o!\n')
+
+    def test_readPattern(self):
+        """
+        Pattern Files.
+        """
+        expected = np.array([[0, 1, 0], [0, 0, 1], [1, 1, 1]])
+        assert np.array_equal(runner.read_pattern(self.glider), expected)
+
+        path = os.path.join(self.root, 'glider.cells')
+        with open(path, 'w') as f:
+            f.write('!Name: Glider\n.O\n..O\nOOO\n')
+        assert np.array_equal(runner.read_pattern(path), expected)
+
+    def test_run(self):
+        """
+        Single Jobs.
+        """
+        checkpoint = os.path.join(self.root, 'final.npy')
+        deltas = os.path.join(self.root, 'deltas.bin')
+        stats = os.path.join(self.root, 'stats.json')
+        record = runner.run('B3/S23', (16, 16), 8, pattern=self.glider, checkpoint=checkpoint,
+                            deltas=deltas, stats=stats)
+        assert record['population'] == 5
+        assert record['ticks_per_second'] > 0
+        with open(stats) as f:
+            assert json.load(f)['steps'] == 8
+
+        # Every tick is streamed, and the glider arrives two cells on
+        cells = runner._place(runner.read_pattern(self.glider), (16, 16))
+        with open(deltas, 'rb') as f:
+            changes = list(delta.load(f))
+        assert [c.tick for c in changes] == list(range(1, 9))
+        assert np.array_equal(np.load(checkpoint), np.roll(cells, (2, 2), axis=(0, 1)))
+
+        # Both engines agree
+        reference = runner.run('B3/S23', (16, 16), 4, seed=3, engine='ruleset')
+        assert reference['population'] == runner.run('B3/S23', (16, 16), 4, seed=3)['population']
+
+    def test_batch(self):
+        """
+        Manifests.
+        """
+        path = os.path.join(self.root, 'jobs.jsonl')
+        with open(path, 'w') as f:
+            f.write(json.dumps({'rule': 'B3/S23', 'shape': [16, 16], 'steps': 4, 'pattern': 'glider.rle'}) + '\n')
+            f.write(json.dumps({'rule': 'W30', 'shape': [64], 'steps': 4, 'stats': 'w30.json'}) + '\n')
+        jobs = runner.manifest(path)
+        assert jobs[0]['pattern'] == self.glider
+
+        records = dict(runner.batch(jobs, workers=2))
+        assert records[0]['population'] == 5
+        assert records[1]['rule'] == 'W30'
+        assert os.path.exists(os.path.join(self.root, 'w30.json'))
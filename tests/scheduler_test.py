@@ -0,0 +1,76 @@
+import os, sys
+sys.path.insert(0, os.path.join('..', 'src'))
+
+import cam
+import display
+import scheduler
+import cam_parser
+
+
+class TestScheduler:
+    """
+
+    """
+    def setUp(self):
+        self.now = 0.0
+        self.schedule = scheduler.Scheduler(10, catchup=4, clock=lambda: self.now, sleep=self._sleep)
+
+    def _sleep(self, seconds):
+        self.now += seconds
+
+    def test_deadlines(self):
+        """
+        Deadlines Do Not Drift.
+        """
+        ticks = 0
+        for _ in range(20):
+            ticks += self.schedule.wait()
+            self.now += 0.03
+        assert ticks == 20
+        assert abs(self.now - (1.9 + 0.03)) < 1e-9
+        assert self.schedule.report()['frames'] == 20
+
+    def test_catchup(self):
+        """
+        Frames Skipped When Behind.
+        """
+        assert self.schedule.wait() == 1
+        self.now += 0.25
+        assert self.schedule.wait() == 2
+        assert self.schedule.report()['skipped'] == 1
+
+        # Beyond the catchup, the backlog is dropped rather than run later
+        self.now += 1.0
+        assert self.schedule.wait() == 4
+        assert self.schedule.report()['dropped'] == 6
+        assert self.schedule.due() == 0
+        assert self.schedule.wait() == 1
+
+        report = self.schedule.report()
+        assert report['target'] == 10
+        assert report['ticks'] == 8
+
+    def test_unthrottled(self):
+        """
+        No Rate Ticks Freely.
+        """
+        schedule = scheduler.Scheduler.from_clock(0, sleep=self._sleep)
+        assert [schedule.wait() for _ in range(3)] == [1, 1, 1]
+        assert scheduler.Scheduler.from_clock(400).rate == 2.5
+
+    def test_shared(self):
+        """
+        Displays and Headless Runs Scheduled.
+        """
+        c = cam.CAM(1, 16, 2)
+        p = cam_parser.CAMParser('B3/S23', c)
+        c.master[(5, 5)] = 1
+        report = c.start(cam.CAM.Show.NONE, rules=p.ruleset, extinction=True)
+        assert c.total == 1 and report['ticks'] == 1
+
+        for coordinates in [(1, 2), (2, 3), (3, 1), (3, 2), (3, 3)]:
+            c.master[coordinates] = 1
+        view = display._Display(c, 0, p.engine)
+        assert view.frame() == 1 and c.total == 2
+        view.paused = True
+        assert view.frame() == 0 and c.total == 2
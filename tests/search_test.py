@@ -0,0 +1,75 @@
+import os, sys
+sys.path.insert(0, os.path.join('..', 'src'))
+
+import json
+import tempfile
+
+import plane
+import engine
+import search
+
+
+class TestSearch:
+    """
+
+    """
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), 'results.jsonl')
+        self.search = search.Search(shape=(16, 16), soups=2, generations=60)
+
+    def test_notation(self):
+        """
+        Rule Indices.
+        """
+        assert search.notation(0) == 'B/S'
+        assert search.notation(search.index('B3/S23')) == 'B3/S23'
+        assert search.index('B012345678/S012345678') == search.RULES - 1
+
+    def test_outcome(self):
+        """
+        Soup Fates.
+        """
+        life = engine.Totalistic([3], [2, 3])
+        p = plane.Plane((8, 8))
+        p[[(1, 1), (1, 2), (1, 3)]] = 1
+        result = search.outcome(life, p, 10)
+        assert result['behavior'] == 'OSCILLATES'
+        assert result['period'] == 2
+
+        p[[(4, 4), (4, 5), (5, 4), (5, 5)]] = 1
+        p[1] = 0
+        assert search.outcome(life, p, 10)['behavior'] == 'STABILIZES'
+
+        p[(6, 6)] = 1
+        p[4] = 0
+        p[5] = 0
+        result = search.outcome(life, p, 10)
+        assert result['behavior'] == 'DIES'
+        assert result['tick'] == 1
+
+    def test_survey(self):
+        """
+        Rule Surveys.
+        """
+        record = search.survey(search.index('B1/S012345678'), shape=(16, 16), soups=2, density=0.05)
+        assert record['behavior'] == 'EXPLODES'
+        assert len(record['outcomes']) == 2
+        assert search.survey(0, shape=(16, 16), soups=2) == search.survey(0, shape=(16, 16), soups=2)
+
+    def test_resume(self):
+        """
+        Resumable Results.
+        """
+        assert self.search.run(self.path, range(4), workers=2) == 4
+        with open(self.path, 'a') as f:
+            f.write('{"index": 9, "ru')
+
+        assert self.search.run(self.path, range(6), workers=2) == 2
+        records = search.Search.load(self.path)
+        assert sorted(records) == list(range(6))
+        assert records[0]['behavior'] == 'DIES'
+
+        with open(self.path) as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 7
+        assert json.loads(lines[-1])['index'] in (4, 5)